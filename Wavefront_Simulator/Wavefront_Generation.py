@@ -5,11 +5,20 @@ Notable functions are:
 """
 
 from decimal import *
-from collections import deque
+from collections import deque, OrderedDict
 import numpy as np
 import math
 import copy
+import heapq
+import bisect
+import itertools
 import warnings
+import os
+import hashlib
+import json
+import shutil
+import tempfile
+import time
 from Wavefront_Storage import *
 from Wavefront_Misc import *
 
@@ -20,45 +29,19 @@ def Generate_Wavefronts_Commutatively(Data_Input : Data_Input_Storage):
     
     :param Data_Input: Input data object containing simulation input variables
     :type Data_Input: Data_Input_Storage
-    :return: output data (a collection commutative fanouts in form of np.ndarrays)
+    :return: output data (a collection commutative fanouts in form of Triangular_Arrays)
     :rtype: Data_Output_Storage
     
     Resposible for generating wavefronts and simultaneously commutatively merging the wavefronts. 
     The simaltaneous commutative merging of wavefronts is mandatory for longer simulation times.
     """
-    # The algorithm to follow makes use of SPARSE storage arrays,
-    # this is done as to store both capacitve and inductive wavefronts in a single array
-    # (there will be two spares arrays, one for AWAY wavefronts and one for RETURNING wavefronts).
-
-    # SPARSE FANOUT STORAGE ARRAY FORMAT FOR 5 LAYERS:
-    # (horizontal = inductive axis, vertical = capacitive axis)
-    # x = major gird node, → = wavefront inductive, ↓ = wavefront capacitve, 0 = 'blank entry'
-    #   0 1 2 3 4 5 6 7 8 9
-    #   ____________________
-    #0 |x → x → x → x → x →
-    #1 |↓ 0 ↓ 0 ↓ 0 ↓ 0 ↓ 
-    #2 |x → x → x → x →
-    #3 |↓ 0 ↓ 0 ↓ 0 ↓ 
-    #4 |x → x → x → 
-    #5 |↓ 0 ↓ 0 ↓
-    #6 |x → x →
-    #7 |↓ 0 ↓
-    #8 |x →
-    #9 |↓
-    
-    # The two Sparse storage arrays:
-    # ------------------------------
-    Wavefronts_Away = np.full((2*(Data_Input.Number_of_Layers+1),2*(Data_Input.Number_of_Layers+1)),Wavefront_Source(Data_Input,0,0))
-    Wavefronts_Return = np.full((2*(Data_Input.Number_of_Layers+1),2*(Data_Input.Number_of_Layers+1)),Wavefront_Source(Data_Input,0,0))
-    
-    
-    # These Sparse arrays are then post-porcessed in a 'gemoetric" way to extract magnitude data in a dense format.
-    # Dense format arrays will store data as a function of major nodes, and will have no 'blank entries'.
-    # An example of a Dense array would be "Wavefronts sent from the Inductor" (Wavefronts_Sending_Inductor):
-    
-    # DENSE FANOUT STORAGE ARRAY FORMAT FOR 5 LAYERS:
+    # Wavefronts are stored as they are processed in fanout arrays, 
+    # fanout arrays store data as a function of major grid nodes.
+    # An example would be "Wavefronts sent from the Inductor" (Wavefronts_Sending_Inductor):
+    
+    # FANOUT STORAGE ARRAY FORMAT FOR 5 LAYERS:
     # (horizontal = inductive axis, vertical = capacitive axis)
-    # x = major gird node, → = wavefront inductive, ↓ = wavefront capacitve, 0 = 'blank entry'
+    # → = wavefront inductive sent from a major grid node
     #   0 1 2 3 4 
     #   __________
     #0 |→ → → → →
@@ -66,25 +49,31 @@ def Generate_Wavefronts_Commutatively(Data_Input : Data_Input_Storage):
     #2 |→ → → 
     #3 |→ → 
     #4 |→ 
+    
+    # Only the triangle of major grid nodes is stored (see Triangular_Array).
+    # Returning wavefronts are stored at the major grid node of their AWAY wavefront parents.
 
-    # Dense format arrays tracked:
-    # ----------------------------
-    Time = np.full(((Data_Input.Number_of_Layers+1),(Data_Input.Number_of_Layers+1)),Decimal('0'))
+    # Fanout arrays tracked:
+    # ----------------------
+    Time = get_time_fanout(Data_Input)
     
-    Voltage_Interconnect_Inductor = np.full(((Data_Input.Number_of_Layers+1),(Data_Input.Number_of_Layers+1)),Decimal('0'))
-    Current_Interconnect_Inductor = np.full(((Data_Input.Number_of_Layers+1),(Data_Input.Number_of_Layers+1)),Decimal('0'))
+    Voltage_Interconnect_Inductor = Triangular_Array(Data_Input.Number_of_Layers,Decimal('0'))
+    Current_Interconnect_Inductor = Triangular_Array(Data_Input.Number_of_Layers,Decimal('0'))
 
-    Voltage_Interconnect_Capacitor = np.full(((Data_Input.Number_of_Layers+1),(Data_Input.Number_of_Layers+1)),Decimal('0'))
-    Current_Interconnect_Capacitor = np.full(((Data_Input.Number_of_Layers+1),(Data_Input.Number_of_Layers+1)),Decimal('0'))
+    Voltage_Interconnect_Capacitor = Triangular_Array(Data_Input.Number_of_Layers,Decimal('0'))
+    Current_Interconnect_Capacitor = Triangular_Array(Data_Input.Number_of_Layers,Decimal('0'))
     
-    Wavefronts_Sending_Inductor = np.full(((Data_Input.Number_of_Layers+1),(Data_Input.Number_of_Layers+1)), Wavefront())
-    Wavefronts_Sending_Capacitor = np.full(((Data_Input.Number_of_Layers+1),(Data_Input.Number_of_Layers+1)), Wavefront())
+    Wavefronts_Sending_Inductor = Triangular_Array(Data_Input.Number_of_Layers, Wavefront(),dtype=object)
+    Wavefronts_Sending_Capacitor = Triangular_Array(Data_Input.Number_of_Layers, Wavefront(),dtype=object)
     
-    Wavefronts_Returning_Inductor = np.full(((Data_Input.Number_of_Layers+1),(Data_Input.Number_of_Layers+1)), Wavefront())
-    Wavefronts_Returning_Capacitor = np.full(((Data_Input.Number_of_Layers+1),(Data_Input.Number_of_Layers+1)), Wavefront())
+    # returning wavefronts of the last layer are not generated, they are left as a blank source wavefront.
+    Wavefronts_Returning_Inductor = Triangular_Array(Data_Input.Number_of_Layers, Wavefront(),dtype=object)
+    Wavefronts_Returning_Capacitor = Triangular_Array(Data_Input.Number_of_Layers, Wavefront(),dtype=object)
+    Wavefronts_Returning_Inductor.get_layer(Data_Input.Number_of_Layers-1)[:] = Wavefront_Source(Data_Input,0,0)
+    Wavefronts_Returning_Capacitor.get_layer(Data_Input.Number_of_Layers-1)[:] = Wavefront_Source(Data_Input,0,0)
     
-    # POPULATE THE SPARSE STORAGE ARRAYS
-    # ===================================
+    # POPULATE THE FANOUT STORAGE ARRAYS
+    # ==================================
     #Deques of wavefronts thare are used to temporarily store wavefronts as they are being processed.
     Wavefronts_Away_deque : Wavefront = deque()
     Wavefronts_Returning_deque : Wavefront = deque()
@@ -97,22 +86,23 @@ def Generate_Wavefronts_Commutatively(Data_Input : Data_Input_Storage):
     # Get Intial Sending wavefront, this will be an inductive wavefront
     temp_wavefront_inductive = Wavefronts_Away_deque.popleft()
     temp_wavefront_inductive.generate_and_store(Wavefronts_Returning_deque)
-    Wavefronts_Away[1,0] = temp_wavefront_inductive
+    Wavefronts_Sending_Inductor[0,0] = temp_wavefront_inductive
     
     # Get Next Initial Sending wavefront, this will be a capacitive wavefront
     temp_wavefront_capacitive = Wavefronts_Away_deque.popleft()
     temp_wavefront_capacitive.generate_and_store(Wavefronts_Returning_deque)
-    Wavefronts_Away[0,1] = temp_wavefront_capacitive
+    Wavefronts_Sending_Capacitor[0,0] = temp_wavefront_capacitive
 
     # GENERATE WAVEFRONTS AND MERGE COMMUTATIVELY
     for layer_number in range(1,Data_Input.Number_of_Layers):
 
         # RETURNING WAVEFRONTS
         # --------------------
+        # (returning wavefronts are from the nodes of the previous layer)
         
-        # set Index    
-        Wavefront_Index_x = 2*layer_number-1
-        Wavefront_Index_y = 0
+        # set Index of the parent node
+        Wavefront_Index_L = layer_number-1
+        Wavefront_Index_C = 0
         
         # process first Returning Wavefront:
 
@@ -123,16 +113,13 @@ def Generate_Wavefronts_Commutatively(Data_Input : Data_Input_Storage):
         # generate away wavefronts,  
         temp_wavefront.generate_and_store(Wavefronts_Away_deque)
         # store returning wavefront, 
-        Wavefronts_Return[Wavefront_Index_x,Wavefront_Index_y] = temp_wavefront
-        # shift index
-        Wavefront_Index_x = Wavefront_Index_x - 1
-        Wavefront_Index_y = Wavefront_Index_y + 1
+        Wavefronts_Returning_Inductor[Wavefront_Index_L,Wavefront_Index_C] = temp_wavefront
         
         # process remaining Returning Wavefronts:
 
         while len(Wavefronts_Returning_deque) > 0:
             # Get a Returning wavefront 
-            # (will be capacitve)
+            # (will be capacitve, from the same node)
             temp_wavefront = Wavefronts_Returning_deque.popleft()
             
             if len(Wavefronts_Returning_deque) == 0 : # It is the last wave?
@@ -140,17 +127,14 @@ def Generate_Wavefronts_Commutatively(Data_Input : Data_Input_Storage):
                 # generate away wavefronts and store in Away wavefronts deque
                 temp_wavefront.generate_and_store(Wavefronts_Away_deque)
                 # store returning wavefronts
-                Wavefronts_Return[Wavefront_Index_x,Wavefront_Index_y] = temp_wavefront
-                # shift index
-                Wavefront_Index_x = Wavefront_Index_x - 1
-                Wavefront_Index_y = Wavefront_Index_y + 1
+                Wavefronts_Returning_Capacitor[Wavefront_Index_L,Wavefront_Index_C] = temp_wavefront
 
             else: # It is not the last wave :
                 
                 # merge children of 'adjacent' returning wavefronts:
 
                 # get next returning wavefront 
-                # (will be inductive)
+                # (will be inductive, from the next node)
                 temp_next_wavefront = Wavefronts_Returning_deque.popleft()
 
                 # get children of the two current wavefronts
@@ -167,23 +151,20 @@ def Generate_Wavefronts_Commutatively(Data_Input : Data_Input_Storage):
                 
                 # Store current returning wavefronts in their completion storage array
                 # capacitive returning wavefront
-                Wavefronts_Return[Wavefront_Index_x,Wavefront_Index_y] = temp_wavefront
-                # Shift index
-                Wavefront_Index_x = Wavefront_Index_x - 1
-                Wavefront_Index_y = Wavefront_Index_y + 1
+                Wavefronts_Returning_Capacitor[Wavefront_Index_L,Wavefront_Index_C] = temp_wavefront
+                # Shift index to next node
+                Wavefront_Index_L = Wavefront_Index_L - 1
+                Wavefront_Index_C = Wavefront_Index_C + 1
                 
                 # inductive returning wavefront
-                Wavefronts_Return[Wavefront_Index_x,Wavefront_Index_y] = temp_next_wavefront
-                # shift index
-                Wavefront_Index_x = Wavefront_Index_x - 1
-                Wavefront_Index_y = Wavefront_Index_y + 1
+                Wavefronts_Returning_Inductor[Wavefront_Index_L,Wavefront_Index_C] = temp_next_wavefront
         
         # AWAY WAVEFRONTS
         # ================
-        # Set Index for Away wavefronts in Sparse array
-        # (will be one ahead of returning) 
-        Wavefront_Index_x = 2*(layer_number+1)-1
-        Wavefront_Index_y = 0
+        # Set Index for Away wavefronts
+        # (will be the nodes of this layer) 
+        Wavefront_Index_L = layer_number
+        Wavefront_Index_C = 0
         
         while len(Wavefronts_Away_deque)> 0:
             # get an away wavefront in the away wavefront deque
@@ -192,109 +173,87 @@ def Generate_Wavefronts_Commutatively(Data_Input : Data_Input_Storage):
             # Generate and store its returning children
             temp_wavefront_inductive.generate_and_store(Wavefronts_Returning_deque)
             # store processed away wavefront
-            Wavefronts_Away[Wavefront_Index_x, Wavefront_Index_y] = temp_wavefront_inductive
-            # shift index
-            Wavefront_Index_x = Wavefront_Index_x - 1
-            Wavefront_Index_y = Wavefront_Index_y + 1
+            Wavefronts_Sending_Inductor[Wavefront_Index_L, Wavefront_Index_C] = temp_wavefront_inductive
             
             # Get the next Away wavefront 
-            # (will be capacitive)
+            # (will be capacitive, from the same node)
             temp_wavefront_capacitve = Wavefronts_Away_deque.popleft()
             # Generate and store its returning children
             temp_wavefront_capacitve.generate_and_store(Wavefronts_Returning_deque)
             # store processed away wavefront
-            Wavefronts_Away[Wavefront_Index_x, Wavefront_Index_y] = temp_wavefront_capacitve
-            # shift index
-            Wavefront_Index_x = Wavefront_Index_x - 1
-            Wavefront_Index_y = Wavefront_Index_y + 1
+            Wavefronts_Sending_Capacitor[Wavefront_Index_L, Wavefront_Index_C] = temp_wavefront_capacitve
+            
+            # shift index to next node
+            Wavefront_Index_L = Wavefront_Index_L - 1
+            Wavefront_Index_C = Wavefront_Index_C + 1
 
-    # POST PORCESSING OF SPARSE ARRAY
-    # ===============================
+    # POST PORCESSING OF FANOUT ARRAYS
+    # ================================
     
     for layer_number in range(0,Data_Input.Number_of_Layers):
         # Get major grid node coords for first node in layer
-        Sparse_Major_Node_Index_x = 2*layer_number
-        Sparse_Major_Node_Index_y = 0
-        
-        Dense_Major_Node_Index_x = layer_number
-        Dense_Major_Node_Index_y = 0
+        Major_Node_Index_L = layer_number
+        Major_Node_Index_C = 0
         
         for node_number in range(0,layer_number+1):
-            # Get indexes of surrounding wavefronts
-            # -------------------------------------
-            # AWAY FROM major grid node inductive wavefront index:
-            Away_Index_Inductor_x = Sparse_Major_Node_Index_x + 1
-            Away_Index_Inductor_y = Sparse_Major_Node_Index_y
-            wavefront_sending_inductor = Wavefronts_Away[Away_Index_Inductor_x,Away_Index_Inductor_y]
-            # RETURNING TO major grid node inductive wavefront index:
-            Return_Index_Inductor_x = Sparse_Major_Node_Index_x - 1
-            Return_Index_Inductor_y = Sparse_Major_Node_Index_y
-            wavefront_returning_inductor = Wavefronts_Return[Return_Index_Inductor_x,Return_Index_Inductor_y]
-            
-            # AWAY FROM major grid node capacitive wavefront index:
-            Away_Index_Capacitor_x = Sparse_Major_Node_Index_x 
-            Away_Index_Capacitor_y = Sparse_Major_Node_Index_y + 1
-            wavefront_sending_capacitor = Wavefronts_Away[Away_Index_Capacitor_x,Away_Index_Capacitor_y]
-            # RETURNING TO major grid node capacitive wavefront index:
-            Return_Index_Capacitor_x = Sparse_Major_Node_Index_x 
-            Return_Index_Capacitor_y = Sparse_Major_Node_Index_y - 1
-            wavefront_returning_capacitor = Wavefronts_Return[Return_Index_Capacitor_x,Return_Index_Capacitor_y]
-            
-            # store AWAY wavefronts in major node position ("away from")
-            Time[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_inductor.time_start
-            Wavefronts_Sending_Inductor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_inductor
-            Wavefronts_Sending_Capacitor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_capacitor
-            # store RETURNING wavefronts in major node position (also "away from")
-            # (returning wavefronts are stored in assoicated to the their AWAY wavefront parents major grid node)
-            # (this is not the same as the RETURNING TO format used to calculate interconncet changes)
-            Wavefronts_Returning_Inductor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = Wavefronts_Return[Away_Index_Inductor_x,Away_Index_Inductor_y]
-            Wavefronts_Returning_Capacitor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = Wavefronts_Return[Away_Index_Capacitor_x,Away_Index_Capacitor_y]
+            # Get surrounding wavefronts
+            # --------------------------
+            # AWAY FROM major grid node wavefronts:
+            wavefront_sending_inductor = Wavefronts_Sending_Inductor[Major_Node_Index_L,Major_Node_Index_C]
+            wavefront_sending_capacitor = Wavefronts_Sending_Capacitor[Major_Node_Index_L,Major_Node_Index_C]
 
             if(node_number == 0 and layer_number ==0): 
                     # origin node
                     # inductor interconncet magnitude for origin node has only a sent wavefront to consider
-                    Voltage_Interconnect_Inductor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_inductor.magnitude_voltage 
-                    Current_Interconnect_Inductor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_inductor.magnitude_current
+                    Voltage_Interconnect_Inductor[Major_Node_Index_L,Major_Node_Index_C] = wavefront_sending_inductor.magnitude_voltage 
+                    Current_Interconnect_Inductor[Major_Node_Index_L,Major_Node_Index_C] = wavefront_sending_inductor.magnitude_current
                     
                     # capacitor interconncet magnitude for origin node has only a sent wavefront to consider
-                    Voltage_Interconnect_Capacitor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_capacitor.magnitude_voltage 
-                    Current_Interconnect_Capacitor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_capacitor.magnitude_current
+                    Voltage_Interconnect_Capacitor[Major_Node_Index_L,Major_Node_Index_C] = wavefront_sending_capacitor.magnitude_voltage 
+                    Current_Interconnect_Capacitor[Major_Node_Index_L,Major_Node_Index_C] = wavefront_sending_capacitor.magnitude_current
 
             elif(node_number == 0 ): 
                     # first node is an INDUCTIVE UNIQUE NODE
+                    # RETURNING TO major grid node inductive wavefront, (from the parent node before it on the L-axis):
+                    wavefront_returning_inductor = Wavefronts_Returning_Inductor[Major_Node_Index_L-1,Major_Node_Index_C]
+                    
                     # inductor interconnect magnitudes of inductive unique nodes are affected by both returning and arriving inductive wavefronts
-                    Voltage_Interconnect_Inductor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = (wavefront_sending_inductor.magnitude_voltage  + wavefront_returning_inductor.magnitude_voltage) 
-                    Current_Interconnect_Inductor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = (wavefront_sending_inductor.magnitude_current + wavefront_returning_inductor.magnitude_current ) 
+                    Voltage_Interconnect_Inductor[Major_Node_Index_L,Major_Node_Index_C] = (wavefront_sending_inductor.magnitude_voltage  + wavefront_returning_inductor.magnitude_voltage) 
+                    Current_Interconnect_Inductor[Major_Node_Index_L,Major_Node_Index_C] = (wavefront_sending_inductor.magnitude_current + wavefront_returning_inductor.magnitude_current ) 
                     
                     # capacitor interconnect magnitudes of inductive unique nodes are only affected by wavefronts sent into the capaitor
-                    Voltage_Interconnect_Capacitor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_capacitor.magnitude_voltage 
-                    Current_Interconnect_Capacitor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_capacitor.magnitude_current
+                    Voltage_Interconnect_Capacitor[Major_Node_Index_L,Major_Node_Index_C] = wavefront_sending_capacitor.magnitude_voltage 
+                    Current_Interconnect_Capacitor[Major_Node_Index_L,Major_Node_Index_C] = wavefront_sending_capacitor.magnitude_current
 
             elif(node_number == layer_number): 
                     # last node is a CAPACITVE UNIQUE NODE
+                    # RETURNING TO major grid node capacitive wavefront, (from the parent node before it on the C-axis):
+                    wavefront_returning_capacitor = Wavefronts_Returning_Capacitor[Major_Node_Index_L,Major_Node_Index_C-1]
+                    
                     # inductor interconnect magnitudes of capacitive unique nodes are only affected by wavefronts sent into the inductor
-                    Voltage_Interconnect_Inductor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_inductor.magnitude_voltage  
-                    Current_Interconnect_Inductor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = wavefront_sending_inductor.magnitude_current
+                    Voltage_Interconnect_Inductor[Major_Node_Index_L,Major_Node_Index_C] = wavefront_sending_inductor.magnitude_voltage  
+                    Current_Interconnect_Inductor[Major_Node_Index_L,Major_Node_Index_C] = wavefront_sending_inductor.magnitude_current
                     
                     # capacitor interconnect magnitudes of capcitive unique nodes are affected by both returning and arriving capacitor wavefronts
-                    Voltage_Interconnect_Capacitor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = (wavefront_sending_capacitor.magnitude_voltage  + wavefront_returning_capacitor.magnitude_voltage) 
-                    Current_Interconnect_Capacitor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = (wavefront_sending_capacitor.magnitude_current + wavefront_returning_capacitor.magnitude_current )
+                    Voltage_Interconnect_Capacitor[Major_Node_Index_L,Major_Node_Index_C] = (wavefront_sending_capacitor.magnitude_voltage  + wavefront_returning_capacitor.magnitude_voltage) 
+                    Current_Interconnect_Capacitor[Major_Node_Index_L,Major_Node_Index_C] = (wavefront_sending_capacitor.magnitude_current + wavefront_returning_capacitor.magnitude_current )
             else:
                     # general node
+                    # RETURNING TO major grid node wavefronts:
+                    wavefront_returning_inductor = Wavefronts_Returning_Inductor[Major_Node_Index_L-1,Major_Node_Index_C]
+                    wavefront_returning_capacitor = Wavefronts_Returning_Capacitor[Major_Node_Index_L,Major_Node_Index_C-1]
+                    
                     # interconnect values of the inductor for general nodes are a sum of both sending and returning wavefronts
-                    Voltage_Interconnect_Inductor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = (wavefront_sending_inductor.magnitude_voltage  + wavefront_returning_inductor.magnitude_voltage) 
-                    Current_Interconnect_Inductor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = (wavefront_sending_inductor.magnitude_current + wavefront_returning_inductor.magnitude_current ) 
+                    Voltage_Interconnect_Inductor[Major_Node_Index_L,Major_Node_Index_C] = (wavefront_sending_inductor.magnitude_voltage  + wavefront_returning_inductor.magnitude_voltage) 
+                    Current_Interconnect_Inductor[Major_Node_Index_L,Major_Node_Index_C] = (wavefront_sending_inductor.magnitude_current + wavefront_returning_inductor.magnitude_current ) 
                     
                     # interconnect values of the capacitor for general nodes are a sum of both sending and returning wavefronts
-                    Voltage_Interconnect_Capacitor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = (wavefront_sending_capacitor.magnitude_voltage  + wavefront_returning_capacitor.magnitude_voltage)
-                    Current_Interconnect_Capacitor[Dense_Major_Node_Index_x,Dense_Major_Node_Index_y] = (wavefront_sending_capacitor.magnitude_current + wavefront_returning_capacitor.magnitude_current )
-            
-            # update index and go to next layer     
-            Sparse_Major_Node_Index_x -= 2
-            Sparse_Major_Node_Index_y += 2
+                    Voltage_Interconnect_Capacitor[Major_Node_Index_L,Major_Node_Index_C] = (wavefront_sending_capacitor.magnitude_voltage  + wavefront_returning_capacitor.magnitude_voltage)
+                    Current_Interconnect_Capacitor[Major_Node_Index_L,Major_Node_Index_C] = (wavefront_sending_capacitor.magnitude_current + wavefront_returning_capacitor.magnitude_current )
             
-            Dense_Major_Node_Index_x -= 1
-            Dense_Major_Node_Index_y += 1
+            # update index and go to next node     
+            Major_Node_Index_L -= 1
+            Major_Node_Index_C += 1
     
     return Data_Output_Storage(
         Time, # Merge Times
@@ -309,6 +268,564 @@ def Generate_Wavefronts_Commutatively(Data_Input : Data_Input_Storage):
         False, # indicated that multiplicative merging has not occured
         )
 
+#: The formats of time arrays produced by :py:func:`get_time_array`
+time_array_formats = ['decimal','float','units']
+
+def get_time_array(Data_Input : Data_Input_Storage, L_index : np.ndarray, C_index : np.ndarray, time_format : str = 'decimal'):
+    """Calculates the times of grid nodes directly from their co-ordinates, the node [L,C] occurs at L x (2 x Inductor_Time) + C x (2 x Capacitor_Time).
+    The co-ordinate arrays are broadcast against each other, so an outer-sum over a whole fanout is made by providing a column of L and a row of C indexes.
+
+    :param Data_Input: input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param L_index: the L co-ordinates of the nodes
+    :type L_index: np.ndarray[int]
+    :param C_index: the C co-ordinates of the nodes
+    :type C_index: np.ndarray[int]
+    :param time_format: 'decimal' for Decimal times, 'float' for float64 times 
+        or 'units' for integer multiples of the GCD of the time delays (L x KC + C x KL), defaults to 'decimal'
+    :type time_format: str, optional
+    :raises ValueError: if the time format is not one of the available options
+    :return: the times of the nodes
+    :rtype: np.ndarray[Decimal], np.ndarray[float] or np.ndarray[int]
+    """
+    L_index = np.asarray(L_index)
+    C_index = np.asarray(C_index)
+    
+    if(time_format == 'decimal'):
+        return L_index.astype(object) * (Data_Input.Inductor_Time*2) + C_index.astype(object) * (Data_Input.Capacitor_Time*2)
+    elif(time_format == 'float'):
+        return L_index * float(Data_Input.Inductor_Time*2) + C_index * float(Data_Input.Capacitor_Time*2)
+    elif(time_format == 'units'):
+        return L_index * Data_Input.Capacitor_LCM_Factor + C_index * Data_Input.Inductor_LCM_Factor
+    else:
+        raise ValueError(f"Time format '{time_format}' is not an option, options are: {time_array_formats}")
+
+def get_time_fanout(Data_Input : Data_Input_Storage, time_format : str = 'decimal'):
+    """Creates the commutative time fanout of a simulation without generating wavefronts, see :py:func:`get_time_array`.
+
+    :param Data_Input: input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param time_format: 'decimal', 'float' or 'units', defaults to 'decimal'
+    :type time_format: str, optional
+    :return: the times of the simulated grid nodes
+    :rtype: Triangular_Array
+    """
+    fill_values = {'decimal' : Decimal('0'), 'float' : 0.0, 'units' : 0}
+    
+    Time = Triangular_Array(Data_Input.Number_of_Layers,fill_values.get(time_format,0))
+    L_index, C_index = Time.get_grid_indexes()
+    Time.data = get_time_array(Data_Input,L_index,C_index,time_format)
+    
+    return Time
+
+def get_time_merged(Data_Input : Data_Input_Storage, shape : tuple, time_format : str = 'decimal'):
+    """Creates a dense time fanout of the provided shape as an outer-sum of the L and C axes, see :py:func:`get_time_array`.
+    Used for the time of multiplicatively merged fanouts.
+
+    :param Data_Input: input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param shape: the (L,C) shape of the fanout
+    :type shape: tuple
+    :param time_format: 'decimal', 'float' or 'units', defaults to 'decimal'
+    :type time_format: str, optional
+    :return: the times of the grid nodes
+    :rtype: np.ndarray
+    """
+    return get_time_array(Data_Input,np.arange(shape[0]).reshape(-1,1),np.arange(shape[1]).reshape(1,-1),time_format)
+
+def get_event_matrices(Data_Input : Data_Input_Storage):
+    """Gets the events of an interface as linear maps. Each event is a 2x2 matrix that maps
+    the (voltage, current) of an arriving wavefront to the (voltage, current) of the wavefront it produces.
+    The matrices are found by probing the event solvers of the Data_Input_Storage object with unit wavefronts,
+    this means customised solvers are also captured (as long as they remain linear).
+
+    :param Data_Input: Input data object containing simulation input variables
+    :type Data_Input: Data_Input_Storage
+    :return: dictionary of 2x2 np.ndarray[Decimal] event matrices, and the (voltage, current) np.ndarray[Decimal] vectors of the source excitation.
+    :rtype: Dict
+    """
+    def probe_solver(solver):
+        # columns are the responses to a unit voltage and a unit current
+        voltage_response = solver(Decimal('1'),Decimal('0'))
+        current_response = solver(Decimal('0'),Decimal('1'))
+
+        return np.array([[voltage_response[0], current_response[0]],
+                         [voltage_response[1], current_response[1]]],dtype=object)
+
+    return dict([
+        ('inductor_self_reflection',probe_solver(Data_Input.Self_Reflection_Event_Solver_Inductor)),
+        ('inductor_transmission',probe_solver(Data_Input.Transmission_Event_Solver_Inductor)),
+        ('inductor_termination',probe_solver(Data_Input.Termination_Event_Solver_Inductor)),
+        ('inductor_excitation',np.array(Data_Input.Exitation_Event_Solver_Inductor(Data_Input.Voltage_Souce_Magnitude,Decimal('0')),dtype=object)),
+        ('capacitor_self_reflection',probe_solver(Data_Input.Self_Reflection_Event_Solver_Capacitor)),
+        ('capacitor_transmission',probe_solver(Data_Input.Transmission_Event_Solver_Capacitor)),
+        ('capacitor_termination',probe_solver(Data_Input.Termination_Event_Solver_Capacitor)),
+        ('capacitor_excitation',np.array(Data_Input.Exitation_Event_Solver_Capacitor(Data_Input.Voltage_Souce_Magnitude,Decimal('0')),dtype=object))
+    ])
+
+def get_layer_transfer_operator(Data_Input : Data_Input_Storage):
+    """Gets the linear operator that advances the commutative fanout by one layer.
+
+    The state of a fanout layer is the set of wavefronts returning to each of its nodes, 
+    stored per node as the row (V_inductor, I_inductor, V_capacitor, I_capacitor).
+    Node x of the next layer receives the returning inductive wavefront of node x-1 and the returning capacitive wavefront of node x.
+    The transfer operator is therefore banded with two 4x4 blocks, 
+    'shifted' acting on the state of node x-1 and 'aligned' acting on the state of node x, 
+    which produce the wavefronts sent from node x. The 'termination' block then maps sent wavefronts to returning wavefronts.
+
+    The blocks are assembled from the event matrices of :py:func:`get_event_matrices`, see :py:func:`advance_layer` for their application.
+
+    :param Data_Input: Input data object containing simulation input variables
+    :type Data_Input: Data_Input_Storage
+    :return: dictionary of the 4x4 np.ndarray[float] 'shifted', 'aligned' and 'termination' blocks, and the 'excitation' row sent from the origin node.
+    :rtype: Dict
+    """
+    event_matrices = get_event_matrices(Data_Input)
+    
+    def block_matrix(top_left,top_right,bottom_left,bottom_right):
+        return np.block([[top_left,top_right],[bottom_left,bottom_right]]).astype(float)
+    
+    zero_block = np.zeros((2,2))
+    
+    return dict([
+        # arriving inductive wavefront from node x-1, self-reflects into the inductor and transmits into the capacitor
+        ('shifted',block_matrix(event_matrices['inductor_self_reflection'],zero_block,event_matrices['capacitor_transmission'],zero_block)),
+        # arriving capacitive wavefront from node x, transmits into the inductor and self-reflects into the capacitor
+        ('aligned',block_matrix(zero_block,event_matrices['inductor_transmission'],zero_block,event_matrices['capacitor_self_reflection'])),
+        ('termination',block_matrix(event_matrices['inductor_termination'],zero_block,zero_block,event_matrices['capacitor_termination'])),
+        ('excitation',np.concatenate((event_matrices['inductor_excitation'],event_matrices['capacitor_excitation'])).astype(float))
+    ])
+
+def advance_layer(returning_state : np.ndarray, transfer_operator : dict):
+    """Advances a fanout layer to the next layer by applying the layer transfer operator as a two point stencil.
+
+    Any leading axes of the state are treated as a batch, this allows multiple interfaces with the same number of layers to be advanced at once.
+    For a batch of different interfaces, the blocks of the transfer operator can be stacked with the same leading axes (shape (...,4,4)).
+
+    :param returning_state: returning wavefronts of a layer with k nodes, shape (...,k,4)
+    :type returning_state: np.ndarray[float]
+    :param transfer_operator: the blocks of the transfer operator, see :py:func:`get_layer_transfer_operator`
+    :type transfer_operator: Dict
+    :return: (sending, returning, interconnect) states of the next layer, each of shape (...,k+1,4)
+    :rtype: Tuple (np.ndarray[float], np.ndarray[float], np.ndarray[float])
+    """
+    batch_shape = returning_state.shape[:-2]
+    number_of_nodes = returning_state.shape[-2] + 1
+    
+    # align the arriving wavefronts with the nodes of the next layer
+    arriving_inductor = np.zeros(batch_shape + (number_of_nodes,4))
+    arriving_inductor[...,1:,0:2] = returning_state[...,0:2]
+    arriving_capacitor = np.zeros(batch_shape + (number_of_nodes,4))
+    arriving_capacitor[...,:-1,2:4] = returning_state[...,2:4]
+    
+    # blocks act on rows, so are transposed
+    sending = arriving_inductor @ np.swapaxes(transfer_operator['shifted'],-1,-2) + arriving_capacitor @ np.swapaxes(transfer_operator['aligned'],-1,-2)
+    returning = sending @ np.swapaxes(transfer_operator['termination'],-1,-2)
+    
+    # interconnect changes are the sum of sent and arriving wavefronts
+    interconnect = sending + arriving_inductor + arriving_capacitor
+    
+    return sending, returning, interconnect
+
+def Generate_Wavefront_Layers_Numpy(Data_Input : Data_Input_Storage, start_layer : Data_Layer_Storage = None):
+    """Generator that yields the layers of the commutative fanout one at a time, with float64 magnitudes. 
+    Each layer is calculated from the previous layer using the layer transfer operator 
+    (see :py:func:`get_layer_transfer_operator` and :py:func:`advance_layer`), only the previous layer is kept in memory.
+
+    :param Data_Input: Input data object containing simulation input variables
+    :type Data_Input: Data_Input_Storage
+    :param start_layer: a previously calculated layer to continue from, only its returning wavefronts are used. Generation starts at layer 0 if not provided.
+    :type start_layer: Data_Layer_Storage, optional
+    :yield: the layers up to Number_of_Layers-1 of the fanout, in order
+    :rtype: Data_Layer_Storage
+    """
+    transfer_operator = get_layer_transfer_operator(Data_Input)
+    
+    first_layer_number = 0
+    if(start_layer is not None):
+        first_layer_number = start_layer.layer_number + 1
+        returning = np.stack((start_layer.Voltage_Returning_Inductor,start_layer.Current_Returning_Inductor,
+                              start_layer.Voltage_Returning_Capacitor,start_layer.Current_Returning_Capacitor),axis=1).astype(float)
+
+    for layer_number in range(first_layer_number,Data_Input.Number_of_Layers):
+        # nodes of a layer are ordered with increasing L
+        L_index = np.arange(layer_number+1)
+        C_index = layer_number - L_index
+
+        if(layer_number == 0):
+            # origin node, wavefronts are produced by the source excitation
+            sending = transfer_operator['excitation'].reshape(1,4)
+            returning = sending @ transfer_operator['termination'].T
+            interconnect = sending
+        else:
+            sending, returning, interconnect = advance_layer(returning,transfer_operator)
+
+        yield Data_Layer_Storage(
+            layer_number,
+            L_index,
+            C_index,
+            get_time_array(Data_Input,L_index,C_index,'units'),
+            get_time_array(Data_Input,L_index,C_index,'float'),
+            interconnect[:,0], interconnect[:,1], interconnect[:,2], interconnect[:,3],
+            sending[:,0], sending[:,1], sending[:,2], sending[:,3],
+            returning[:,0], returning[:,1], returning[:,2], returning[:,3]
+        )
+
+def Generate_Wavefront_Layers_Exact(Data_Input : Data_Input_Storage, start_layer : Data_Layer_Storage = None):
+    """Generator that yields the layers of the commutative fanout one at a time, with Decimal magnitudes.
+
+    Times are calculated as integer counts of the GCD of the time delays (a node [L,C] is sent at L x KC + C x KL GCD units),
+    and only converted to Decimal when yielded. Magnitudes are Decimal values held in np.ndarray[Decimal] arrays, 
+    a whole fanout layer is calculated at once by passing these arrays to the event solvers of the Data_Input_Storage object.
+    The solvers therefore perform the same Decimal operations as the wavefront objects of :py:func:`Generate_Wavefronts_Commutatively`,
+    so the produced magnitudes are identical. Customised solvers are supported as long as they are written with arithmetic operators.
+
+    Magnitudes are not held as rationals or scaled integers. The wavefront objects round the result of every solver operation to the Decimal context precision,
+    so only the same Decimal operations reproduce their magnitudes bit for bit, exact rationals would differ from them in the last digits.
+    The integer time units of each layer are yielded in Time_Units, the Decimal Time is derived from them for the fanouts that store it.
+
+    :param Data_Input: Input data object containing simulation input variables
+    :type Data_Input: Data_Input_Storage
+    :param start_layer: a previously calculated layer to continue from, only its returning wavefronts are used. Generation starts at layer 0 if not provided.
+    :type start_layer: Data_Layer_Storage, optional
+    :yield: the layers up to Number_of_Layers-1 of the fanout, in order
+    :rtype: Data_Layer_Storage
+    """
+    first_layer_number = 0
+    if(start_layer is not None):
+        first_layer_number = start_layer.layer_number + 1
+        returning_inductor_voltage, returning_inductor_current = start_layer.Voltage_Returning_Inductor, start_layer.Current_Returning_Inductor
+        returning_capacitor_voltage, returning_capacitor_current = start_layer.Voltage_Returning_Capacitor, start_layer.Current_Returning_Capacitor
+
+    for layer_number in range(first_layer_number,Data_Input.Number_of_Layers):
+        # nodes of a layer are ordered with increasing L
+        L_index = np.arange(layer_number+1)
+        C_index = layer_number - L_index
+
+        if(layer_number == 0):
+            # origin node, wavefronts are produced by the source excitation
+            excitation_voltage = np.array([Data_Input.Voltage_Souce_Magnitude],dtype=object)
+            excitation_current = np.array([Decimal('0')],dtype=object)
+
+            sending_inductor_voltage, sending_inductor_current = Data_Input.Exitation_Event_Solver_Inductor(excitation_voltage,excitation_current)
+            sending_capacitor_voltage, sending_capacitor_current = Data_Input.Exitation_Event_Solver_Capacitor(excitation_voltage,excitation_current)
+
+            # origin node has only sent wavefronts to consider
+            interconnect_inductor_voltage, interconnect_inductor_current = sending_inductor_voltage, sending_inductor_current
+            interconnect_capacitor_voltage, interconnect_capacitor_current = sending_capacitor_voltage, sending_capacitor_current
+        else:
+            # returning inductive wavefronts arrive at nodes 1 to layer_number, 
+            # returning capacitive wavefronts arrive at nodes 0 to layer_number-1.
+            # children of returning capacitive wavefronts:
+            transmitted_inductor_voltage, transmitted_inductor_current = Data_Input.Transmission_Event_Solver_Inductor(returning_capacitor_voltage,returning_capacitor_current)
+            reflected_capacitor_voltage, reflected_capacitor_current = Data_Input.Self_Reflection_Event_Solver_Capacitor(returning_capacitor_voltage,returning_capacitor_current)
+            # children of returning inductive wavefronts:
+            reflected_inductor_voltage, reflected_inductor_current = Data_Input.Self_Reflection_Event_Solver_Inductor(returning_inductor_voltage,returning_inductor_current)
+            transmitted_capacitor_voltage, transmitted_capacitor_current = Data_Input.Transmission_Event_Solver_Capacitor(returning_inductor_voltage,returning_inductor_current)
+
+            # commutatively merge children that meet at the same node, unique nodes at the ends of a layer do not merge
+            sending_inductor_voltage = np.concatenate((transmitted_inductor_voltage[0:1], transmitted_inductor_voltage[1:] + reflected_inductor_voltage[:-1], reflected_inductor_voltage[-1:]))
+            sending_inductor_current = np.concatenate((transmitted_inductor_current[0:1], transmitted_inductor_current[1:] + reflected_inductor_current[:-1], reflected_inductor_current[-1:]))
+            sending_capacitor_voltage = np.concatenate((reflected_capacitor_voltage[0:1], reflected_capacitor_voltage[1:] + transmitted_capacitor_voltage[:-1], transmitted_capacitor_voltage[-1:]))
+            sending_capacitor_current = np.concatenate((reflected_capacitor_current[0:1], reflected_capacitor_current[1:] + transmitted_capacitor_current[:-1], transmitted_capacitor_current[-1:]))
+
+            # interconnect changes are the sum of sent and arriving wavefronts
+            interconnect_inductor_voltage = np.concatenate((sending_inductor_voltage[0:1], sending_inductor_voltage[1:] + returning_inductor_voltage))
+            interconnect_inductor_current = np.concatenate((sending_inductor_current[0:1], sending_inductor_current[1:] + returning_inductor_current))
+            interconnect_capacitor_voltage = np.concatenate((sending_capacitor_voltage[:-1] + returning_capacitor_voltage, sending_capacitor_voltage[-1:]))
+            interconnect_capacitor_current = np.concatenate((sending_capacitor_current[:-1] + returning_capacitor_current, sending_capacitor_current[-1:]))
+
+        returning_inductor_voltage, returning_inductor_current = Data_Input.Termination_Event_Solver_Inductor(sending_inductor_voltage,sending_inductor_current)
+        returning_capacitor_voltage, returning_capacitor_current = Data_Input.Termination_Event_Solver_Capacitor(sending_capacitor_voltage,sending_capacitor_current)
+
+        yield Data_Layer_Storage(
+            layer_number,
+            L_index,
+            C_index,
+            get_time_array(Data_Input,L_index,C_index,'units'),
+            get_time_array(Data_Input,L_index,C_index,'decimal'),
+            interconnect_inductor_voltage, interconnect_inductor_current, interconnect_capacitor_voltage, interconnect_capacitor_current,
+            sending_inductor_voltage, sending_inductor_current, sending_capacitor_voltage, sending_capacitor_current,
+            returning_inductor_voltage, returning_inductor_current, returning_capacitor_voltage, returning_capacitor_current
+        )
+
+#: The engines available for streaming fanout layers in :py:func:`Generate_Wavefront_Layers`
+layer_generation_engines = dict([
+    ('numpy',Generate_Wavefront_Layers_Numpy),
+    ('exact',Generate_Wavefront_Layers_Exact)
+])
+
+def Generate_Wavefront_Layers(Data_Input : Data_Input_Storage, engine : str = 'numpy'):
+    """Streaming counterpart of :py:func:`Generate_Wavefronts_Commutatively`. 
+    Yields each layer of the commutative fanout as soon as it is calculated, without storing the fanout, 
+    memory use is therefore bounded by a single layer instead of the whole fanout.
+
+    The nodes of a layer are not in chronological order, and later layers can contain events that occur before those of earlier layers.
+    The nodes of layer k occur at or after k x min(2 x Inductor_Time, 2 x Capacitor_Time), 
+    so all events up to this time are known once layer k has been yielded.
+
+    :param Data_Input: Input data object containing simulation input variables
+    :type Data_Input: Data_Input_Storage
+    :param engine: 'numpy' for float64 magnitudes (see :py:func:`Generate_Wavefront_Layers_Numpy`), 
+        or 'exact' for Decimal magnitudes (see :py:func:`Generate_Wavefront_Layers_Exact`), defaults to 'numpy'
+    :type engine: str, optional
+    :raises ValueError: if the engine is not one of the available options
+    :return: generator of the layers 0 to Number_of_Layers-1 of the fanout, in order
+    :rtype: Generator[Data_Layer_Storage]
+    
+    .. code-block::
+
+        from Wavefront_Storage import Data_Input_Storage
+        from Wavefront_Generation import Generate_Wavefront_Layers
+
+        data_input = Data_Input_Storage(L_time = '7', C_time = '3.4', show_about = False)
+
+        # process each layer as it is calculated, without storing the fanout
+        for layer in Generate_Wavefront_Layers(data_input):
+            print(layer.layer_number, layer.Voltage_Interconnect_Inductor.sum())
+    """
+    if (engine not in layer_generation_engines):
+        raise ValueError(f"Engine '{engine}' is not an option, options are: {list(layer_generation_engines.keys())}")
+    
+    return layer_generation_engines[engine](Data_Input)
+
+#: The fields of Data_Layer_Storage that are stored as commutative fanouts, see :py:func:`store_wavefront_layers`
+fanout_layer_fields = ['Time',
+                       'Voltage_Interconnect_Inductor','Current_Interconnect_Inductor','Voltage_Interconnect_Capacitor','Current_Interconnect_Capacitor',
+                       'Voltage_Sending_Inductor','Current_Sending_Inductor','Voltage_Sending_Capacitor','Current_Sending_Capacitor',
+                       'Voltage_Returning_Inductor','Current_Returning_Inductor','Voltage_Returning_Capacitor','Current_Returning_Capacitor']
+
+def get_fanout_magnitude_arrays(data_output : Data_Output_Storage):
+    """Gets the fanout arrays of a commutative Data_Output_Storage of wavefront arrays, in the order of fanout_layer_fields.
+
+    :param data_output: commutative fanouts stored as Wavefront_Arrays
+    :type data_output: Data_Output_Storage
+    :return: fanout arrays in the order of fanout_layer_fields
+    :rtype: List[Triangular_Array]
+    """
+    return [data_output.Time,
+            data_output.Voltage_Interconnect_Inductor, data_output.Current_Interconnect_Inductor,
+            data_output.Voltage_Interconnect_Capacitor, data_output.Current_Interconnect_Capacitor,
+            data_output.Wavefronts_Sending_Inductor.magnitude_voltage, data_output.Wavefronts_Sending_Inductor.magnitude_current,
+            data_output.Wavefronts_Sending_Capacitor.magnitude_voltage, data_output.Wavefronts_Sending_Capacitor.magnitude_current,
+            data_output.Wavefronts_Returning_Inductor.magnitude_voltage, data_output.Wavefronts_Returning_Inductor.magnitude_current,
+            data_output.Wavefronts_Returning_Capacitor.magnitude_voltage, data_output.Wavefronts_Returning_Capacitor.magnitude_current]
+
+def get_fanout_node_values(data_output_commutative : Data_Output_Storage, flat_index : np.ndarray):
+    """Gets the values of stored nodes of commutative fanouts in the order of fanout_layer_fields, the wavefronts by their voltage and current magnitudes. 
+    Fanouts of Wavefront_Arrays and of wavefront objects are both supported.
+
+    :param data_output_commutative: commutative fanouts stored in Triangular_Arrays
+    :type data_output_commutative: Data_Output_Storage
+    :param flat_index: the positions of the nodes in the flat buffers, see :py:meth:`Wavefront_Storage.Triangular_Array.get_flat_index`
+    :type flat_index: np.ndarray[int]
+    :return: the values of the nodes in the order of fanout_layer_fields
+    :rtype: List[np.ndarray]
+    """
+    node_values = [fanout.data[flat_index] for fanout in [data_output_commutative.Time,
+                   data_output_commutative.Voltage_Interconnect_Inductor, data_output_commutative.Current_Interconnect_Inductor,
+                   data_output_commutative.Voltage_Interconnect_Capacitor, data_output_commutative.Current_Interconnect_Capacitor]]
+    
+    for wavefronts in [data_output_commutative.Wavefronts_Sending_Inductor, data_output_commutative.Wavefronts_Sending_Capacitor,
+                       data_output_commutative.Wavefronts_Returning_Inductor, data_output_commutative.Wavefronts_Returning_Capacitor]:
+        if isinstance(wavefronts, Wavefront_Array):
+            node_values += [wavefronts.magnitude_voltage.data[flat_index], wavefronts.magnitude_current.data[flat_index]]
+        else:
+            node_values += [get_voltage_array(wavefronts.data[flat_index]), get_current_array(wavefronts.data[flat_index])]
+    
+    return node_values
+
+def get_data_output_from_fanouts(Data_Input : Data_Input_Storage, fanouts : dict, has_merged : bool):
+    """Creates a Data_Output_Storage object from fanouts keyed by the names of fanout_layer_fields, 
+    the magnitude fanouts of the wavefronts are stored in Wavefront_Arrays.
+
+    :param Data_Input: input data of the fanouts
+    :type Data_Input: Data_Input_Storage
+    :param fanouts: the fanouts of each field of fanout_layer_fields
+    :type fanouts: Dict[str, Triangular_Array or np.ndarray]
+    :param has_merged: indicates if the fanouts have been multiplicatively merged
+    :type has_merged: bool
+    :return: output data of the fanouts
+    :rtype: Data_Output_Storage
+    """
+    return Data_Output_Storage(
+        fanouts['Time'], # Merge Times
+        fanouts['Voltage_Interconnect_Inductor'], # Values at interconnect
+        fanouts['Current_Interconnect_Inductor'], # Values at interconnect
+        fanouts['Voltage_Interconnect_Capacitor'], # Values at interconnect
+        fanouts['Current_Interconnect_Capacitor'], # Values at interconnect
+        Wavefront_Array(Data_Input,True,True,fanouts['Voltage_Sending_Inductor'],fanouts['Current_Sending_Inductor']), # Specific Wavefronts at Nodes
+        Wavefront_Array(Data_Input,False,True,fanouts['Voltage_Sending_Capacitor'],fanouts['Current_Sending_Capacitor']), # Specific Wavefronts at Nodes
+        Wavefront_Array(Data_Input,True,False,fanouts['Voltage_Returning_Inductor'],fanouts['Current_Returning_Inductor']), # Specific Wavefronts at Nodes
+        Wavefront_Array(Data_Input,False,False,fanouts['Voltage_Returning_Capacitor'],fanouts['Current_Returning_Capacitor']), # Specific Wavefronts at Nodes
+        has_merged
+        )
+
+def convert_to_wavefront_arrays(Data_Input : Data_Input_Storage, data_output_commutative : Data_Output_Storage):
+    """Converts commutative fanouts of wavefront objects (produced by :py:func:`Generate_Wavefronts_Commutatively`) 
+    to fanouts of Wavefront_Arrays with Decimal magnitudes, the format produced by the 'exact' engine.
+
+    :param Data_Input: input data of the fanouts
+    :type Data_Input: Data_Input_Storage
+    :param data_output_commutative: commutative fanouts of wavefront objects, stored in Triangular_Arrays or dense np.ndarrays
+    :type data_output_commutative: Data_Output_Storage
+    :return: commutative fanouts of Wavefront_Arrays
+    :rtype: Data_Output_Storage
+    """
+    def convert_fanout(wavefront_fanout, is_Inductor : bool, is_Sending : bool):
+        return Wavefront_Array.from_wavefronts(Data_Input,wavefront_fanout,is_Inductor,is_Sending)
+    
+    return Data_Output_Storage(
+        data_output_commutative.Time,
+        data_output_commutative.Voltage_Interconnect_Inductor,
+        data_output_commutative.Current_Interconnect_Inductor,
+        data_output_commutative.Voltage_Interconnect_Capacitor,
+        data_output_commutative.Current_Interconnect_Capacitor,
+        convert_fanout(data_output_commutative.Wavefronts_Sending_Inductor,True,True),
+        convert_fanout(data_output_commutative.Wavefronts_Sending_Capacitor,False,True),
+        convert_fanout(data_output_commutative.Wavefronts_Returning_Inductor,True,False),
+        convert_fanout(data_output_commutative.Wavefronts_Returning_Capacitor,False,False),
+        data_output_commutative.has_merged
+    )
+
+def store_wavefront_layers(Data_Input : Data_Input_Storage, layers, fill_value, data_output_previous : Data_Output_Storage = None):
+    """Stores the layers of a commutative fanout into a Data_Output_Storage object of Triangular_Arrays.
+    As in :py:func:`Generate_Wavefronts_Commutatively`, the returning wavefronts of the last layer are not stored.
+    Optionally the layers are stored into the fanouts of a previously stored fanout with fewer layers, 
+    these are grown in place (see :py:meth:`Wavefront_Storage.Triangular_Array.add_layers`) and the provided layers are stored over them.
+
+    :param Data_Input: Input data object containing simulation input variables
+    :type Data_Input: Data_Input_Storage
+    :param layers: the layers of the fanout in order, see :py:func:`Generate_Wavefront_Layers`
+    :type layers: Iterable[Data_Layer_Storage]
+    :param fill_value: value of the nodes that are not calculated, i.e. 0.0 or Decimal('0')
+    :type fill_value: float or Decimal
+    :param data_output_previous: fanout of wavefront arrays with fewer layers to grow, defaults to None
+    :type data_output_previous: Data_Output_Storage, optional
+    :return: output data (a collection commutative fanouts in form of Triangular_Array and Wavefront_Array)
+    :rtype: Data_Output_Storage
+    """
+    stored_fields = fanout_layer_fields
+    
+    if(data_output_previous is None):
+        fanouts = dict([(field, Triangular_Array(Data_Input.Number_of_Layers,fill_value)) for field in stored_fields])
+    else:
+        # diagonal-major storage, the layers of the previous fanout are the start of the grown flat buffer
+        fanouts = dict(zip(stored_fields, get_fanout_magnitude_arrays(data_output_previous)))
+        for fanout in fanouts.values():
+            fanout.add_layers(Data_Input.Number_of_Layers)
+    
+    for layer in layers:
+        for field in stored_fields:
+            if(field.find('Returning') > -1 and layer.layer_number == Data_Input.Number_of_Layers -1):
+                continue
+            fanouts[field].get_layer(layer.layer_number)[:] = getattr(layer,field)
+    
+    # indicated that multiplicative merging has not occured
+    return get_data_output_from_fanouts(Data_Input,fanouts,False)
+
+def Generate_Wavefronts_Commutatively_Numpy(Data_Input : Data_Input_Storage):
+    """A float64 version of :py:func:`Generate_Wavefronts_Commutatively` that produces the same commutative fanouts without creating wavefront objects.
+    Selected in :py:func:`Full_Cycle` using engine = 'numpy'. The layers are generated by :py:func:`Generate_Wavefront_Layers_Numpy`.
+
+    :param Data_Input: Input data object containing simulation input variables
+    :type Data_Input: Data_Input_Storage
+    :return: output data (a collection commutative fanouts in form of Triangular_Array[float] and Wavefront_Array)
+    :rtype: Data_Output_Storage
+    """
+    return store_wavefront_layers(Data_Input,Generate_Wavefront_Layers_Numpy(Data_Input),0.0)
+
+def Generate_Wavefronts_Commutatively_Exact(Data_Input : Data_Input_Storage):
+    """An exact version of :py:func:`Generate_Wavefronts_Commutatively` that produces identical fanouts without creating wavefront objects.
+    Selected in :py:func:`Full_Cycle` using engine = 'exact'. The layers are generated by :py:func:`Generate_Wavefront_Layers_Exact`.
+
+    :param Data_Input: Input data object containing simulation input variables
+    :type Data_Input: Data_Input_Storage
+    :return: output data (a collection commutative fanouts in form of Triangular_Array[Decimal] and Wavefront_Array)
+    :rtype: Data_Output_Storage
+    """
+    return store_wavefront_layers(Data_Input,Generate_Wavefront_Layers_Exact(Data_Input),Decimal('0'))
+
+def get_merged_indexes(Data_Input : Data_Input_Storage, L_index : np.ndarray, C_index : np.ndarray):
+    """Gets the position of grid nodes in the multiplicatively merged fanout. 
+    Node [L,C] coincides in time with node [L+KL,C-KC], so merging folds every node onto the KC wide band along the L-axis, 
+    to the node [L + (C//KC) x KL, C % KC].
+
+    :param Data_Input: input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param L_index: the L co-ordinates of the nodes
+    :type L_index: np.ndarray[int]
+    :param C_index: the C co-ordinates of the nodes
+    :type C_index: np.ndarray[int]
+    :return: (L_index_merged, C_index_merged)
+    :rtype: Tuple (np.ndarray[int], np.ndarray[int])
+    """
+    return L_index + (C_index//Data_Input.Capacitor_LCM_Factor)*Data_Input.Inductor_LCM_Factor, C_index % Data_Input.Capacitor_LCM_Factor
+
+def store_merged_wavefront_layers(Data_Input : Data_Input_Storage, layers, fill_value):
+    """Folds the layers of a commutative fanout directly into a multiplicatively merged Data_Output_Storage object (see :py:func:`get_merged_indexes`). 
+    The commutative fanout is never stored, the merged fanouts are of shape (Number_of_Layers+1, KC), 
+    so memory is O(Number_of_Layers x KC) instead of O(Number_of_Layers²). 
+    Time remains O(Number_of_Layers²), every node of the commutative fanout is still generated and folded.
+    Merged nodes past the last row of the fanout are not stored, as with :py:func:`Higher_Order_Merging`.
+
+    :param Data_Input: Input data object containing simulation input variables
+    :type Data_Input: Data_Input_Storage
+    :param layers: the layers of the fanout in order, see :py:func:`Generate_Wavefront_Layers`
+    :type layers: Iterable[Data_Layer_Storage]
+    :param fill_value: the zero of the magnitudes, i.e. 0.0 or Decimal('0')
+    :type fill_value: float or Decimal
+    :return: merged output data (a collection of merged fanouts in form of np.ndarray and Wavefront_Array)
+    :rtype: Data_Output_Storage
+    """
+    shape = (Data_Input.Number_of_Layers+1, min(Data_Input.Capacitor_LCM_Factor,Data_Input.Number_of_Layers+1))
+    
+    stored_fields = fanout_layer_fields[1:]
+    fanouts = dict([(field, np.full(shape, fill_value)) for field in stored_fields])
+    
+    for layer in layers:
+        L_index_merged, C_index_merged = get_merged_indexes(Data_Input,layer.L_index,layer.C_index)
+        is_stored = L_index_merged < shape[0]
+        merged_indexes = (L_index_merged[is_stored], C_index_merged[is_stored])
+        
+        for field in stored_fields:
+            if(field.find('Returning') > -1 and layer.layer_number == Data_Input.Number_of_Layers -1):
+                continue
+            # unbuffered addition, nodes of a layer can fold onto the same merged node
+            np.add.at(fanouts[field], merged_indexes, getattr(layer,field)[is_stored])
+    
+    if(isinstance(fill_value, Decimal)):
+        fanouts['Time'] = get_time_merged(Data_Input,shape,'decimal')
+    else:
+        fanouts['Time'] = get_time_merged(Data_Input,shape,'float')
+    
+    # indicates Higher order merging has occured
+    return get_data_output_from_fanouts(Data_Input,fanouts,True)
+
+def Generate_Wavefronts_Merged(Data_Input : Data_Input_Storage, engine : str = 'numpy'):
+    """Generates the multiplicatively merged fanouts directly, without storing the commutative fanouts. 
+    Produces the same merged data as :py:func:`Higher_Order_Merging` of a commutative fanout, 
+    up to the rounding of the order merged values are summed in. See :py:func:`store_merged_wavefront_layers`.
+    Selected in :py:func:`Full_Cycle` using is_Direct_Merging = True.
+
+    :param Data_Input: Input data object containing simulation input variables
+    :type Data_Input: Data_Input_Storage
+    :param engine: the layer generation engine, 'numpy' or 'exact' (see :py:func:`Generate_Wavefront_Layers`), defaults to 'numpy'
+    :type engine: str, optional
+    :raises ValueError: if the engine is not one of the available options
+    :return: merged output data
+    :rtype: Data_Output_Storage
+    """
+    if (engine not in layer_generation_engines):
+        raise ValueError(f"Engine '{engine}' is not an option for direct merging, options are: {list(layer_generation_engines.keys())}")
+    
+    if(engine == 'exact'):
+        fill_value = Decimal('0')
+    else:
+        fill_value = 0.0
+    
+    return store_merged_wavefront_layers(Data_Input,layer_generation_engines[engine](Data_Input),fill_value)
+
 def multiplicative_merge_single_cycle(input_array:np.ndarray,Inductor_LCM_Factor:int,Capacitor_LCM_Factor:int):
     """Completes a single merging cycle of a mangitude fanout along the inductive axis.
     A single cycle consitis of splitting -> shift -> merging.
@@ -345,6 +862,10 @@ def multiplicative_merging(input_array:np.ndarray,Inductor_LCM_Factor:int ,Capac
     :return: merged array
     :rtype: np.ndarray
     """
+    if(isinstance(input_array,Wavefront_Array)):
+        # merge voltage and current magnitudes seperately, the merged array is reindexed with merged positions
+        return input_array.map_magnitudes(lambda magnitude_array : multiplicative_merging(magnitude_array,Inductor_LCM_Factor,Capacitor_LCM_Factor,layer_number_limit))
+    
     number_merge_cycles:int = math.ceil(layer_number_limit/Capacitor_LCM_Factor) + 1
     
     for _ in range (0,number_merge_cycles):
@@ -352,6 +873,132 @@ def multiplicative_merging(input_array:np.ndarray,Inductor_LCM_Factor:int ,Capac
 
     return input_array[:,0:Capacitor_LCM_Factor]
 
+def multiplicative_merging_strided(input_array:np.ndarray,Inductor_LCM_Factor:int ,Capacitor_LCM_Factor:int ,layer_number_limit:int):
+    """A drop-in replacement for :py:func:`multiplicative_merging` that merges in a single pass without intermediate arrays.
+    The merged array is preallocated as the first KC wide column block of the input array, 
+    the k-th column block is then shifted k x KL along the L-axis and added to it in place, 
+    i.e. merged[L,c] = input[L,c] + input[L-KL,c+KC] + input[L-2KL,c+2KC] + ... 
+    Blocks are added in the same order as the merging cycles of :py:func:`multiplicative_merging`, so the merged values are identical.
+    The input array is not altered.
+
+    :param input_array: array to be merged
+    :type input_array: np.ndarray
+    :param Inductor_LCM_Factor: Inductor LCM cofactor KL
+    :type Inductor_LCM_Factor: int
+    :param Capacitor_LCM_Factor: Capacitor LCM cofactor KC
+    :type Capacitor_LCM_Factor: int
+    :param layer_number_limit: up to what layer the array must be mrged to 
+    :type layer_number_limit: int
+    :return: merged array
+    :rtype: np.ndarray
+    """
+    if(isinstance(input_array,Wavefront_Array)):
+        # merge voltage and current magnitudes seperately, the merged array is reindexed with merged positions
+        return input_array.map_magnitudes(lambda magnitude_array : multiplicative_merging_strided(magnitude_array,Inductor_LCM_Factor,Capacitor_LCM_Factor,layer_number_limit))
+    
+    number_of_rows, number_of_columns = input_array.shape
+    number_merge_cycles:int = math.ceil(layer_number_limit/Capacitor_LCM_Factor) + 1
+    
+    # wavefront objects are merged as Wavefront_Arrays above, object arrays only hold immutable Decimals
+    merged_array = np.array(input_array[:,0:Capacitor_LCM_Factor])
+    
+    for k in range(1,number_merge_cycles+1):
+        L_shift = k*Inductor_LCM_Factor
+        C_start = k*Capacitor_LCM_Factor
+        if(L_shift >= number_of_rows or C_start >= number_of_columns):
+            break
+        
+        # views of the overlapping region of the shifted column block
+        column_block = input_array[0:number_of_rows-L_shift, C_start:C_start+Capacitor_LCM_Factor]
+        merged_array[L_shift:, 0:column_block.shape[1]] += column_block
+    
+    return merged_array
+
+def multiplicative_merging_fused(Data_Input : Data_Input_Storage, fanouts):
+    """Multiplicatively merges several commutative fanouts in a single pass. 
+    The flat buffers of the fanouts are stacked into one (fields, nodes) array, 
+    each KC wide column block is gathered for all fields at once and added to the merged (fields, L, C) array shifted along the L-axis, 
+    as done by :py:func:`multiplicative_merging_strided` for a single field. 
+    The shift pattern is therefore only calculated once, instead of once per field.
+    
+    Column blocks are added in the order of the merging cycles of :py:func:`multiplicative_merging`, 
+    so the merged values are identical to merging each fanout seperately. The fanouts are not altered.
+
+    :param Data_Input: input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param fanouts: commutative fanouts of the same shape with numeric values, typically the magnitude fanouts of :py:func:`get_fanout_magnitude_arrays`
+    :type fanouts: List[Triangular_Array]
+    :return: the merged fanouts stacked as a (fields, L, C) array
+    :rtype: np.ndarray
+    """
+    KL = Data_Input.Inductor_LCM_Factor
+    KC = Data_Input.Capacitor_LCM_Factor
+    
+    number_of_layers = fanouts[0].number_of_layers
+    number_of_rows, number_of_columns = fanouts[0].shape
+    
+    # the last entry of the stacked buffers is the fill value, gathered for nodes that are not stored
+    fill_index = len(fanouts[0].data)
+    stacked_data = np.empty((len(fanouts), fill_index+1), dtype=np.result_type(*[fanout.data for fanout in fanouts]))
+    for field_index, fanout in enumerate(fanouts):
+        stacked_data[field_index, 0:fill_index] = fanout.data
+        stacked_data[field_index, fill_index] = fanout.fill_value
+    
+    merged_array = np.full((len(fanouts), number_of_rows, min(KC,number_of_columns)), fanouts[0].fill_value, dtype=stacked_data.dtype)
+    
+    k = 0
+    # rows of a column block beyond the last stored layer, or shifted past the last row, are not needed
+    while(min(number_of_rows - k*KL, number_of_layers - k*KC) > 0):
+        number_block_rows = min(number_of_rows - k*KL, number_of_layers - k*KC)
+        
+        L_index = np.arange(number_block_rows).reshape(-1,1)
+        C_index = np.arange(k*KC, min(k*KC + KC, number_of_columns)).reshape(1,-1)
+        flat_index = np.where(L_index + C_index < number_of_layers, Triangular_Array.get_flat_index(L_index,C_index), fill_index)
+        
+        merged_array[:, k*KL:k*KL + number_block_rows, 0:C_index.shape[1]] += stacked_data[:, flat_index]
+        k += 1
+    
+    return merged_array
+
+def merge_fanout_nodes(Data_Input : Data_Input_Storage, fanouts, L_index : np.ndarray, C_index : np.ndarray):
+    """Multiplicatively merges several commutative fanouts at the provided nodes of the merged fanout only, the other merged nodes are not calculated. 
+    The merged node [L,C] is the sum of the commutative nodes [L - k x KL, C + k x KC] for k = 0, 1, 2 ..., 
+    these are added in the order and with the fill values of :py:func:`multiplicative_merging_fused`, so the merged values are identical.
+    Used to update the merged nodes that change when a simulation is extended, see :py:func:`extend_merged_fanouts`.
+
+    :param Data_Input: input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param fanouts: commutative fanouts of the same shape with numeric values, typically the magnitude fanouts of :py:func:`get_fanout_magnitude_arrays`
+    :type fanouts: List[Triangular_Array]
+    :param L_index: the L co-ordinates of the nodes in the merged fanout
+    :type L_index: np.ndarray[int]
+    :param C_index: the C co-ordinates of the nodes in the merged fanout
+    :type C_index: np.ndarray[int]
+    :return: the merged values of the nodes stacked as a (fields, nodes) array
+    :rtype: np.ndarray
+    """
+    KL = Data_Input.Inductor_LCM_Factor
+    KC = Data_Input.Capacitor_LCM_Factor
+    
+    number_of_layers = fanouts[0].number_of_layers
+    number_of_columns = fanouts[0].shape[1]
+    
+    merged_values = np.full((len(fanouts), len(L_index)), fanouts[0].fill_value, dtype=np.result_type(*[fanout.data for fanout in fanouts]))
+    
+    for k in range(0, int(np.max(L_index, initial=-1))//KL + 1):
+        L_index_commutative = L_index - k*KL
+        C_index_commutative = C_index + k*KC
+        
+        # nodes of the k-th column block that multiplicative_merging_fused adds, nodes that are not stored add the fill value
+        is_merged = (L_index_commutative >= 0) & (L_index_commutative < number_of_layers - k*KC) & (C_index_commutative < number_of_columns)
+        is_stored = (L_index_commutative + C_index_commutative)[is_merged] < number_of_layers
+        flat_index = np.where(is_stored, Triangular_Array.get_flat_index(L_index_commutative[is_merged], C_index_commutative[is_merged]), 0)
+        
+        for field_index, fanout in enumerate(fanouts):
+            merged_values[field_index, is_merged] += np.where(is_stored, fanout.data[flat_index], fanout.fill_value)
+    
+    return merged_values
+
 def transform_merged_array_to_C_axis(data_input : Data_Input_Storage,merged_array):
     """Transform merged data output array to a C-axis merging representation
 
@@ -390,23 +1037,41 @@ def Higher_Order_Merging(Data_Inputs : Data_Input_Storage,Data_Outputs : Data_Ou
     :type Data_Outputs: Data_Output_Storage
     :return: a merged Data_Output_Storage storage object, merged version of the supplied Data_Outputs parameter
     :rtype: Data_Output_Storage
-    """
-    Data_Outputs = copy.deepcopy(Data_Outputs)
     
+    Wavefronts are merged by their voltage and current magnitudes, fanouts of wavefront objects are first converted to Wavefront_Arrays (see :py:func:`convert_to_wavefront_arrays`).
+    Merged wavefronts are therefore always Wavefront_Arrays, which materialize wavefront objects only when a node is indexed.
+    The magnitude fanouts are merged together in a single pass (see :py:func:`multiplicative_merging_fused`), 
+    the merged fields are then views of one stacked (fields, L, C) array.
+    
+    The supplied Data_Outputs are not altered and no copy of them is made, merged fanouts are new arrays. 
+    Fields that are not merged share their arrays with Data_Outputs, which is the case for all fields if multiplicative merging does not occur.
+    Shared arrays must therefore not be altered in place, the crop after ordering (see :py:func:`crop_data_output_merged`) replaces arrays instead.
+    """
     if(Data_Inputs.is_Higher_Merging):
-        Voltage_Interconnect_Inductor_merged = multiplicative_merging(Data_Outputs.Voltage_Interconnect_Inductor,Data_Inputs.Inductor_LCM_Factor,Data_Inputs.Capacitor_LCM_Factor,Data_Inputs.Number_of_Layers)
-        Current_Interconnect_Inductor_merged = multiplicative_merging(Data_Outputs.Current_Interconnect_Inductor,Data_Inputs.Inductor_LCM_Factor,Data_Inputs.Capacitor_LCM_Factor,Data_Inputs.Number_of_Layers)
+        if(isinstance(Data_Outputs.Wavefronts_Sending_Inductor, Triangular_Array)):
+            # wavefront objects are merged by their magnitudes, objects are materialized when indexed (see Wavefront_Array)
+            Data_Outputs = convert_to_wavefront_arrays(Data_Inputs,Data_Outputs)
         
-        Voltage_Interconnect_Capacitor_merged = multiplicative_merging(Data_Outputs.Voltage_Interconnect_Capacitor,Data_Inputs.Inductor_LCM_Factor,Data_Inputs.Capacitor_LCM_Factor,Data_Inputs.Number_of_Layers)
-        Current_Interconnect_Capacitor_merged = multiplicative_merging(Data_Outputs.Current_Interconnect_Capacitor,Data_Inputs.Inductor_LCM_Factor,Data_Inputs.Capacitor_LCM_Factor,Data_Inputs.Number_of_Layers)
+        # magnitude fanouts are merged together, merged fields are views of the stacked array
+        merged_magnitudes = multiplicative_merging_fused(Data_Inputs,get_fanout_magnitude_arrays(Data_Outputs)[1:])
         
-        Wavefronts_Sending_Inductor_merged = multiplicative_merging(Data_Outputs.Wavefronts_Sending_Inductor,Data_Inputs.Inductor_LCM_Factor,Data_Inputs.Capacitor_LCM_Factor,Data_Inputs.Number_of_Layers)
-        Wavefronts_Sending_Capacitor_merged = multiplicative_merging(Data_Outputs.Wavefronts_Sending_Capacitor,Data_Inputs.Inductor_LCM_Factor,Data_Inputs.Capacitor_LCM_Factor,Data_Inputs.Number_of_Layers)
-
-        Wavefronts_Returning_Inductor_merged = multiplicative_merging(Data_Outputs.Wavefronts_Returning_Inductor,Data_Inputs.Inductor_LCM_Factor,Data_Inputs.Capacitor_LCM_Factor,Data_Inputs.Number_of_Layers)
-        Wavefronts_Returning_Capacitor_merged = multiplicative_merging(Data_Outputs.Wavefronts_Returning_Capacitor,Data_Inputs.Inductor_LCM_Factor,Data_Inputs.Capacitor_LCM_Factor,Data_Inputs.Number_of_Layers)
+        Voltage_Interconnect_Inductor_merged = merged_magnitudes[0]
+        Current_Interconnect_Inductor_merged = merged_magnitudes[1]
+        
+        Voltage_Interconnect_Capacitor_merged = merged_magnitudes[2]
+        Current_Interconnect_Capacitor_merged = merged_magnitudes[3]
+        
+        Wavefronts_Sending_Inductor_merged = Wavefront_Array(Data_Inputs,True,True,merged_magnitudes[4],merged_magnitudes[5])
+        Wavefronts_Sending_Capacitor_merged = Wavefront_Array(Data_Inputs,False,True,merged_magnitudes[6],merged_magnitudes[7])
         
-        Time_cut = Data_Outputs.Time[:,0:Data_Inputs.Capacitor_LCM_Factor]
+        Wavefronts_Returning_Inductor_merged = Wavefront_Array(Data_Inputs,True,False,merged_magnitudes[8],merged_magnitudes[9])
+        Wavefronts_Returning_Capacitor_merged = Wavefront_Array(Data_Inputs,False,False,merged_magnitudes[10],merged_magnitudes[11])
+        
+        # merged times follow from the grid co-ordinates, no merging is needed
+        if(Data_Outputs.Time.dtype == object):
+            Time_cut = get_time_merged(Data_Inputs,Voltage_Interconnect_Inductor_merged.shape,'decimal')
+        else:
+            Time_cut = get_time_merged(Data_Inputs,Voltage_Interconnect_Inductor_merged.shape,'float')
     else:
         Voltage_Interconnect_Inductor_merged = Data_Outputs.Voltage_Interconnect_Inductor
         Current_Interconnect_Inductor_merged = Data_Outputs.Current_Interconnect_Inductor
@@ -436,149 +1101,20 @@ def Higher_Order_Merging(Data_Inputs : Data_Input_Storage,Data_Outputs : Data_Ou
         True # indicates Higher order merging has occured
     )
 
-def Order_Data_Output_Merged(Data_Input : Data_Input_Storage , Data_Output_Merged : Data_Output_Storage):
-    """Order the merged wavefront data into single dimension chronologically occuring 'lists'. Uses a Breadth First Search type algorithm.
+def crop_data_output_merged(Data_Output_Merged : Data_Output_Storage, out_indexes):
+    """Crops the merged data in place to the maximum occuring index of the ordered events along each axis.
 
-    :param Data_Input: the input data of the interface
-    :type Data_Input: Data_Input_Storage
-    :param Data_Output_Merged: the merged data to be ordered
+    :param Data_Output_Merged: the merged data that has been ordered
     :type Data_Output_Merged: Data_Output_Storage
-    :raises warnings.warn: should be used on a merged data storage object, ekse results may be incorrect
-    :return: ordered merged data
-    :rtype: Data_Output_Storage_Ordered
+    :param out_indexes: the [L,C] indexes of the ordered events
+    :type out_indexes: np.ndarray[int] or List[List[int]]
     """
-    if (Data_Output_Merged.has_merged == False):
-        raise warnings.warn("Provided Data_Output_Storage object to be ordered has not been merged yet. This can produce incorrect results if merging is not accounted for.")
-    
-    
-    def store_options(merged_array,x,y,option_array,index_array):
-        """Store neighbouring cells as options and mark on grid.
-
-        :param merged_array: array being orderd
-        :type merged_array: np.ndarray
-        :param x: current x-index
-        :type x: int
-        :param y: current y-index
-        :type y: int
-        :param option_array: stores the value from the merged array as an option
-        :type option_array: list
-        :param index_array: stores the index of the option
-        :type index_array: list
-        """
-        # get shape to make sure not out of bounds
-        x_size,y_size = merged_array.shape
-        
-        # if x+1 neighbour is not marked, store as an option and mark
-        if(x+1 < x_size and Marked[x+1,y] == 0):
-            option_array.append(merged_array[x+1,y])
-            index_array.append([x+1,y])
-            Marked[x+1,y] = 1
-        
-        # if y+1 neighbour is not marked, store as an option and mark
-        if(y+1 < y_size and Marked[x,y+1] == 0):
-            option_array.append(merged_array[x,y+1])
-            index_array.append([x,y+1])
-            Marked[x,y+1] = 1
-        
-    def get_best_option_value_index(option_array,index_array):
-        """return the value and index of the option with the minimum value. 
-        delete best option from list.
-
-        :param option_array: possible options
-        :type option_array: List[Decimal]
-        :param index_array: possible options indexes
-        :type index_array: List[(int,int)]
-        :return: (value, index)
-        :rtype:  tuple ( Decimal, (int,int))
-        """
-        index_of_min_option = np.argmin(option_array)
-        
-        value = option_array[index_of_min_option]
-        del option_array[index_of_min_option]
-        
-        index = index_array[index_of_min_option]
-        del index_array[index_of_min_option]
-        
-        return value, index
-    
-    # Storage Arrays
-    out_time = []
-
-    out_voltage_inductor = []
-    out_current_inductor = []
-    out_voltage_capacitor = []
-    out_current_capacitor = []
-
-    out_wavefront_sending_inductor = []
-    out_wavefront_sending_capacitor = []
-    
-    out_wavefront_returning_inductor = []
-    out_wavefront_returning_capacitor = []
-
-    out_indexes = []
-
-    # Ordering Utilities
-    latest_time = 0
-
-    x_index = 0
-    y_index = 0
-
-    option_time = []
-    option_indexes =[]
-    
-    # array marking options that have been explored.
-    Marked = np.zeros(Data_Output_Merged.Time.shape, dtype=Data_Output_Merged.Time.dtype)
-
-    # Store Initial Point
-    out_time.append(Data_Output_Merged.Time[0,0])
-    out_indexes.append([0,0])
-    out_voltage_inductor.append(Data_Output_Merged.Voltage_Interconnect_Inductor[0,0])
-    out_current_inductor.append(Data_Output_Merged.Current_Interconnect_Inductor[0,0])
-    out_voltage_capacitor.append(Data_Output_Merged.Voltage_Interconnect_Capacitor[0,0])
-    out_current_capacitor.append(Data_Output_Merged.Current_Interconnect_Capacitor[0,0])
-    out_wavefront_sending_inductor.append(Data_Output_Merged.Wavefronts_Sending_Inductor[0,0])
-    out_wavefront_sending_capacitor.append(Data_Output_Merged.Wavefronts_Sending_Capacitor[0,0])
-    out_wavefront_returning_inductor.append(Data_Output_Merged.Wavefronts_Returning_Inductor[0,0])
-    out_wavefront_returning_capacitor.append(Data_Output_Merged.Wavefronts_Returning_Capacitor[0,0])
-
-    # mark initial point
-    Marked[0,0] = 1
-
-    while latest_time < Data_Input.Simulation_Stop_Time:
-        # store options at location
-        store_options(Data_Output_Merged.Time,x_index,y_index,option_time,option_indexes)
-        
-        if(len(option_time) > 0):
-            # get best option
-            best_time, best_time_index = get_best_option_value_index(option_time,option_indexes)
-            
-            # append the approriate vlaues using the index
-            out_time.append(best_time)
-            out_indexes.append(best_time_index)
-            
-            out_voltage_inductor.append(Data_Output_Merged.Voltage_Interconnect_Inductor[best_time_index[0],best_time_index[1]])
-            out_current_inductor.append(Data_Output_Merged.Current_Interconnect_Inductor[best_time_index[0],best_time_index[1]])
-            
-            out_voltage_capacitor.append(Data_Output_Merged.Voltage_Interconnect_Capacitor[best_time_index[0],best_time_index[1]] )
-            out_current_capacitor.append(Data_Output_Merged.Current_Interconnect_Capacitor[best_time_index[0],best_time_index[1]] )
-            
-            out_wavefront_sending_inductor.append(Data_Output_Merged.Wavefronts_Sending_Inductor[best_time_index[0],best_time_index[1]])
-            out_wavefront_sending_capacitor.append(Data_Output_Merged.Wavefronts_Sending_Capacitor[best_time_index[0],best_time_index[1]])
-            
-            out_wavefront_returning_inductor.append(Data_Output_Merged.Wavefronts_Returning_Inductor[best_time_index[0],best_time_index[1]])
-            out_wavefront_returning_capacitor.append(Data_Output_Merged.Wavefronts_Returning_Capacitor[best_time_index[0],best_time_index[1]])
-            
-            Marked[best_time_index[0],best_time_index[1]]  = 2
-        
-        latest_time = best_time
-        x_index, y_index = best_time_index
-    
-    # Crop merged to the maximum occuring index as it merged along each axis
+    out_indexes = np.asarray(out_indexes).reshape(-1,2)
     
-    max_x_index = np.max([x[0] for x in out_indexes])
+    max_x_index = np.max(out_indexes[:,0])
     max_x_index += 1
     
-    max_y_index = np.max([y[1] for y in out_indexes])
+    max_y_index = np.max(out_indexes[:,1])
     max_y_index += 1
     
     Data_Output_Merged.Time = Data_Output_Merged.Time[0:max_x_index,0:max_x_index]
@@ -594,48 +1130,363 @@ def Order_Data_Output_Merged(Data_Input : Data_Input_Storage , Data_Output_Merge
 
     Data_Output_Merged.Wavefronts_Returning_Inductor = Data_Output_Merged.Wavefronts_Returning_Inductor[0:max_x_index,0:max_y_index]
     Data_Output_Merged.Wavefronts_Returning_Capacitor = Data_Output_Merged.Wavefronts_Returning_Capacitor[0:max_x_index,0:max_y_index]
-            
-        
-    return Data_Output_Storage_Ordered(
-        out_time ,
-        out_voltage_inductor ,
-        out_current_inductor ,
-        out_voltage_capacitor ,
-        out_current_capacitor ,
-        out_wavefront_sending_inductor ,
-        out_wavefront_sending_capacitor ,
-        out_wavefront_returning_inductor ,
-        out_wavefront_returning_capacitor ,
-        True ,
-        out_indexes
-    )        
-
-def Full_Cycle(optional_data_input : Data_Input_Storage  = False,**input_values):
-    """Do full simualiton of the interface and produce a Data_Interface_Storage object with all the simualted data.
-    The simulation procedure is as follows: 
-    calcualte input vatiables -> generate wavefront with commutative merging -> multiplicatively merge these wavefronts -> chronologically order wavefronts. 
 
-    Is initialised using the same key-word arguments to intitalise Data_Input_Storage. OPTIONALLY a Data_Input_Storage array can be supplied directly to bypass internal creation of input data if it has been customized.
+def get_nodes_between_times(Data_Input : Data_Input_Storage, shape : tuple, start_time_units : int, stop_time_units : int = None):
+    """Gets the [L,C] indexes of the nodes of a fanout that occur from start_time_units up to and including stop_time_units. 
+    The time of node [L,C] is L x KC + C x KL GCD units (see :py:func:`get_time_array`) and increases with L in every column, 
+    so the nodes of a column are a range of L found in closed form. Only the nodes in the time window are generated, 
+    the cost is O(number of nodes found + number of columns).
+
+    :param Data_Input: the input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param shape: the shape of the fanout
+    :type shape: tuple
+    :param start_time_units: the earliest time of the nodes in GCD units
+    :type start_time_units: int
+    :param stop_time_units: the latest time of the nodes in GCD units, defaults to None for all later nodes of the fanout
+    :type stop_time_units: int, optional
+    :return: the L and C indexes of the nodes, column by column
+    :rtype: Tuple[np.ndarray[int], np.ndarray[int]]
+    """
+    KL = Data_Input.Inductor_LCM_Factor
+    KC = Data_Input.Capacitor_LCM_Factor
     
-    All values with the provided keys are of type string. 
-    This each input variable is converterted to a Decimal value to be used for precision calculations.
-    The possible parameters to change and their defualt values are as follows, parameters are all optional
+    number_of_rows, number_of_columns = shape
+    C_column = np.arange(number_of_columns)
     
-    :param L_impedance: Characteristic impedance of the inductor, assigned to self.Inductor_Impedance (default:'100')
-    :type L_impedance: String
-    :keyword L_time: The time delay of the inductor in seconds, assigned to self.Inductor_Time (default:'1')
-    :type L_time: String
-    :keyword L_length: The length of the inductor in meters, assigned to self.Inductor_Length (default:'1')
-    :type L_length: String
-    :keyword C_impedance: Characteristic impedance of the capacitor, assigned to self.Capacitor_Impedance (default:'1')
-    :type C_impedance: String
-    :keyword C_time: The time delay of the capacitor in seconds, assigned to self.Capacitor_Time (default:'1')
-    :type C_time: String
-    :keyword C_length: The length of the capacitor in meters, assigned to self.Capacitor_Length (default:'1')
-    :type C_length: String
-    :keyword V_source: The magnitude of the initial voltage excitation in volts, assigned to self.Voltage_Souce_Magnitude (default:'1')
-    :type V_source: String
-    :keyword number_periods: The number of periods as according to Lumped-Element LC-Osscilator solution. 
+    L_start = np.maximum(-((C_column*KL - start_time_units)//KC), 0)
+    if(stop_time_units is None):
+        L_stop = np.full(number_of_columns, number_of_rows)
+    else:
+        L_stop = np.minimum((stop_time_units - C_column*KL)//KC + 1, number_of_rows)
+    
+    number_of_nodes = np.maximum(L_stop - L_start, 0)
+    C_index = np.repeat(C_column, number_of_nodes)
+    L_index = np.arange(len(C_index)) - np.repeat(np.cumsum(number_of_nodes) - number_of_nodes - L_start, number_of_nodes)
+    
+    return L_index, C_index
+
+def get_ordered_indexes_sort(Data_Input : Data_Input_Storage, shape : tuple, start_time_units : int = 0):
+    """Orders the nodes of a merged fanout with an integer sort, see :py:func:`get_ordered_indexes`.
+    
+    The time of each node is the integer key L x KC + C x KL in GCD units (see :py:func:`get_time_array`), 
+    so the nodes are ordered in closed form by an integer sort of these keys. 
+    Only the nodes in the time window are found (see :py:func:`get_nodes_between_times`), no dense time fanout is made. 
+    Nodes with equal times are ordered with increasing L.
+
+    :param Data_Input: the input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param shape: the shape of the merged fanout
+    :type shape: tuple
+    :param start_time_units: the time in GCD units of the first node to order, defaults to 0
+    :type start_time_units: int, optional
+    :return: the L and C indexes of the ordered nodes
+    :rtype: Tuple[np.ndarray[int], np.ndarray[int]]
+    """
+    KL = Data_Input.Inductor_LCM_Factor
+    KC = Data_Input.Capacitor_LCM_Factor
+    stop_time_units = math.ceil(Data_Input.Simulation_Stop_Time/Data_Input.GCD)
+    
+    # ordering includes the first node at or after the stop time, if the fanout extends that far
+    C_column = np.arange(shape[1])
+    L_first = np.maximum(-((C_column*KL - stop_time_units)//KC), 0)
+    is_in_fanout = L_first < shape[0]
+    
+    is_after_stop = bool(np.any(is_in_fanout))
+    if(is_after_stop):
+        last_time_units = np.min(L_first[is_in_fanout]*KC + C_column[is_in_fanout]*KL)
+    else:
+        last_time_units = stop_time_units
+    
+    L_index, C_index = get_nodes_between_times(Data_Input, shape, start_time_units, last_time_units)
+    Time_Units = get_time_array(Data_Input, L_index, C_index, 'units')
+    event_order = np.lexsort((L_index, Time_Units))
+    
+    number_events = np.count_nonzero(Time_Units < stop_time_units) + int(is_after_stop)
+    event_order = event_order[0:number_events]
+    
+    return L_index[event_order], C_index[event_order]
+
+def get_ordered_indexes_heap(Data_Input : Data_Input_Storage, shape : tuple, start_time_units : int = 0):
+    """Orders the nodes of a merged fanout with a binary heap, see :py:func:`get_ordered_indexes`.
+    
+    Times increase along the L-axis of every column of the merged fanout, so the next event is always the next node of a column that has been ordered. 
+    A candidate node of each column is kept in a binary heap keyed by its integer time in GCD units (L x KC + C x KL, see :py:func:`get_time_array`), 
+    ordering E events of a fanout with C columns is therefore O(E log C) and does not compare Decimal times. 
+    Events are found one at a time, the time window is not calculated beforehand. Nodes with equal times are ordered with increasing L.
+
+    :param Data_Input: the input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param shape: the shape of the merged fanout
+    :type shape: tuple
+    :param start_time_units: the time in GCD units of the first node to order, defaults to 0
+    :type start_time_units: int, optional
+    :return: the L and C indexes of the ordered nodes
+    :rtype: Tuple[np.ndarray[int], np.ndarray[int]]
+    """
+    KL = Data_Input.Inductor_LCM_Factor
+    KC = Data_Input.Capacitor_LCM_Factor
+    stop_time_units = math.ceil(Data_Input.Simulation_Stop_Time/Data_Input.GCD)
+    
+    number_of_rows, number_of_columns = shape
+    
+    # heap of candidate events, the first node of each column at or after the start time, entries are (time units, L, C)
+    options = []
+    for C in range(0,number_of_columns):
+        L = max(-((C*KL - start_time_units)//KC), 0)
+        if(L < number_of_rows):
+            options.append((L*KC + C*KL, L, C))
+    heapq.heapify(options)
+    
+    out_indexes = []
+    while len(options) > 0:
+        # get best option
+        best_time_units, L, C = options[0]
+        out_indexes.append((L, C))
+        
+        # ordering stops at the first event at or after the stop time
+        if(best_time_units >= stop_time_units):
+            break
+        
+        # the next node of the column replaces the ordered node
+        if(L+1 < number_of_rows):
+            heapq.heapreplace(options, (best_time_units + KC, L+1, C))
+        else:
+            heapq.heappop(options)
+    
+    out_indexes = np.array(out_indexes, dtype=int).reshape(-1,2)
+    
+    return out_indexes[:,0], out_indexes[:,1]
+
+#: The methods available for ordering the events of merged fanouts in :py:func:`get_ordered_indexes`
+ordering_methods = dict([
+    ('sort',get_ordered_indexes_sort),
+    ('heap',get_ordered_indexes_heap)
+])
+
+def get_ordered_indexes(Data_Input : Data_Input_Storage, shape : tuple, start_time_units : int = 0, ordering : str = 'sort'):
+    """Gets the [L,C] indexes of the nodes of a merged fanout in chronological order, 
+    from the first node at or after start_time_units up to and including the first node at or after the stop time.
+    Both ordering methods produce the same order, nodes with equal times are ordered with increasing L:
+    
+    - 'sort' orders the nodes of the time window with a single integer sort, see :py:func:`get_ordered_indexes_sort`.
+    - 'heap' orders the nodes one at a time with a heap of the columns, see :py:func:`get_ordered_indexes_heap`.
+
+    :param Data_Input: the input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param shape: the shape of the merged fanout
+    :type shape: tuple
+    :param start_time_units: the time in GCD units of the first node to order, defaults to 0
+    :type start_time_units: int, optional
+    :param ordering: the ordering method, 'sort' or 'heap', defaults to 'sort'
+    :type ordering: str, optional
+    :raises ValueError: if the ordering method is not one of the available options
+    :return: the L and C indexes of the ordered nodes
+    :rtype: Tuple[np.ndarray[int], np.ndarray[int]]
+    """
+    if (ordering not in ordering_methods):
+        raise ValueError(f"Ordering '{ordering}' is not an option, options are: {list(ordering_methods.keys())}")
+    
+    return ordering_methods[ordering](Data_Input, shape, start_time_units)
+
+def get_ordered_wavefronts(Data_Input : Data_Input_Storage, wavefront_fanout, L_index : np.ndarray, C_index : np.ndarray, is_Inductor : bool, is_Sending : bool):
+    """Gathers the wavefronts of the provided nodes of a merged fanout into a one-dimensional Wavefront_Array. 
+    Only the magnitudes are gathered, wavefront objects are created when the array is indexed. 
+    Fanouts of wavefront objects (the 'decimal' engine without multiplicative merging) are gathered as their Decimal magnitudes.
+
+    :param Data_Input: the input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param wavefront_fanout: the merged fanout of wavefronts
+    :type wavefront_fanout: Wavefront_Array, Triangular_Array or np.ndarray[Wavefront]
+    :param L_index: the L co-ordinates of the nodes
+    :type L_index: np.ndarray[int]
+    :param C_index: the C co-ordinates of the nodes
+    :type C_index: np.ndarray[int]
+    :param is_Inductor: if the wavefronts travel in the inductor, else the capacitor
+    :type is_Inductor: bool
+    :param is_Sending: if the wavefronts are sent from the interface, else they are returning to it
+    :type is_Sending: bool
+    :return: the wavefronts of the nodes
+    :rtype: Wavefront_Array
+    """
+    if isinstance(wavefront_fanout, Wavefront_Array):
+        return wavefront_fanout[L_index,C_index]
+    
+    wavefronts = np.asarray(wavefront_fanout[L_index,C_index])
+    return Wavefront_Array(Data_Input,is_Inductor,is_Sending,get_voltage_array(wavefronts),get_current_array(wavefronts),L_index,C_index)
+
+def gather_ordered_data(Data_Input : Data_Input_Storage , Data_Output_Merged : Data_Output_Storage, L_index : np.ndarray, C_index : np.ndarray):
+    """Gathers the events of the provided nodes of the merged data into ordered data, each field in a single fancy-indexing operation. 
+    The times and interconnect changes are stored in the typed Events array, and Decimal interconnect changes are also kept exactly 
+    (see :py:class:`Wavefront_Storage.Data_Output_Storage_Ordered`). The merged data is not altered.
+
+    :param Data_Input: the input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param Data_Output_Merged: the merged data
+    :type Data_Output_Merged: Data_Output_Storage
+    :param L_index: the L co-ordinates of the events in chronological order
+    :type L_index: np.ndarray[int]
+    :param C_index: the C co-ordinates of the events in chronological order
+    :type C_index: np.ndarray[int]
+    :return: ordered merged data
+    :rtype: Data_Output_Storage_Ordered
+    """
+    Events = np.empty(len(L_index), dtype=ordered_event_dtype)
+    Events['Time'] = np.asarray(Data_Output_Merged.Time[L_index,C_index], dtype=np.float64)
+    Events['L'] = L_index
+    Events['C'] = C_index
+    
+    # Decimal interconnect changes are kept exactly
+    Exact = dict()
+    for name in interconnect_value_dtype.names:
+        values = np.asarray(getattr(Data_Output_Merged,name)[L_index,C_index])
+        Events[name] = np.asarray(values, dtype=np.float64)
+        if values.dtype == object:
+            Exact[name] = values
+    
+    ordered_wavefronts = [
+        get_ordered_wavefronts(Data_Input,Data_Output_Merged.Wavefronts_Sending_Inductor,L_index,C_index,True,True),
+        get_ordered_wavefronts(Data_Input,Data_Output_Merged.Wavefronts_Sending_Capacitor,L_index,C_index,False,True),
+        get_ordered_wavefronts(Data_Input,Data_Output_Merged.Wavefronts_Returning_Inductor,L_index,C_index,True,False),
+        get_ordered_wavefronts(Data_Input,Data_Output_Merged.Wavefronts_Returning_Capacitor,L_index,C_index,False,False)
+    ]
+    
+    return Data_Output_Storage_Ordered(Events, *ordered_wavefronts, True, Exact or None)
+
+def Order_Data_Output_Merged(Data_Input : Data_Input_Storage , Data_Output_Merged : Data_Output_Storage, ordering : str = 'sort'):
+    """Order the merged wavefront data into single dimension chronologically occuring 'lists'.
+    
+    The time of every node of the merged fanout is known in closed form, so the chronological order of the events 
+    is found from their integer time keys, with a stable integer sort or a heap (see :py:func:`get_ordered_indexes`), 
+    and each field is then gathered in a single fancy-indexing operation (see :py:func:`gather_ordered_data`). 
+    The ordered wavefronts are one-dimensional Wavefront_Arrays, wavefront objects are only created when they are indexed.
+    The merged data is then cropped in place to the maximum occuring index of the events along each axis (see :py:func:`crop_data_output_merged`).
+
+    :param Data_Input: the input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param Data_Output_Merged: the merged data to be ordered
+    :type Data_Output_Merged: Data_Output_Storage
+    :param ordering: the ordering method, 'sort' or 'heap' (see :py:func:`get_ordered_indexes`), defaults to 'sort'
+    :type ordering: str, optional
+    :raises ValueError: if the ordering method is not one of the available options
+    :raises warnings.warn: should be used on a merged data storage object, ekse results may be incorrect
+    :return: ordered merged data
+    :rtype: Data_Output_Storage_Ordered
+    """
+    if (Data_Output_Merged.has_merged == False):
+        raise warnings.warn("Provided Data_Output_Storage object to be ordered has not been merged yet. This can produce incorrect results if merging is not accounted for.")
+    
+    L_index, C_index = get_ordered_indexes(Data_Input, Data_Output_Merged.Voltage_Interconnect_Inductor.shape, 0, ordering)
+    data_output_ordered = gather_ordered_data(Data_Input, Data_Output_Merged, L_index, C_index)
+    
+    # Crop merged to the maximum occuring index as it merged along each axis
+    crop_data_output_merged(Data_Output_Merged,np.stack((L_index, C_index), axis=1))
+    
+    return data_output_ordered
+
+def iter_events(Interface : Data_Interface_Storage, start_time = 0, stop_time = None):
+    """Lazily yields the chronological interconnect events of an interface directly from its merged fanouts, 
+    without creating the ordered arrays of a Data_Output_Storage_Ordered object.
+    
+    Each column C of the merged fanout is a sequence of events with increasing times (L x KC + C x KL GCD units, see :py:func:`get_time_array`), 
+    so the columns are merged lazily with :py:func:`heapq.merge`. Only a single candidate event of each column is held at a time. 
+    Events with equal times are yielded with increasing L, as in :py:func:`Order_Data_Output_Merged`.
+
+    :param Interface: the simulated interface
+    :type Interface: Data_Interface_Storage
+    :param start_time: the time of the first event to yield, defaults to 0
+    :type start_time: str, Decimal or float, optional
+    :param stop_time: the time of the last event to yield, defaults to the simulation stop time.
+        Events are only available up to the extent of the merged fanouts.
+    :type stop_time: str, Decimal or float, optional
+    :return: a generator of (Time, Voltage_Interconnect_Inductor, Current_Interconnect_Inductor, Voltage_Interconnect_Capacitor, Current_Interconnect_Capacitor, [L,C]) 
+        tuples of events that occur from start_time up to and including stop_time
+    :rtype: Generator[Tuple]
+    
+    .. code-block ::
+    
+        from Wavefront_Generation import Full_Cycle, iter_events
+        
+        interface_data = Full_Cycle(L_time = '3.6',C_time = '3.2', Simulation_stop_time = '1000')
+        
+        # voltage changes of the inductor interconnect in a window of the simulation
+        for time, voltage_inductor, _, _, _, _ in iter_events(interface_data, '500', '600'):
+            print(time, voltage_inductor)
+    """
+    Data_Input = Interface.data_input
+    Data_Output_Merged = Interface.data_output_multiplicative
+    
+    KL = Data_Input.Inductor_LCM_Factor
+    KC = Data_Input.Capacitor_LCM_Factor
+    
+    if(stop_time is None):
+        stop_time = Data_Input.Simulation_Stop_Time
+    start_time_units = max(math.ceil(Decimal(str(start_time))/Data_Input.GCD), 0)
+    stop_time_units = math.floor(Decimal(str(stop_time))/Data_Input.GCD)
+    
+    # times are of the same type as the merged time fanout
+    if(np.asarray(Data_Output_Merged.Time).dtype == object):
+        L_time, C_time = Data_Input.Inductor_Time*2, Data_Input.Capacitor_Time*2
+    else:
+        L_time, C_time = float(Data_Input.Inductor_Time*2), float(Data_Input.Capacitor_Time*2)
+    
+    x_size, y_size = Data_Output_Merged.Voltage_Interconnect_Inductor.shape
+    number_of_layers = getattr(Data_Output_Merged.Voltage_Interconnect_Inductor, 'number_of_layers', x_size + y_size)
+    
+    def column_events(C_index):
+        # commutative fanouts only store the nodes of the simulated layers
+        L_stop = min(x_size, number_of_layers - C_index)
+        L_start = max(-((C_index*KL - start_time_units)//KC), 0)
+        
+        for L_index in range(L_start, L_stop):
+            yield (L_index*KC + C_index*KL, L_index, C_index)
+    
+    for time_units, L_index, C_index in heapq.merge(*[column_events(C_index) for C_index in range(y_size)]):
+        if(time_units > stop_time_units):
+            return
+        
+        yield (
+            L_index*L_time + C_index*C_time,
+            Data_Output_Merged.Voltage_Interconnect_Inductor[L_index,C_index],
+            Data_Output_Merged.Current_Interconnect_Inductor[L_index,C_index],
+            Data_Output_Merged.Voltage_Interconnect_Capacitor[L_index,C_index],
+            Data_Output_Merged.Current_Interconnect_Capacitor[L_index,C_index],
+            [L_index,C_index]
+        )
+
+#: The engines available for commutative generation in :py:func:`Full_Cycle`
+commutative_generation_engines = dict([
+    ('decimal',Generate_Wavefronts_Commutatively),
+    ('numpy',Generate_Wavefronts_Commutatively_Numpy),
+    ('exact',Generate_Wavefronts_Commutatively_Exact)
+])
+
+def Full_Cycle(optional_data_input : Data_Input_Storage  = False, engine : str = 'decimal', is_Direct_Merging : bool = False, **input_values):
+    """Do full simualiton of the interface and produce a Data_Interface_Storage object with all the simualted data.
+    The simulation procedure is as follows: 
+    calcualte input vatiables -> generate wavefront with commutative merging -> multiplicatively merge these wavefronts -> chronologically order wavefronts. 
+
+    Is initialised using the same key-word arguments to intitalise Data_Input_Storage. OPTIONALLY a Data_Input_Storage array can be supplied directly to bypass internal creation of input data if it has been customized.
+    
+    All values with the provided keys are of type string. 
+    This each input variable is converterted to a Decimal value to be used for precision calculations.
+    The possible parameters to change and their defualt values are as follows, parameters are all optional
+    
+    :param L_impedance: Characteristic impedance of the inductor, assigned to self.Inductor_Impedance (default:'100')
+    :type L_impedance: String
+    :keyword L_time: The time delay of the inductor in seconds, assigned to self.Inductor_Time (default:'1')
+    :type L_time: String
+    :keyword L_length: The length of the inductor in meters, assigned to self.Inductor_Length (default:'1')
+    :type L_length: String
+    :keyword C_impedance: Characteristic impedance of the capacitor, assigned to self.Capacitor_Impedance (default:'1')
+    :type C_impedance: String
+    :keyword C_time: The time delay of the capacitor in seconds, assigned to self.Capacitor_Time (default:'1')
+    :type C_time: String
+    :keyword C_length: The length of the capacitor in meters, assigned to self.Capacitor_Length (default:'1')
+    :type C_length: String
+    :keyword V_source: The magnitude of the initial voltage excitation in volts, assigned to self.Voltage_Souce_Magnitude (default:'1')
+    :type V_source: String
+    :keyword number_periods: The number of periods as according to Lumped-Element LC-Osscilator solution. 
         Used to calculate the simulation stop time if provided. Overidden if 'Simulation_stop_time' is provided (default:'1')
     :type number_periods: String
     :keyword Load_impedance: The magnitude of the load resistance, if left inf the load is ignored and the interface takes form of an LC-Osscilator.
@@ -645,6 +1496,13 @@ def Full_Cycle(optional_data_input : Data_Input_Storage  = False,**input_values)
     :type Simulation_stop_time: String
     :keyword show_about: Indicates information about the calcualted variabels must be printed (default:True)
     :type show_about: Boolean
+    :param engine: The engine used for commutative generation, options are 'decimal' (wavefront objects), 'exact' (Decimal magnitude arrays and integer time units, see :py:func:`Generate_Wavefronts_Commutatively_Exact`) 
+        or 'numpy' (float64 magnitude arrays, see :py:func:`Generate_Wavefronts_Commutatively_Numpy`). (default:'decimal')
+    :type engine: str
+    :param is_Direct_Merging: generate the multiplicatively merged fanouts directly with :py:func:`Generate_Wavefronts_Merged`, 
+        the commutative fanouts are then not stored and data_output_commutative is None. Only available for the 'numpy' and 'exact' engines. (default:False)
+    :type is_Direct_Merging: bool
+    :raises ValueError: if the engine is not one of the available options
 
     :return: Interface Data object
     :rtype: Data_Interface_Storage
@@ -677,14 +1535,732 @@ def Full_Cycle(optional_data_input : Data_Input_Storage  = False,**input_values)
     else:
         raise TypeError("otional input data is of incorrect type. Either supply values using ke-word arguments or supply a Data_Input_Storag object.")
     
-    data_output_commutative = Generate_Wavefronts_Commutatively(data_input)
-    data_output_merged = Higher_Order_Merging(data_input,data_output_commutative)
+    if (engine not in commutative_generation_engines):
+        raise ValueError(f"Engine '{engine}' is not an option, options are: {list(commutative_generation_engines.keys())}")
+    
+    if(is_Direct_Merging):
+        data_output_commutative = None
+        data_output_merged = Generate_Wavefronts_Merged(data_input,engine)
+        frontier = None
+    else:
+        data_output_commutative = commutative_generation_engines[engine](data_input)
+        data_output_merged = Higher_Order_Merging(data_input,data_output_commutative)
+        # kept before the merged data is cropped, so the interface can be extended (see Extend_Interface)
+        frontier = get_interface_frontier(data_input,data_output_commutative,data_output_merged)
+    
     data_output_ordered = Order_Data_Output_Merged(data_input,data_output_merged)
     
-    return Data_Interface_Storage(data_input,data_output_commutative,data_output_merged,data_output_ordered)
+    return Data_Interface_Storage(data_input,data_output_commutative,data_output_merged,data_output_ordered,frontier)
+
+def get_fanout_frontier(Data_Input : Data_Input_Storage, data_output_commutative : Data_Output_Storage):
+    """Gets the last layer of a commutative fanout, the frontier from where generation can continue.
+    The returning wavefronts of the last layer are not stored in the fanout, these are calculated from its sending wavefronts.
+
+    :param Data_Input: input data of the fanout
+    :type Data_Input: Data_Input_Storage
+    :param data_output_commutative: commutative fanouts of Wavefront_Arrays or wavefront objects
+    :type data_output_commutative: Data_Output_Storage
+    :return: the last layer of the fanout, layer Number_of_Layers-1
+    :rtype: Data_Layer_Storage
+    """
+    layer_number = Data_Input.Number_of_Layers - 1
+    L_index = np.arange(layer_number+1)
+    C_index = layer_number - L_index
+    
+    layer_values = get_fanout_node_values(data_output_commutative, Triangular_Array.get_flat_index(L_index, C_index))
+    layer = Data_Layer_Storage(layer_number, L_index, C_index, get_time_array(Data_Input,L_index,C_index,'units'), *layer_values)
+    
+    if(data_output_commutative.Time.dtype == object):
+        # Decimal magnitudes, use the event solvers directly
+        layer.Voltage_Returning_Inductor, layer.Current_Returning_Inductor = Data_Input.Termination_Event_Solver_Inductor(layer.Voltage_Sending_Inductor,layer.Current_Sending_Inductor)
+        layer.Voltage_Returning_Capacitor, layer.Current_Returning_Capacitor = Data_Input.Termination_Event_Solver_Capacitor(layer.Voltage_Sending_Capacitor,layer.Current_Sending_Capacitor)
+    else:
+        termination = get_layer_transfer_operator(Data_Input)['termination']
+        sending = np.stack((layer.Voltage_Sending_Inductor,layer.Current_Sending_Inductor,layer.Voltage_Sending_Capacitor,layer.Current_Sending_Capacitor),axis=1)
+        returning = sending @ termination.T
+        layer.Voltage_Returning_Inductor, layer.Current_Returning_Inductor = returning[:,0], returning[:,1]
+        layer.Voltage_Returning_Capacitor, layer.Current_Returning_Capacitor = returning[:,2], returning[:,3]
+    
+    return layer
+
+def get_interface_frontier(Data_Input : Data_Input_Storage, data_output_commutative : Data_Output_Storage, data_output_merged : Data_Output_Storage):
+    """Gets the state a simulated interface is extended from, see :py:class:`Wavefront_Storage.Data_Frontier_Storage`. 
+    Made by :py:func:`Full_Cycle`, and rebuilt by :py:func:`Extend_Interface` for interfaces that do not keep it (e.g. loaded or rescaled interfaces).
+
+    :param Data_Input: input data of the interface
+    :type Data_Input: Data_Input_Storage
+    :param data_output_commutative: the commutative fanouts of the interface
+    :type data_output_commutative: Data_Output_Storage
+    :param data_output_merged: the multiplicatively merged fanouts of the commutative fanouts, before they are cropped
+    :type data_output_merged: Data_Output_Storage
+    :return: the last layer of the commutative fanout and the uncropped merged fanouts
+    :rtype: Data_Frontier_Storage
+    """
+    if(Data_Input.is_Higher_Merging):
+        merged_fanouts = dict(zip(fanout_layer_fields, get_fanout_magnitude_arrays(data_output_merged)))
+    else:
+        merged_fanouts = None
+    
+    return Data_Frontier_Storage(get_fanout_frontier(Data_Input,data_output_commutative), merged_fanouts)
+
+def extend_merged_fanouts(Data_Input : Data_Input_Storage, Data_Input_Extended : Data_Input_Storage, data_output_commutative : Data_Output_Storage, frontier : Data_Frontier_Storage, cropped_shape : tuple):
+    """Extends the uncropped merged fanouts of a frontier in place to the commutative fanouts of an extended simulation. 
+    A merged node sums the commutative nodes that occur at its time, nodes that occur before the previous stop time only sum nodes of earlier layers, 
+    so they are complete and are kept. Of the later nodes only those that are ordered, or lie within the crop of the extended merged data (see :py:func:`crop_data_output_merged`), 
+    are merged from the extended commutative fanouts (see :py:func:`merge_fanout_nodes`), the others are merged by later extensions when they are needed. 
+    The used merged values are therefore identical to merging the extended fanouts with :py:func:`Higher_Order_Merging`.
+
+    :param Data_Input: the input data of the frontier
+    :type Data_Input: Data_Input_Storage
+    :param Data_Input_Extended: the input data with a later stop time
+    :type Data_Input_Extended: Data_Input_Storage
+    :param data_output_commutative: the extended commutative fanouts of Wavefront_Arrays
+    :type data_output_commutative: Data_Output_Storage
+    :param frontier: the frontier of the simulation, its merged fanouts are extended in place
+    :type frontier: Data_Frontier_Storage
+    :param cropped_shape: the shape of the cropped merged data of the simulation before it is extended
+    :type cropped_shape: tuple
+    :return: the uncropped merged data of the extended simulation, and the shape it is cropped to
+    :rtype: Tuple (Data_Output_Storage, tuple)
+    """
+    fanouts = get_fanout_magnitude_arrays(data_output_commutative)
+    fill_value = fanouts[1].fill_value
+    shape = (Data_Input_Extended.Number_of_Layers+1, min(Data_Input_Extended.Capacitor_LCM_Factor,Data_Input_Extended.Number_of_Layers+1))
+    
+    merged_fanouts = frontier.merged_fanouts
+    time_format = 'decimal' if merged_fanouts['Time'].dtype == object else 'float'
+    
+    for field in fanout_layer_fields:
+        merged_fanout = merged_fanouts[field]
+        number_of_rows, number_of_columns = merged_fanout.shape
+        
+        if(number_of_columns < shape[1]):
+            # columns are only added while the fanout is narrower than KC, merged times follow from the grid co-ordinates
+            if(field == 'Time'):
+                buffer = get_time_merged(Data_Input_Extended,shape,time_format)
+            else:
+                buffer = np.full(shape, fill_value, dtype=merged_fanout.dtype)
+                buffer[0:number_of_rows, 0:number_of_columns] = merged_fanout
+            frontier.buffers[field] = merged_fanouts[field] = buffer
+        else:
+            if(field == 'Time'):
+                new_rows = get_time_array(Data_Input_Extended,np.arange(number_of_rows,shape[0]).reshape(-1,1),np.arange(shape[1]).reshape(1,-1),time_format)
+            else:
+                new_rows = np.full((shape[0] - number_of_rows, shape[1]), fill_value, dtype=merged_fanout.dtype)
+            frontier.buffers[field], merged_fanouts[field] = append_to_buffer(frontier.buffers.get(field), merged_fanout, new_rows)
+    
+    # merged nodes do not coincide in time, all ordered nodes are events and set the crop with the previous events
+    start_time_units = math.ceil(Data_Input.Simulation_Stop_Time/Data_Input.GCD)
+    ordered_L_index, ordered_C_index = get_ordered_indexes(Data_Input_Extended, shape, start_time_units)
+    cropped_shape = (max(cropped_shape[0], np.max(ordered_L_index, initial=-1)+1), max(cropped_shape[1], np.max(ordered_C_index, initial=-1)+1))
+    
+    L_index, C_index = get_nodes_between_times(Data_Input_Extended, cropped_shape, start_time_units)
+    for field, merged_values in zip(fanout_layer_fields[1:], merge_fanout_nodes(Data_Input_Extended,fanouts[1:],L_index,C_index)):
+        merged_fanouts[field][L_index,C_index] = merged_values
+    
+    return get_data_output_from_fanouts(Data_Input_Extended,merged_fanouts,True), cropped_shape
+
+def extend_ordered_data(Data_Input : Data_Input_Storage, Data_Input_Extended : Data_Input_Storage, data_output_ordered : Data_Output_Storage_Ordered, Data_Output_Merged : Data_Output_Storage):
+    """Extends chronologically ordered data in place to the stop time of the extended input data. 
+    Events that occur before the previous stop time are complete and are kept, 
+    only the events from the previous stop time are ordered (see :py:func:`get_ordered_indexes`) and gathered from the uncropped merged data of the extended simulation. 
+    These are appended to the kept events, see :py:meth:`Wavefront_Storage.Data_Output_Storage_Ordered.append_events`.
+
+    :param Data_Input: the input data of the ordered data
+    :type Data_Input: Data_Input_Storage
+    :param Data_Input_Extended: the input data with a later stop time
+    :type Data_Input_Extended: Data_Input_Storage
+    :param data_output_ordered: the ordered data to extend
+    :type data_output_ordered: Data_Output_Storage_Ordered
+    :param Data_Output_Merged: the uncropped merged data of the extended simulation
+    :type Data_Output_Merged: Data_Output_Storage
+    :return: the extended ordered data
+    :rtype: Data_Output_Storage_Ordered
+    """
+    start_time_units = math.ceil(Data_Input.Simulation_Stop_Time/Data_Input.GCD)
+    
+    # ordered data holds the events before the previous stop time, and the first event at or after it
+    number_kept = len(data_output_ordered.Events)
+    if(number_kept > 0 and get_time_array(Data_Input, int(data_output_ordered.Events['L'][-1]), int(data_output_ordered.Events['C'][-1]), 'units') >= start_time_units):
+        number_kept -= 1
+    
+    # new events start at the previous stop time, and continue to the first event at or after the new stop time
+    new_L_index, new_C_index = get_ordered_indexes(Data_Input_Extended, Data_Output_Merged.Voltage_Interconnect_Inductor.shape, start_time_units)
+    data_output_ordered.append_events(number_kept, gather_ordered_data(Data_Input_Extended, Data_Output_Merged, new_L_index, new_C_index))
+    
+    return data_output_ordered
+
+def Extend_Interface(Interface : Data_Interface_Storage, Simulation_stop_time):
+    """Extends a simulated interface in place to a later stop time, continuing from where the simulation stopped. 
+    The interface keeps the state it is continued from (see :py:class:`Wavefront_Storage.Data_Frontier_Storage`): 
+    the last layer of the commutative fanout, and the merged fanouts before they were cropped. 
+    
+    Generation continues from the last layer and the new layers are appended to the commutative fanouts, 
+    only merged nodes from the previous stop time are merged again (see :py:func:`extend_merged_fanouts`), 
+    and only events from the previous stop time are ordered and appended to the ordered data (see :py:func:`extend_ordered_data`). 
+    The arrays are grown in over-allocated buffers, so the cost of an extension follows the number of new nodes and events, not the length of the whole simulation.
+    The results are identical to simulating the interface to the later stop time directly.
+    
+    Commutative fanouts of wavefront objects are converted to wavefront arrays with Decimal magnitudes on their first extension,
+    which are continued with the 'exact' engine. Fanouts of the 'numpy' engine are continued with the 'numpy' engine. 
+    Customised event solvers of the interface's input data are kept. Interfaces that do not keep a frontier (e.g. loaded or rescaled interfaces) 
+    rebuild it from their commutative fanouts on their first extension.
+
+    :param Interface: the simulated interface, altered in place
+    :type Interface: Data_Interface_Storage
+    :param Simulation_stop_time: the new simulation stop time, must be later than the current stop time
+    :type Simulation_stop_time: str or Decimal
+    :raises ValueError: if the commutative fanouts of the interface were not stored (see is_Direct_Merging of :py:func:`Full_Cycle`)
+    :return: the interface simulated to the new stop time
+    :rtype: Data_Interface_Storage
+    
+    .. code-block::
+        :caption: simulate an interface further
+    
+        from Wavefront_Generation import Full_Cycle, Extend_Interface
+
+        interface_data = Full_Cycle(L_time = '3.6',C_time = '3.2',Simulation_stop_time = '50')
+        Extend_Interface(interface_data,'100')
+    """
+    data_input = Interface.data_input
+    data_input_extended = data_input.get_extended(Simulation_stop_time)
+    
+    if(Interface.data_output_commutative is None):
+        raise ValueError("Interface cannot be extended, its commutative fanouts were not stored as it was generated with direct merging.")
+    
+    if(not isinstance(Interface.data_output_commutative.Wavefronts_Sending_Inductor, Wavefront_Array)):
+        Interface.data_output_commutative = convert_to_wavefront_arrays(data_input,Interface.data_output_commutative)
+    
+    frontier = Interface.frontier
+    if(frontier is None or frontier.layer.layer_number != data_input.Number_of_Layers - 1):
+        frontier = get_interface_frontier(data_input,Interface.data_output_commutative,Higher_Order_Merging(data_input,Interface.data_output_commutative))
+    
+    if(Interface.data_output_commutative.Time.dtype == object):
+        generate_layers = Generate_Wavefront_Layers_Exact
+        fill_value = Decimal('0')
+    else:
+        generate_layers = Generate_Wavefront_Layers_Numpy
+        fill_value = 0.0
+    
+    # continue generation from the last layer, its returning wavefronts are now stored
+    new_layers = [frontier.layer] + list(generate_layers(data_input_extended,frontier.layer))
+    data_output_commutative = store_wavefront_layers(data_input_extended,new_layers,fill_value,Interface.data_output_commutative)
+    
+    number_previous_events = len(Interface.data_output_ordered.Events)
+    cropped_shape = Interface.data_output_multiplicative.Voltage_Interconnect_Inductor.shape
+    
+    if(not data_input_extended.is_Higher_Merging):
+        # merged fanouts are the commutative fanouts
+        data_output_merged = Higher_Order_Merging(data_input_extended,data_output_commutative)
+    elif(frontier.merged_fanouts is None):
+        # multiplicative merging starts with the extension
+        data_output_merged = Higher_Order_Merging(data_input_extended,data_output_commutative)
+        frontier.merged_fanouts = dict(zip(fanout_layer_fields, get_fanout_magnitude_arrays(data_output_merged)))
+    else:
+        data_output_merged, cropped_shape = extend_merged_fanouts(data_input,data_input_extended,data_output_commutative,frontier,cropped_shape)
+    
+    data_output_ordered = extend_ordered_data(data_input,data_input_extended,Interface.data_output_ordered,data_output_merged)
+    
+    # kept events lie within the previous crop, the events after them are at most the last previous event and the new events
+    new_Events = data_output_ordered.Events[max(number_previous_events-1,0):]
+    crop_data_output_merged(data_output_merged,[[max(cropped_shape[0]-1,np.max(new_Events['L'],initial=0)), max(cropped_shape[1]-1,np.max(new_Events['C'],initial=0))]])
+    
+    frontier.layer = new_layers[-1]
+    
+    Interface.data_input = data_input_extended
+    Interface.data_output_commutative = data_output_commutative
+    Interface.data_output_multiplicative = data_output_merged
+    Interface.frontier = frontier
+    
+    return Interface
+
+def rescale_values(values, scale_factor : Decimal):
+    """Scales values stored in any of the fanout or ordered formats of the simulation. 
+    Handles Triangular_Arrays, np.ndarrays and lists of Decimal or float entries, 
+    the values are multiplied with a float or Decimal scale factor to match their type.
+
+    :param values: the values to scale
+    :type values: Triangular_Array, np.ndarray or list
+    :param scale_factor: the factor the values are multiplied with
+    :type scale_factor: Decimal
+    :return: the scaled values, in the same format as provided
+    :rtype: Triangular_Array, np.ndarray or list
+    """
+    if isinstance(values, Triangular_Array):
+        values_scaled = copy.copy(values)
+        values_scaled.data = rescale_values(values.data,scale_factor)
+        return values_scaled
+    
+    elif isinstance(values, np.ndarray):
+        if values.dtype != object:
+            return values * float(scale_factor)
+        return values * scale_factor
+    
+    else:
+        return [value * scale_factor if isinstance(value, Decimal) else value * float(scale_factor) for value in values]
+
+def rescale_wavefront(wavefront : Wavefront, Data_Input_Similar : Data_Input_Storage, scale_factors : dict):
+    """Creates the wavefront of a similar interface from a wavefront.
+
+    :param wavefront: the wavefront to rescale
+    :type wavefront: Wavefront
+    :param Data_Input_Similar: input data of the similar interface
+    :type Data_Input_Similar: Data_Input_Storage
+    :param scale_factors: the 'time', 'voltage' and 'current' scale factors, see :py:meth:`Wavefront_Storage.Data_Input_Storage.get_similarity_factors`
+    :type scale_factors: dict
+    :return: the rescaled wavefront
+    :rtype: Wavefront (same as wavefront)
+    """
+    if isinstance(wavefront, Wavefront_Kintetic):
+        return type(wavefront).from_magnitudes(
+            Data_Input_Similar, 
+            wavefront.time_start * scale_factors['time'], 
+            wavefront.position_start == 0, 
+            wavefront.magnitude_voltage * scale_factors['voltage'],
+            wavefront.magnitude_current * scale_factors['current']
+        )
+    
+    # placeholder wavefronts at t=0
+    return copy.copy(wavefront)
+
+def rescale_wavefronts(wavefronts, Data_Input_Similar : Data_Input_Storage, scale_factors : dict):
+    """Creates the wavefronts of a similar interface from wavefronts stored in any of the fanout or ordered formats of the simulation.
+    Handles Wavefront_Arrays, Triangular_Arrays, np.ndarrays and lists of wavefronts.
+
+    :param wavefronts: the wavefronts to rescale
+    :type wavefronts: Wavefront_Array, Triangular_Array, np.ndarray or list
+    :param Data_Input_Similar: input data of the similar interface
+    :type Data_Input_Similar: Data_Input_Storage
+    :param scale_factors: the 'time', 'voltage' and 'current' scale factors, see :py:meth:`Wavefront_Storage.Data_Input_Storage.get_similarity_factors`
+    :type scale_factors: dict
+    :return: the rescaled wavefronts, in the same format as provided
+    :rtype: Wavefront_Array, Triangular_Array, np.ndarray or list
+    """
+    if isinstance(wavefronts, Wavefront_Array):
+        # times are implied by the grid co-ordinates and the input data
+        return Wavefront_Array(Data_Input_Similar, wavefronts.is_Inductor, wavefronts.is_Sending, 
+                               rescale_values(wavefronts.magnitude_voltage,scale_factors['voltage']), 
+                               rescale_values(wavefronts.magnitude_current,scale_factors['current']), 
+                               wavefronts.L_index, wavefronts.C_index)
+    
+    elif isinstance(wavefronts, Triangular_Array):
+        wavefronts_rescaled = copy.copy(wavefronts)
+        wavefronts_rescaled.data = rescale_wavefronts(wavefronts.data,Data_Input_Similar,scale_factors)
+        return wavefronts_rescaled
+    
+    elif isinstance(wavefronts, np.ndarray):
+        wavefronts_rescaled = np.empty(wavefronts.shape, dtype=object)
+        wavefronts_rescaled.ravel()[:] = rescale_wavefronts(wavefronts.ravel().tolist(),Data_Input_Similar,scale_factors)
+        return wavefronts_rescaled
+    
+    else:
+        return [rescale_wavefront(wavefront,Data_Input_Similar,scale_factors) for wavefront in wavefronts]
+
+def rescale_data_output(data_output : Data_Output_Storage, Data_Input_Similar : Data_Input_Storage, scale_factors : dict):
+    """Creates the output data of a similar interface from a Data_Output_Storage or Data_Output_Storage_Ordered object. 
+    Ordering indexes are not altered.
+
+    :param data_output: the output data to rescale, None is returned as is
+    :type data_output: Data_Output_Storage or Data_Output_Storage_Ordered
+    :param Data_Input_Similar: input data of the similar interface
+    :type Data_Input_Similar: Data_Input_Storage
+    :param scale_factors: the 'time', 'voltage' and 'current' scale factors, see :py:meth:`Wavefront_Storage.Data_Input_Storage.get_similarity_factors`
+    :type scale_factors: dict
+    :return: the rescaled output data
+    :rtype: Data_Output_Storage or Data_Output_Storage_Ordered
+    """
+    if(data_output is None):
+        # commutative fanouts of direct merging
+        return None
+    
+    if(isinstance(data_output,Data_Output_Storage_Ordered)):
+        return rescale_data_output_ordered(data_output,Data_Input_Similar,scale_factors)
+    
+    data_output_rescaled = copy.copy(data_output)
+    
+    data_output_rescaled.Time = rescale_values(data_output.Time,scale_factors['time'])
+    
+    data_output_rescaled.Voltage_Interconnect_Inductor = rescale_values(data_output.Voltage_Interconnect_Inductor,scale_factors['voltage'])
+    data_output_rescaled.Current_Interconnect_Inductor = rescale_values(data_output.Current_Interconnect_Inductor,scale_factors['current'])
+    data_output_rescaled.Voltage_Interconnect_Capacitor = rescale_values(data_output.Voltage_Interconnect_Capacitor,scale_factors['voltage'])
+    data_output_rescaled.Current_Interconnect_Capacitor = rescale_values(data_output.Current_Interconnect_Capacitor,scale_factors['current'])
+    
+    data_output_rescaled.Wavefronts_Sending_Inductor = rescale_wavefronts(data_output.Wavefronts_Sending_Inductor,Data_Input_Similar,scale_factors)
+    data_output_rescaled.Wavefronts_Sending_Capacitor = rescale_wavefronts(data_output.Wavefronts_Sending_Capacitor,Data_Input_Similar,scale_factors)
+    data_output_rescaled.Wavefronts_Returning_Inductor = rescale_wavefronts(data_output.Wavefronts_Returning_Inductor,Data_Input_Similar,scale_factors)
+    data_output_rescaled.Wavefronts_Returning_Capacitor = rescale_wavefronts(data_output.Wavefronts_Returning_Capacitor,Data_Input_Similar,scale_factors)
+    
+    return data_output_rescaled
+
+def rescale_data_output_ordered(data_output_ordered : Data_Output_Storage_Ordered, Data_Input_Similar : Data_Input_Storage, scale_factors : dict):
+    """Creates the ordered data of a similar interface, see :py:func:`rescale_data_output`. 
+    The columns of Events are scaled, exact Decimal interconnect changes are scaled and converted to the float columns. 
+    The order and grid co-ordinates of the events are not altered.
+
+    :param data_output_ordered: the ordered data to rescale
+    :type data_output_ordered: Data_Output_Storage_Ordered
+    :param Data_Input_Similar: input data of the similar interface
+    :type Data_Input_Similar: Data_Input_Storage
+    :param scale_factors: the 'time', 'voltage' and 'current' scale factors, see :py:meth:`Wavefront_Storage.Data_Input_Storage.get_similarity_factors`
+    :type scale_factors: dict
+    :return: the rescaled ordered data
+    :rtype: Data_Output_Storage_Ordered
+    """
+    Events = np.array(data_output_ordered.Events)
+    Events['Time'] = rescale_values(Events['Time'],scale_factors['time'])
+    
+    if(data_output_ordered.Exact is None):
+        Exact = None
+    else:
+        Exact = dict()
+    
+    for name in interconnect_value_dtype.names:
+        scale_factor = scale_factors['voltage'] if name.startswith('Voltage') else scale_factors['current']
+        
+        if(Exact is None):
+            Events[name] = rescale_values(Events[name],scale_factor)
+        else:
+            Exact[name] = rescale_values(data_output_ordered.Exact[name],scale_factor)
+            Events[name] = np.asarray(Exact[name], dtype=np.float64)
+    
+    return Data_Output_Storage_Ordered(
+        Events,
+        rescale_wavefronts(data_output_ordered.Wavefronts_Sending_Inductor,Data_Input_Similar,scale_factors),
+        rescale_wavefronts(data_output_ordered.Wavefronts_Sending_Capacitor,Data_Input_Similar,scale_factors),
+        rescale_wavefronts(data_output_ordered.Wavefronts_Returning_Inductor,Data_Input_Similar,scale_factors),
+        rescale_wavefronts(data_output_ordered.Wavefronts_Returning_Capacitor,Data_Input_Similar,scale_factors),
+        data_output_ordered.has_merged,
+        Exact
+    )
+
+def Rescale_Interface(Interface : Data_Interface_Storage, Data_Input_Similar : Data_Input_Storage):
+    """Creates the simulation of a similar interface from a simulated interface, without re-simulating it. 
+    Similar interfaces have the same impedance ratios, time delay ratios and simulation stop time in GCD units 
+    (see :py:meth:`Wavefront_Storage.Data_Input_Storage.get_similarity_key`), 
+    their simulations only differ by a scaling of time, voltage and current.
+    Every scaled value is rounded once more than in a direct simulation of the similar interface, so the rescaled simulation is approximate: 
+    Decimal values may differ from a direct simulation in the last digits (relative error near 1e-25), float values by a few units in the last place.
+
+    :param Interface: the simulated interface
+    :type Interface: Data_Interface_Storage
+    :param Data_Input_Similar: input data of a similar interface
+    :type Data_Input_Similar: Data_Input_Storage
+    :raises ValueError: if the interfaces are not similar
+    :return: the simulation of the similar interface
+    :rtype: Data_Interface_Storage
+    """
+    scale_factors = Interface.data_input.get_similarity_factors(Data_Input_Similar)
+    
+    return Data_Interface_Storage(
+        Data_Input_Similar,
+        rescale_data_output(Interface.data_output_commutative,Data_Input_Similar,scale_factors),
+        rescale_data_output(Interface.data_output_multiplicative,Data_Input_Similar,scale_factors),
+        rescale_data_output(Interface.data_output_ordered,Data_Input_Similar,scale_factors)
+    )
+
+def Scale_Interface(Interface : Data_Interface_Storage, V_source):
+    """Creates a copy of a simulated interface with a different source voltage. 
+    All wavefronts originate from the source excitation and every event is linear, 
+    so the interconnect changes and wavefront magnitudes of the interface scale with the source voltage. 
+
+    :param Interface: the simulated interface
+    :type Interface: Data_Interface_Storage
+    :param V_source: the new magnitude of the voltage excitation in volts
+    :type V_source: str or Decimal
+    :return: the interface simulated with the new source voltage
+    :rtype: Data_Interface_Storage
+    """
+    return Rescale_Interface(Interface,Interface.data_input.get_scaled(V_source))
+
+#: Unit excitation (1V) simulations of interfaces used by :py:func:`Full_Cycle_Cached`, 
+#: keyed by the engine, is_Direct_Merging and similarity key of the interface. Ordered from least to most recently used. 
+similarity_cache : OrderedDict = OrderedDict()
+
+#: The number of simulations kept in :py:data:`similarity_cache` 
+similarity_cache_size : int = 32
+
+def get_similarity_persistent_cache_key(engine : str, is_Direct_Merging : bool, similarity_key : tuple):
+    """Gets the content address in :py:data:`persistent_cache_directory` of the unit excitation simulation used by :py:func:`Full_Cycle_Cached`, 
+    see :py:func:`hash_persistent_cache_content`. Decimal values of the similarity key are normalised.
+
+    :param engine: The engine used for commutative generation, see :py:func:`Full_Cycle`
+    :type engine: str
+    :param is_Direct_Merging: if the merged fanouts are generated directly, see :py:func:`Full_Cycle`
+    :type is_Direct_Merging: bool
+    :param similarity_key: similarity key of the interface, see :py:meth:`Wavefront_Storage.Data_Input_Storage.get_similarity_key`
+    :type similarity_key: tuple
+    :return: hexadecimal sha256 key
+    :rtype: str
+    """
+    return hash_persistent_cache_content({
+        'similarity_key' : [str(value.normalize()) if isinstance(value, Decimal) else value for value in similarity_key],
+        'engine' : engine,
+        'is_Direct_Merging' : bool(is_Direct_Merging)
+    })
+
+def Full_Cycle_Cached(optional_data_input : Data_Input_Storage  = False, engine : str = 'decimal', is_Direct_Merging : bool = False, **input_values):
+    """A cached version of :py:func:`Full_Cycle`, takes the same arguments.
+    Simulations of interfaces are kept in a least-recently-used memory cache (:py:data:`similarity_cache`) 
+    and, if :py:data:`persistent_cache_directory` is set, on disk with the simulations of :py:func:`Full_Cycle_Persistent`.
+    Any interface similar to a cached one is served by rescaling the cached simulation with :py:func:`Rescale_Interface`. 
+    Interfaces are similar when they have the same impedance ratios, time delay ratios and simulation stop time in GCD units, 
+    so sweeps of the source voltage, impedance levels or time scale are only simulated once.
+    A cache hit is approximate, its values are rescaled and may differ from a direct simulation in the last digits, 
+    even with the 'decimal' and 'exact' engines (see :py:func:`Rescale_Interface`). Use :py:func:`Full_Cycle` where results must be reproduced bit for bit.
+    A supplied Data_Input_Storage object can have customised event solvers that are not part of its similarity, 
+    so it is simulated with :py:func:`Full_Cycle` and is not cached.
+    
+    :param optional_data_input: input data used instead of the key-word arguments, simulated without the cache, see :py:func:`Full_Cycle`. (default:False)
+    :type optional_data_input: Data_Input_Storage
+    :param engine: The engine used for commutative generation, see :py:func:`Full_Cycle`. (default:'decimal')
+    :type engine: str
+    :param is_Direct_Merging: generate the multiplicatively merged fanouts directly, see :py:func:`Full_Cycle`. (default:False)
+    :type is_Direct_Merging: bool
+    :return: Interface Data object
+    :rtype: Data_Interface_Storage
+    
+    .. code-block ::
+    
+        from Wavefront_Generation import Full_Cycle_Cached
+
+        # the first call simulates the interface
+        interface_1 = Full_Cycle_Cached(L_time = '3.6',C_time = '3.2',L_impedance = '300',V_source = '1')
+        
+        # similar interfaces re-use the simulation
+        interface_2 = Full_Cycle_Cached(L_time = '3.6',C_time = '3.2',L_impedance = '300',V_source = '20')
+        interface_3 = Full_Cycle_Cached(L_time = '7.2',C_time = '6.4',L_impedance = '600',C_impedance = '2',Simulation_stop_time = str(interface_1.data_input.Simulation_Stop_Time*2))
+    """
+    if ( isinstance(optional_data_input,Data_Input_Storage)):
+        return Full_Cycle(optional_data_input,engine,is_Direct_Merging)
+    elif(not isinstance(optional_data_input,bool)):
+        raise TypeError("otional input data is of incorrect type. Either supply values using ke-word arguments or supply a Data_Input_Storag object.")
+    
+    data_input = Data_Input_Storage(**input_values)
+    
+    unit_input_values = input_values.copy()
+    unit_input_values['V_source'] = '1'
+    unit_input_values['show_about'] = False
+    data_input_unit = Data_Input_Storage(**unit_input_values)
+    
+    key = (engine, bool(is_Direct_Merging)) + data_input_unit.get_similarity_key()
+    
+    if (key in similarity_cache):
+        similarity_cache.move_to_end(key)
+    
+    elif (persistent_cache_directory is None):
+        similarity_cache[key] = Full_Cycle(data_input_unit,engine,is_Direct_Merging)
+    
+    else:
+        persistent_key = get_similarity_persistent_cache_key(engine,is_Direct_Merging,key[2:])
+        similarity_cache[key] = load_persistent_cache(persistent_key)
+        
+        if (similarity_cache[key] is None):
+            similarity_cache[key] = Full_Cycle(data_input_unit,engine,is_Direct_Merging)
+            store_persistent_cache(persistent_key,similarity_cache[key])
+    
+    while (len(similarity_cache) > similarity_cache_size):
+        similarity_cache.popitem(last=False)
+    
+    return Rescale_Interface(similarity_cache[key],data_input)
+
+#: A directory of saved simulations used by :py:func:`Full_Cycle_Persistent`, simulations are not stored if None
+persistent_cache_directory : str = None
+
+#: The maximum size in bytes of :py:data:`persistent_cache_directory`, the least recently used simulations are removed when exceeded
+persistent_cache_size : int = 2**30
+
+#: The age in seconds after which unfinished writes in :py:data:`persistent_cache_directory` are considered abandoned and removed
+persistent_cache_temporary_lifetime : float = 3600
+
+def get_simulation_code_version():
+    """A version of the simulation code, the hash of the source files of the simulation modules. 
+    Simulations stored by a different version of the code are not used by :py:func:`Full_Cycle_Persistent`.
+
+    :return: hexadecimal sha256 hash of the simulation source code
+    :rtype: str
+    """
+    import Wavefront_Storage
+    
+    code_hash = hashlib.sha256()
+    for module_file in [__file__, Wavefront_Storage.__file__]:
+        with open(module_file,'rb') as source_file:
+            code_hash.update(source_file.read())
+    return code_hash.hexdigest()
+
+def get_persistent_cache_key(engine : str, is_Direct_Merging : bool, **input_values):
+    """Gets the content address of a simulation in :py:data:`persistent_cache_directory`, 
+    a hash of the canonical input values of the interface, the simulation options and :py:func:`get_simulation_code_version`.
+    Numeric input values are normalised, so '1.0' and '1' give the same key.
+
+    :param engine: The engine used for commutative generation, see :py:func:`Full_Cycle`
+    :type engine: str
+    :param is_Direct_Merging: if the merged fanouts are generated directly, see :py:func:`Full_Cycle`
+    :type is_Direct_Merging: bool
+    :return: hexadecimal sha256 key
+    :rtype: str
+    """
+    canonical_input_values = dict()
+    for key, value in handle_default_kwargs(input_values, default_input_values).items():
+        if(key == 'show_about'):
+            continue
+        try:
+            canonical_input_values[key] = str(Decimal(value).normalize())
+        except (InvalidOperation, TypeError):
+            canonical_input_values[key] = str(value)
+    
+    return hash_persistent_cache_content({
+        'input_values' : canonical_input_values,
+        'engine' : engine,
+        'is_Direct_Merging' : bool(is_Direct_Merging)
+    })
+
+def hash_persistent_cache_content(content : dict):
+    """Gets the content address of a simulation in :py:data:`persistent_cache_directory` described by the provided content, 
+    the hash of the content and :py:func:`get_simulation_code_version`.
+
+    :param content: JSON serializable description of the simulation
+    :type content: dict
+    :return: hexadecimal sha256 key
+    :rtype: str
+    """
+    content = dict(content, code_version = get_simulation_code_version())
+    return hashlib.sha256(json.dumps(content, sort_keys = True).encode()).hexdigest()
+
+def load_persistent_cache(key : str):
+    """Opens the simulation stored with the provided key in :py:data:`persistent_cache_directory` and marks it as recently used.
+
+    :param key: content address of the simulation, see :py:func:`hash_persistent_cache_content`
+    :type key: str
+    :return: the stored simulation, or None if it is not stored
+    :rtype: Data_Interface_Storage or None
+    """
+    entry_path = os.path.join(persistent_cache_directory, key)
+    
+    if(os.path.exists(os.path.join(entry_path,'metadata.json'))):
+        try:
+            os.utime(entry_path)
+            return Data_Interface_Storage.load(entry_path)
+        except FileNotFoundError:
+            # evicted by another process
+            pass
+    
+    return None
+
+def store_persistent_cache(key : str, interface_data : Data_Interface_Storage):
+    """Stores a simulation with the provided key in :py:data:`persistent_cache_directory` and evicts the least recently used simulations.
+    The simulation is written to a temporary directory that is renamed when complete, the first complete write of a key is kept.
+
+    :param key: content address of the simulation, see :py:func:`hash_persistent_cache_content`
+    :type key: str
+    :param interface_data: the simulation to store
+    :type interface_data: Data_Interface_Storage
+    """
+    os.makedirs(persistent_cache_directory, exist_ok=True)
+    temporary_path = tempfile.mkdtemp(prefix='.' + key + '.', dir=persistent_cache_directory)
+    try:
+        interface_data.save(temporary_path)
+        os.rename(temporary_path, os.path.join(persistent_cache_directory, key))
+    except OSError:
+        # the key was stored by another process, or could not be written, the simulation is still usable
+        pass
+    finally:
+        shutil.rmtree(temporary_path, ignore_errors = True)
+    
+    evict_persistent_cache(key)
+
+def evict_persistent_cache(keep_key : str = None):
+    """Removes the least recently used simulations from :py:data:`persistent_cache_directory` until it is within :py:data:`persistent_cache_size`.
+    Simulations are used when they are stored or loaded. 
+    Unfinished writes (hidden temporary directories) are removed once they are older than :py:data:`persistent_cache_temporary_lifetime`, 
+    so writes in progress in other processes are kept.
+
+    :param keep_key: key of a simulation that is never removed, defaults to None
+    :type keep_key: str, optional
+    """
+    entries = []
+    for key in os.listdir(persistent_cache_directory):
+        entry_path = os.path.join(persistent_cache_directory, key)
+        if(not os.path.isdir(entry_path)):
+            continue
+        
+        if(key.startswith('.')):
+            try:
+                if(time.time() - os.path.getmtime(entry_path) > persistent_cache_temporary_lifetime):
+                    shutil.rmtree(entry_path, ignore_errors = True)
+            except FileNotFoundError:
+                # renamed or removed by another process
+                pass
+            continue
+        
+        try:
+            entry_size = sum(os.path.getsize(os.path.join(entry_path, file_name)) for file_name in os.listdir(entry_path))
+            entries.append((os.path.getmtime(entry_path), entry_size, key, entry_path))
+        except FileNotFoundError:
+            # removed by another process
+            continue
+    
+    total_size = sum(entry[1] for entry in entries)
+    for _, entry_size, key, entry_path in sorted(entries):
+        if(total_size <= persistent_cache_size):
+            break
+        if(key == keep_key):
+            continue
+        shutil.rmtree(entry_path, ignore_errors = True)
+        total_size -= entry_size
+
+def Full_Cycle_Persistent(optional_data_input : Data_Input_Storage  = False, engine : str = 'decimal', is_Direct_Merging : bool = False, **input_values):
+    """A version of :py:func:`Full_Cycle` that stores simulations on disk across sessions, takes the same arguments.
+    Simulations are stored in :py:data:`persistent_cache_directory` with :py:meth:`Wavefront_Storage.Data_Interface_Storage.save`, 
+    addressed by a hash of their input values and the simulation code version (see :py:func:`get_persistent_cache_key`). 
+    Stored simulations are opened with the memory-mapped :py:meth:`Wavefront_Storage.Data_Interface_Storage.load`.
+    
+    Simulations are written to a temporary directory that is renamed when complete, so parallel processes can share the directory. 
+    The least recently used simulations are removed when the directory exceeds :py:data:`persistent_cache_size` bytes. 
+    If :py:data:`persistent_cache_directory` is None the interface is simulated with :py:func:`Full_Cycle`. 
+    A supplied Data_Input_Storage object can have customised event solvers that are not part of its input values, 
+    so it is simulated with :py:func:`Full_Cycle` and is not stored, as in :py:func:`Full_Cycle_Cached`.
+    
+    :param optional_data_input: input data used instead of the key-word arguments, simulated without the cache, see :py:func:`Full_Cycle`. (default:False)
+    :type optional_data_input: Data_Input_Storage
+    :param engine: The engine used for commutative generation, see :py:func:`Full_Cycle`. (default:'decimal')
+    :type engine: str
+    :param is_Direct_Merging: generate the multiplicatively merged fanouts directly, see :py:func:`Full_Cycle`. (default:False)
+    :type is_Direct_Merging: bool
+    :return: Interface Data object
+    :rtype: Data_Interface_Storage
+    
+    .. code-block ::
+    
+        import Wavefront_Generation
+        from Wavefront_Generation import Full_Cycle_Persistent
+        
+        # opt-in to storing simulations
+        Wavefront_Generation.persistent_cache_directory = 'simulation_cache'
+
+        # simulated in the first session, loaded from disk in later sessions
+        interface_data = Full_Cycle_Persistent(L_time = '3.6',C_time = '3.2',L_impedance = '300', engine = 'numpy')
+    """
+    if ( isinstance(optional_data_input,Data_Input_Storage) or persistent_cache_directory is None):
+        return Full_Cycle(optional_data_input,engine,is_Direct_Merging,**input_values)
+    elif(not isinstance(optional_data_input,bool)):
+        raise TypeError("otional input data is of incorrect type. Either supply values using ke-word arguments or supply a Data_Input_Storag object.")
+    
+    key = get_persistent_cache_key(engine,is_Direct_Merging,**input_values)
+    
+    interface_data = load_persistent_cache(key)
+    
+    if(interface_data is None):
+        interface_data = Full_Cycle(optional_data_input,engine,is_Direct_Merging,**input_values)
+        store_persistent_cache(key,interface_data)
+    
+    return interface_data
 
 def get_spatial_voltage_current_at_time(Time_Enquriey : Decimal, Interface : Data_Interface_Storage , is_Inductor : bool):
     """Calcualte the postions of wavefronts on a transmission line and get the spatial distribution of voltage and current on either sides og the points.
+    
+    The wavefronts in flight are found with a binary search of the cached sorted-endpoint index of the line, 
+    and the DC value of the line from its prefix sums (see :py:meth:`Wavefront_Storage.Data_Output_Storage_Ordered.get_spatial_index`). 
+    A query therefore costs O(log n + k log k) for k wavefronts in flight, instead of a walk over all past wavefronts.
 
     :param Time_Enquriey: The time at which spatial behaviour is investigated
     :type Time_Enquriey: Decimal
@@ -699,24 +2275,10 @@ def get_spatial_voltage_current_at_time(Time_Enquriey : Decimal, Interface : Dat
     Time_Enquriey = Decimal(Time_Enquriey)
     
     # Exctract wavefront interceptions at a specific time
-    # 1. get sending + returning wavefronts
+    # 1. get sending + returning wavefronts in flight
     # 2. determine DC line values
     # 3. get intercept positions, voltages and currents
     
-    sending_wavefronts = []
-    returning_wavefronts = []
-    
-    dc_voltage = Decimal('0')
-    dc_current = Decimal('0')
-
-    sending_intercept_positions = []
-    sending_intercept_voltages = []
-    sending_intercept_currents = []
-
-    returning_intercept_positions = []
-    returning_intercept_voltages = []
-    returning_intercept_currents = []
-    
     if(is_Inductor):
         termination_length = Interface.data_input.Inductor_Length
         sending_wavefronts = Interface.data_output_ordered.Wavefronts_Sending_Inductor
@@ -725,111 +2287,63 @@ def get_spatial_voltage_current_at_time(Time_Enquriey : Decimal, Interface : Dat
         termination_length = Interface.data_input.Capacitor_Length
         sending_wavefronts = Interface.data_output_ordered.Wavefronts_Sending_Capacitor
         returning_wavefronts = Interface.data_output_ordered.Wavefronts_Returning_Capacitor
-
-    for sending_wavefront,returning_wavefront in zip(sending_wavefronts,returning_wavefronts):
-        
-        # x = time enquirey
-        # -s-> = sending wavefront
-        # -r-> = returning wavefront
+    
+    spatial_index = Interface.data_output_ordered.get_spatial_index(is_Inductor)
+    
+    # x = time enquirey
+    # -s-> = sending wavefront
+    # -r-> = returning wavefront
+    
+    # -s->-r->x wavefronts [0:number_dc] are both DC
+    number_dc = bisect.bisect_right(spatial_index['Returning_End'], Time_Enquriey)
+    # -s->-x-r-> wavefronts [number_dc:number_returning] are returning intercepts, sending DC
+    number_returning = max(bisect.bisect_left(spatial_index['Returning_Start'], Time_Enquriey), number_dc)
+    # -x-s->-r-> wavefronts [number_returning:number_sending] are sending intercepts, later wavefronts have not started
+    number_sending = max(bisect.bisect_right(spatial_index['Sending_Start'], Time_Enquriey), number_returning)
+    
+    dc_voltage = spatial_index['Sending_Voltage'][number_returning] + spatial_index['Returning_Voltage'][number_dc]
+    dc_current = spatial_index['Sending_Current'][number_returning] + spatial_index['Returning_Current'][number_dc]
+    
+    def get_sorted_intercepts(wavefronts):
+        # intercepts sorted by position, with the magnitudes of the intercepts at lower and higher positions
+        intercepts = sorted((wavefront.Position_at_time(Time_Enquriey), wavefront.magnitude_voltage, wavefront.magnitude_current) for wavefront in wavefronts)
+        positions = [intercept[0] for intercept in intercepts]
         
-        # x-s->-r-> before 
-        if(sending_wavefront.time_start > Time_Enquriey): # Finished
-            break
+        voltage_below = list(itertools.accumulate((intercept[1] for intercept in intercepts), initial = Decimal('0')))
+        current_below = list(itertools.accumulate((intercept[2] for intercept in intercepts), initial = Decimal('0')))
+        voltage_above = list(itertools.accumulate((intercept[1] for intercept in reversed(intercepts)), initial = Decimal('0')))[::-1]
+        current_above = list(itertools.accumulate((intercept[2] for intercept in reversed(intercepts)), initial = Decimal('0')))[::-1]
         
-        # -s->-r->x after
-        elif(returning_wavefront.time_end <= Time_Enquriey): # Both DC
-            dc_voltage += sending_wavefront.magnitude_voltage
-            dc_current += sending_wavefront.magnitude_current
-                
-            dc_voltage += returning_wavefront.magnitude_voltage
-            dc_current += returning_wavefront.magnitude_current
-        
-        # -s->-x-r-> returning intercept
-        elif(returning_wavefront.time_end >= Time_Enquriey and returning_wavefront.time_start < Time_Enquriey): # Returning Intercept, Sending DC
-            returning_intercept_positions.append(returning_wavefront.Position_at_time(Time_Enquriey))
-            returning_intercept_voltages.append(returning_wavefront.magnitude_voltage)
-            returning_intercept_currents.append(returning_wavefront.magnitude_current)
-                
-            dc_voltage += sending_wavefront.magnitude_voltage
-            dc_current += sending_wavefront.magnitude_current
-        
-        # -x-s->-r-> sending intercept
-        elif(sending_wavefront.time_end >= Time_Enquriey and sending_wavefront.time_start <= Time_Enquriey): # Sending Intercept
-            sending_intercept_positions.append(sending_wavefront.Position_at_time(Time_Enquriey))
-            sending_intercept_voltages.append(sending_wavefront.magnitude_voltage)
-            sending_intercept_currents.append(sending_wavefront.magnitude_current)
-                
-        else:
-            raise Exception("Somethings wrong, wavefront has to be intecepted/ stored or done")
+        return positions, voltage_below, current_below, voltage_above, current_above
     
-    # setting dc values on the line 
-    termination_voltage = dc_voltage
-    interconnect_voltage =  dc_voltage
-    termination_current = dc_current
-    interconnect_current =  dc_current
-
-    # combined intercept arrays
-    intercept_positions = []
+    sending_positions, _, _, sending_voltage_above, sending_current_above = get_sorted_intercepts(sending_wavefronts[number_returning:number_sending])
+    returning_positions, returning_voltage_below, returning_current_below, _, _ = get_sorted_intercepts(returning_wavefronts[number_dc:number_returning])
+    
+    # combined intercept arrays, 
+    # each position has the sending intercepts after it and the returning intercepts before it,
+    # sending intercepts at the position are on its left and returning intercepts on its right.
+    intercept_positions = sending_positions + returning_positions
     intercept_voltage_left = []
     intercept_voltage_right = []
     intercept_current_left = []
     intercept_current_right = []
-
-    # store sending intercept positions, 
-    # initialise these positons to start with DC values
-    for i, pos in enumerate(sending_intercept_positions):
-        intercept_positions.append(pos)
-            
-        intercept_voltage_left.append(dc_voltage)
-        intercept_voltage_right.append(dc_voltage)
-        interconnect_voltage += sending_intercept_voltages[i]
-            
-        intercept_current_left.append(dc_current)
-        intercept_current_right.append(dc_current)
-        interconnect_current += sending_intercept_currents[i]
-            
-    # Next, store returning intercept positions, 
-    # initialise these positons to start with DC values
-    for i, pos in enumerate(returning_intercept_positions):
-        intercept_positions.append(pos)
-            
-        intercept_voltage_left.append(dc_voltage)
-        intercept_voltage_right.append(dc_voltage)
-        termination_voltage += returning_intercept_voltages[i]
-            
-        intercept_current_left.append(dc_current)
-        intercept_current_right.append(dc_current)
-        termination_current += returning_intercept_currents[i]
-            
-    # for each intercept position account for sending and returning intercepts
-    for i,position in enumerate(intercept_positions):
-        for j, send_pos in enumerate(sending_intercept_positions):
-            if(send_pos> position):
-                intercept_voltage_left[i] += sending_intercept_voltages[j]
-                intercept_voltage_right[i] += sending_intercept_voltages[j]
-                    
-                intercept_current_left[i] += sending_intercept_currents[j]
-                intercept_current_right[i] += sending_intercept_currents[j]
-                    
-            if (send_pos == position ):
-                intercept_voltage_left[i] += sending_intercept_voltages[j]
-                
-                intercept_current_left[i] += sending_intercept_currents[j]
-                
-        for j, return_pos in enumerate(returning_intercept_positions):
-            if(return_pos< position):
-                intercept_voltage_left[i] += returning_intercept_voltages[j]
-                intercept_voltage_right[i] += returning_intercept_voltages[j]
-                    
-                intercept_current_left[i] += returning_intercept_currents[j]
-                intercept_current_right[i] += returning_intercept_currents[j]
-                    
-            if (return_pos == position ):
-                intercept_voltage_right[i] += returning_intercept_voltages[j]
-                    
-                intercept_current_right[i] += returning_intercept_currents[j]
-                    
+    
+    for position in intercept_positions:
+        sending_left = bisect.bisect_left(sending_positions, position)
+        sending_right = bisect.bisect_right(sending_positions, position)
+        returning_left = bisect.bisect_left(returning_positions, position)
+        returning_right = bisect.bisect_right(returning_positions, position)
+        
+        intercept_voltage_left.append(dc_voltage + sending_voltage_above[sending_left] + returning_voltage_below[returning_left])
+        intercept_voltage_right.append(dc_voltage + sending_voltage_above[sending_right] + returning_voltage_below[returning_right])
+        
+        intercept_current_left.append(dc_current + sending_current_above[sending_left] + returning_current_below[returning_left])
+        intercept_current_right.append(dc_current + sending_current_above[sending_right] + returning_current_below[returning_right])
+    
     # append interconnect values
+    interconnect_voltage = dc_voltage + sending_voltage_above[0]
+    interconnect_current = dc_current + sending_current_above[0]
+    
     intercept_positions.append(0)
     intercept_voltage_left.append(interconnect_voltage)
     intercept_voltage_right.append(interconnect_voltage)
@@ -837,6 +2351,9 @@ def get_spatial_voltage_current_at_time(Time_Enquriey : Decimal, Interface : Dat
     intercept_current_right.append(interconnect_current)
 
     # append termination values
+    termination_voltage = dc_voltage + returning_voltage_below[-1]
+    termination_current = dc_current + returning_current_below[-1]
+    
     intercept_positions.append(termination_length)
     intercept_voltage_left.append(termination_voltage)
     intercept_voltage_right.append(termination_voltage)
@@ -845,29 +2362,100 @@ def get_spatial_voltage_current_at_time(Time_Enquriey : Decimal, Interface : Dat
 
     # sort values based on interconncet positions
     zip_positions_voltage_current = sorted(zip(intercept_positions,intercept_voltage_left,intercept_voltage_right,intercept_current_left,intercept_current_right))
-    intercept_positions, intercept_voltage_left, intercept_voltage_right, intercept_current_left, intercept_current_right = zip(*zip_positions_voltage_current)
-        
-    # convert to lists
-    intercept_positions = list(intercept_positions)
-    intercept_voltage_left = list(intercept_voltage_left)
-    intercept_voltage_right = list(intercept_voltage_right)
-    intercept_current_left = list(intercept_current_left)
-    intercept_current_right = list(intercept_current_right)
-        
-    # Merge neighbours
-    found_duplicate = True
-    while found_duplicate:
-        found_duplicate = False
-        for index,position in enumerate(intercept_positions):
-            if(index < len(intercept_positions)-1):
-                
-                if(position == intercept_positions[index+1]):                  
-                    del intercept_positions[index +1]
-                    del intercept_voltage_left[index +1]
-                    del intercept_voltage_right[index +1]
-                    del intercept_current_left[index +1]
-                    del intercept_current_right[index +1]
-
-                    found_duplicate = True
+    
+    # Merge neighbours, the first of each position is kept
+    zip_positions_voltage_current = [values for index, values in enumerate(zip_positions_voltage_current) 
+                                     if index == 0 or values[0] != zip_positions_voltage_current[index-1][0]]
+    
+    intercept_positions, intercept_voltage_left, intercept_voltage_right, intercept_current_left, intercept_current_right = map(list,zip(*zip_positions_voltage_current))
                         
-    return intercept_positions,intercept_voltage_left,intercept_voltage_right,intercept_current_left,intercept_current_right
\ No newline at end of file
+    return intercept_positions,intercept_voltage_left,intercept_voltage_right,intercept_current_left,intercept_current_right
+
+def sample_line_field(Interface : Data_Interface_Storage, times, positions, is_Inductor : bool):
+    """Samples the voltage and current of a transmission line on a dense (time x position) grid in a single vectorized evaluation, 
+    an alternative to calling :py:func:`get_spatial_voltage_current_at_time` for each time.
+    
+    A wavefront contributes to a grid point once it has passed the position, 
+    the sending wavefront of event k passes position x at Sending_Start[k] + x/velocity 
+    and the returning wavefront at Returning_Start[k] + (length - x)/velocity. 
+    The start times of both are sorted, so the contributing wavefronts of every grid point are found with :py:func:`numpy.searchsorted` 
+    and summed with the prefix sums of the spatial index (see :py:meth:`Wavefront_Storage.Data_Output_Storage_Ordered.get_spatial_index`). 
+    Wavefronts exactly at a grid point are included, the values are on the 'left' of sending and the 'right' of returning wavefronts.
+
+    :param Interface: The data stroage object of the interface 
+    :type Interface: Data_Interface_Storage
+    :param times: the times of the grid, should not be later than the simulation stop time
+    :type times: np.ndarray[float]
+    :param positions: the positions of the grid, distances from the interconnect between 0 and the length of the line
+    :type positions: np.ndarray[float]
+    :param is_Inductor: if the transmission line sampled is the inductor or capacitor.
+    :type is_Inductor: bool
+    :return: the voltage and current of the line, arrays of shape (len(times), len(positions))
+    :rtype: tuple[np.ndarray[float], np.ndarray[float]]
+    
+    .. code-block ::
+    
+        from Wavefront_Generation import Full_Cycle, sample_line_field
+        import numpy as np
+        
+        interface_data = Full_Cycle(L_time = '3.6',C_time = '3.2')
+        
+        times = np.linspace(0, 50, 500)
+        positions = np.linspace(0, float(interface_data.data_input.Inductor_Length), 100)
+        
+        # heatmap data of the inductor voltage and current
+        voltage, current = sample_line_field(interface_data, times, positions, True)
+    """
+    if(is_Inductor):
+        length = float(Interface.data_input.Inductor_Length)
+        velocity = float(Interface.data_input.Inductor_Velocity)
+    else:
+        length = float(Interface.data_input.Capacitor_Length)
+        velocity = float(Interface.data_input.Capacitor_Velocity)
+    
+    spatial_index = Interface.data_output_ordered.get_spatial_index(is_Inductor)
+    
+    times = np.asarray(times, dtype=np.float64).reshape(-1,1)
+    positions = np.asarray(positions, dtype=np.float64).reshape(1,-1)
+    
+    # number of sending and returning wavefronts that have passed each grid point
+    number_sending = np.searchsorted(np.asarray(spatial_index['Sending_Start'], dtype=np.float64), times - positions/velocity, side='right')
+    number_returning = np.searchsorted(np.asarray(spatial_index['Returning_Start'], dtype=np.float64), times - (length - positions)/velocity, side='right')
+    
+    voltage = np.asarray(spatial_index['Sending_Voltage'], dtype=np.float64)[number_sending] + np.asarray(spatial_index['Returning_Voltage'], dtype=np.float64)[number_returning]
+    current = np.asarray(spatial_index['Sending_Current'], dtype=np.float64)[number_sending] + np.asarray(spatial_index['Returning_Current'], dtype=np.float64)[number_returning]
+    
+    return voltage, current
+
+def resample_interconnect(Interface : Data_Interface_Storage, t_array):
+    """Samples the absolute interconnect voltages and currents of an interface at the provided times, 
+    such as the time vector of a SPICE simulation (see :py:func:`LTSpice_Simulator.get_Spice_Arrays`).
+    
+    The interconnect values are step waveforms that change at each event, 
+    they are found for all samples at once with :py:meth:`Wavefront_Storage.Data_Output_Storage_Ordered.values_at`. 
+    No Decimal conversions are made, so very long time vectors can be resampled. 
+    Samples before the first event are zero, and samples after the last event hold its values.
+
+    :param Interface: The data stroage object of the interface 
+    :type Interface: Data_Interface_Storage
+    :param t_array: the sample times, must be chronologically ordered
+    :type t_array: np.ndarray[float]
+    :return: dictionary of float64 sample arrays with keys 'Voltage_Interconnect_Inductor', 'Current_Interconnect_Inductor', 
+        'Voltage_Interconnect_Capacitor' and 'Current_Interconnect_Capacitor'
+    :rtype: Dict
+    
+    .. code-block ::
+    
+        from Wavefront_Generation import Full_Cycle, resample_interconnect
+        from LTSpice_Simulator import get_Spice_Arrays
+        
+        interface_data = Full_Cycle(L_time = '3.6',C_time = '3.2')
+        spice_arrays = get_Spice_Arrays(**interface_data.data_input.SPICE_input_values)
+        
+        # the inductor voltage of the wavefront simulation on the SPICE time vector
+        resampled = resample_interconnect(interface_data, spice_arrays['Time'])
+        voltage_error = resampled['Voltage_Interconnect_Inductor'] - spice_arrays['Inductor_Voltage_Tx']
+    """
+    values = Interface.data_output_ordered.values_at(t_array)
+    
+    return {name : values[name] for name in interconnect_value_dtype.names}
@@ -150,15 +150,15 @@ def interact_3D_spatial(Interface : Data_Interface_Storage,**kwargs):
 
     if(isinstance(kwargs['y_lim'],bool)):
         
-        y_current_lim_0 = float(min([min(np.cumsum(Interface.data_output_ordered.Current_Interconnect_Inductor)),min(np.cumsum(Interface.data_output_ordered.Current_Interconnect_Capacitor))]))
-        y_current_lim_1 = float(max([max(np.cumsum(Interface.data_output_ordered.Current_Interconnect_Inductor)),max(np.cumsum(Interface.data_output_ordered.Current_Interconnect_Capacitor))]))
+        y_current_lim_0 = float(min([min(Interface.data_output_ordered.Cumulative['Current_Interconnect_Inductor']),min(Interface.data_output_ordered.Cumulative['Current_Interconnect_Capacitor'])]))
+        y_current_lim_1 = float(max([max(Interface.data_output_ordered.Cumulative['Current_Interconnect_Inductor']),max(Interface.data_output_ordered.Cumulative['Current_Interconnect_Capacitor'])]))
     else:
         y_current_lim_0 = kwargs['y_lim'][0]
         y_current_lim_1 = kwargs['y_lim'][1]
         
     if(isinstance(kwargs['z_lim'],bool)):
-        z_voltage_lim_0 = float(min([min(np.cumsum(Interface.data_output_ordered.Voltage_Interconnect_Inductor)),min(np.cumsum(Interface.data_output_ordered.Voltage_Interconnect_Capacitor))]))
-        z_voltage_lim_1 = float(max([max(np.cumsum(Interface.data_output_ordered.Voltage_Interconnect_Inductor)),max(np.cumsum(Interface.data_output_ordered.Voltage_Interconnect_Capacitor))]))
+        z_voltage_lim_0 = float(min([min(Interface.data_output_ordered.Cumulative['Voltage_Interconnect_Inductor']),min(Interface.data_output_ordered.Cumulative['Voltage_Interconnect_Capacitor'])]))
+        z_voltage_lim_1 = float(max([max(Interface.data_output_ordered.Cumulative['Voltage_Interconnect_Inductor']),max(Interface.data_output_ordered.Cumulative['Voltage_Interconnect_Capacitor'])]))
     else:
         z_voltage_lim_0 = kwargs['z_lim'][0]
         z_voltage_lim_1 = kwargs['z_lim'][1]
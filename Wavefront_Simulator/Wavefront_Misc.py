@@ -1,4 +1,5 @@
 import numpy as np
+import bisect
 from decimal import Decimal
 
 #: The default values used in the simulation if not specified otherwise
@@ -114,33 +115,67 @@ def closest_event_to_time(data_ordered_time : list, time_enquirey : Decimal, can
         coord_after  = interface.data_output_ordered.Indexes[ i_after ]
         coord_before = interface.data_output_ordered.Indexes[ i_before ]
 
-        print(f" [L , C] after  {coord_after} ") #  returns [1, 1]
-        print(f" [L , C] before {coord_before} ") # returns [0, 3]
+        print(f" [L , C] after  {coord_after} ") #  returns [1 1]
+        print(f" [L , C] before {coord_before} ") # returns [0 3]
         
     .. warning::
         time_enquirey must should be a Decimal number to be compatible with the storage array.
         The enquirey will be auto converted into a decimal but can produce  errors.
         
     """
-    time_enquirey = Decimal(time_enquirey)
-    # if first event is closest
-    if(time_enquirey - data_ordered_time[0] <=0):
-        return (0, data_ordered_time[0] )
+    # match the enquirey to the number type of the time list
+    if isinstance(data_ordered_time[0], Decimal):
+        time_enquirey = Decimal(time_enquirey)
+    else:
+        time_enquirey = float(time_enquirey)
+    
+    # binary search for the first event at or after the enquirey
+    i = bisect.bisect_left(data_ordered_time, time_enquirey)
+    
+    if(i == 0): # first event is closest
+        return (0, data_ordered_time[0])
+    elif(i == len(data_ordered_time)): # last time is best
+        return (i-1, data_ordered_time[i-1])
+    elif(can_be_after_enquirey): 
+        return (i, data_ordered_time[i]) # best time is after event
+    else: 
+        return (i-1, data_ordered_time[i-1]) # best time is before event
 
-    for i,time in enumerate(data_ordered_time):
-        
-        current_time_diff = time_enquirey - time
-        if (current_time_diff <= 0 ): # Just passed or equal to time
-            
-            previous_time_diff = time_enquirey - data_ordered_time[i-1]
-            
-            if(previous_time_diff >= current_time_diff and can_be_after_enquirey): 
-                return (i, time) # best time is after event
-            else: 
-                return (i-1, data_ordered_time[i-1]) # best time is before event
-        
-    return i, time # last time is best
+def closest_events_to_times(data_ordered_time, times_array, can_be_after_enquirey : bool = True):
+    """Finds the closest events to many time enquireys at once, a vectorized form of :py:func:`closest_event_to_time`. 
+    The enquireys are found with a single :py:func:`numpy.searchsorted` on the float64 event times.
+
+    :param data_ordered_time: time list or array, must be chronologically ordered. Typically the 'Time' column of :py:attr:`Wavefront_Storage.Data_Output_Storage_Ordered.Events`
+    :type data_ordered_time: np.ndarray[float] or list[Decimal]
+    :param times_array: the times to which the returned events will be closest
+    :type times_array: np.ndarray[float]
+    :param can_be_after_enquirey: if the events are allowed to occur after the enquireys, defaults to True
+    :type can_be_after_enquirey: bool, optional
+    :return: the indexes in the time list and the closest times returned as a tuple
+    :rtype: tuple ( np.ndarray[int] , np.ndarray[float] )
+    
+    .. code-block::
+    
+        from Wavefront_Generation import Full_Cycle
+        from Wavefront_Misc import closest_events_to_times
+        import numpy as np
+
+        interface = Full_Cycle(L_time='7' , C_time='3.4',show_about = False)
         
+        # the events before each frame of an animation
+        frame_times = np.linspace(0, 100, 2000)
+        indexes, times = closest_events_to_times(interface.data_output_ordered.Events['Time'], frame_times, False)
+    """
+    data_ordered_time = np.asarray(data_ordered_time, dtype=np.float64)
+    times_array = np.asarray(times_array, dtype=np.float64)
+    
+    indexes = np.searchsorted(data_ordered_time, times_array, side='left')
+    
+    if(not can_be_after_enquirey):
+        indexes = np.where(indexes > 0, indexes - 1, 0)
+    indexes = np.minimum(indexes, len(data_ordered_time) - 1)
+    
+    return indexes, data_ordered_time[indexes]
 
 def split_and_translate_to_L_axis(input_array : np.ndarray ,C_value : int):
     """The first step in the recursive merging process.
@@ -429,8 +464,19 @@ def get_voltage_from_wavefront(wavefront):
     """
     return wavefront.magnitude_voltage
 
-#: The vectorized function that extracts the voltages from an np.ndarray[Wavefronts] array and returns an np.ndarray[Decimal] voltage array.
-get_voltage_array = np.vectorize(get_voltage_from_wavefront)
+def get_voltage_array(wavefront_array):
+    """extracts the voltages from an np.ndarray[Wavefronts] array and returns an np.ndarray[Decimal] voltage array. 
+    Wavefront storage that already keeps its magnitudes as arrays (see :py:class:`Wavefront_Storage.Wavefront_Array`) returns its voltage array directly.
+
+    :param wavefront_array: array of wavefronts
+    :type wavefront_array: np.ndarray[Wavefront] or Wavefront_Array
+    :return: voltage magnitudes of the wavefronts
+    :rtype: np.ndarray
+    """
+    if hasattr(getattr(wavefront_array,'magnitude_voltage',None),'shape'):
+        return wavefront_array.magnitude_voltage
+    
+    return np.vectorize(get_voltage_from_wavefront)(wavefront_array)
 
 def get_current_from_wavefront(wavefront):
     """get the voltage of a wavefront. Used as a dummy fucntion to be vectorized, see :py:func:`get_current_array`.
@@ -442,8 +488,19 @@ def get_current_from_wavefront(wavefront):
     """
     return wavefront.magnitude_current
 
-#: The vectorized function that extracts the currents from an np.ndarray[Wavefronts] array and returns an np.ndarray[Decimal] current array.
-get_current_array = np.vectorize(get_current_from_wavefront)
+def get_current_array(wavefront_array):
+    """extracts the currents from an np.ndarray[Wavefronts] array and returns an np.ndarray[Decimal] current array.
+    Wavefront storage that already keeps its magnitudes as arrays (see :py:class:`Wavefront_Storage.Wavefront_Array`) returns its current array directly.
+
+    :param wavefront_array: array of wavefronts
+    :type wavefront_array: np.ndarray[Wavefront] or Wavefront_Array
+    :return: current magnitudes of the wavefronts
+    :rtype: np.ndarray
+    """
+    if hasattr(getattr(wavefront_array,'magnitude_current',None),'shape'):
+        return wavefront_array.magnitude_current
+    
+    return np.vectorize(get_current_from_wavefront)(wavefront_array)
 
 def convert_to_image_array(array):
     """Takes an input array, and if it is a 1-dimensional list, it will convert it into a suitable format
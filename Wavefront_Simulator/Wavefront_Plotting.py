@@ -752,11 +752,12 @@ def plot_trace_on_merged_fanout_axis(data_output_ordered : Data_Output_Storage_O
     data_output_ordered = handle_interface_to_ordered(data_output_ordered)
     
     # set limit of indexes based on upto_time if supplied
+    All_Indexes = data_output_ordered.Indexes
     if (isinstance(upto_time,bool)):
-        Indexes = data_output_ordered.Indexes[1:]
+        Indexes = All_Indexes[1:]
     else:
         i,_ = closest_event_to_time(data_output_ordered.Time,upto_time,True)
-        Indexes = data_output_ordered.Indexes[1:i]
+        Indexes = All_Indexes[1:i]
     
     get_xy = lambda index : (index[0] + kwargs['padding'], index[1] + kwargs['padding'])
     
@@ -766,7 +767,7 @@ def plot_trace_on_merged_fanout_axis(data_output_ordered : Data_Output_Storage_O
     # plot arrow from last to next
     for i,index in enumerate(Indexes):
         
-        x1,y1 = get_xy(data_output_ordered.Indexes[i])
+        x1,y1 = get_xy(All_Indexes[i])
         x2,y2 = get_xy(index)
 
         dx = x2 - x1
@@ -959,7 +960,7 @@ def plot_time_interconnect(data_output_ordered : Data_Output_Storage_Ordered,ax,
         ax.yaxis.set_major_formatter(EngFormatter('A'))
         
     if(is_integrated):
-        data_to_plot = np.cumsum(data_to_plot)
+        data_to_plot = data_output_ordered.get_interconnect_cumulative(which_string)
         operation_str = ''
     else:
         operation_str = 'change'
@@ -1,8 +1,12 @@
 from decimal import Decimal
 import math
 from collections import deque
+import copy
+import itertools
+import os
+import json
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from Wavefront_Misc import lcm_gcd_euclid, get_voltage_array, get_current_array, default_input_values ,handle_default_kwargs
 
 class Data_Input_Storage :
@@ -195,17 +199,6 @@ class Data_Input_Storage :
         else:
             self.Simulation_Stop_Time = self.Number_Periods*Decimal('6.28318530718')*(Decimal.sqrt(self.Capacitor_Total_Capacitance*self.Inductor_Total_Inductance))
         
-        # Determine the number of layers
-        if (self.Capacitor_Time < self.Inductor_Time):
-            self.Number_of_Layers = math.ceil(self.Simulation_Stop_Time/(self.Capacitor_Time*2))+1
-        else:
-            self.Number_of_Layers = math.ceil(self.Simulation_Stop_Time/(self.Inductor_Time*2))+1
-        
-        # Calculate the number of wavefronts that must be created
-        self.Number_of_Wavefronts = 0
-        for i in range(0,self.Number_of_Layers+1):
-            self.Number_of_Wavefronts = self.Number_of_Wavefronts + 4*i
-        
         # Calculate and store multiplicative realtionships between time delays
         Factor_Dict = lcm_gcd_euclid(self.Inductor_Time*2,self.Capacitor_Time*2)
         self.Inductor_LCM_Factor = int(Factor_Dict['KL'])
@@ -213,11 +206,8 @@ class Data_Input_Storage :
         self.GCD = Factor_Dict['GCD']
         self.LCM = Factor_Dict['LCM']
         
-        # Determine if Multiplicative Merging will occur or not
-        if(Factor_Dict['LCM'] > self.Simulation_Stop_Time):
-            self.is_Higher_Merging = False
-        else:
-            self.is_Higher_Merging = True
+        # Determine the extent of the simulation
+        self.calculate_simulation_extent()
         
         # Generate the associated response co-effcients for changes at the interface.
         if(self.Is_Buck):
@@ -292,6 +282,129 @@ class Data_Input_Storage :
         if(self.input_values['show_about']):
             self.about()
     
+    def calculate_simulation_extent(self):
+        """Calculates the variables that depend on the simulation stop time. 
+        Sets the number of layers, the number of wavefronts and if multiplicative merging will occur.
+        """
+        # Determine the number of layers
+        if (self.Capacitor_Time < self.Inductor_Time):
+            self.Number_of_Layers = math.ceil(self.Simulation_Stop_Time/(self.Capacitor_Time*2))+1
+        else:
+            self.Number_of_Layers = math.ceil(self.Simulation_Stop_Time/(self.Inductor_Time*2))+1
+        
+        # Calculate the number of wavefronts that must be created
+        self.Number_of_Wavefronts = 0
+        for i in range(0,self.Number_of_Layers+1):
+            self.Number_of_Wavefronts = self.Number_of_Wavefronts + 4*i
+        
+        # Determine if Multiplicative Merging will occur or not
+        if(self.LCM > self.Simulation_Stop_Time):
+            self.is_Higher_Merging = False
+        else:
+            self.is_Higher_Merging = True
+    
+    def get_extended(self, Simulation_stop_time):
+        """Creates a copy of the input data with a later simulation stop time. 
+        Customised event solvers of this object are kept, see :py:func:`Wavefront_Generation.Extend_Interface`.
+
+        :param Simulation_stop_time: the new simulation stop time
+        :type Simulation_stop_time: str or Decimal
+        :raises ValueError: if the new stop time is not later than the current stop time
+        :return: input data of the extended simulation
+        :rtype: Data_Input_Storage
+        """
+        Simulation_Stop_Time = Decimal(Simulation_stop_time)
+        if(Simulation_Stop_Time <= self.Simulation_Stop_Time):
+            raise ValueError(f"The new simulation stop time ({Simulation_Stop_Time}) must be later than the current stop time ({self.Simulation_Stop_Time}).")
+        
+        data_input_extended = copy.copy(self)
+        
+        data_input_extended.input_values = self.input_values.copy()
+        data_input_extended.input_values['Simulation_stop_time'] = str(Simulation_Stop_Time)
+        data_input_extended.SPICE_input_values = self.SPICE_input_values.copy()
+        data_input_extended.SPICE_input_values['Simulation_stop_time'] = str(Simulation_Stop_Time)
+        
+        data_input_extended.Custom_stop_time = True
+        data_input_extended.Simulation_Stop_Time = Simulation_Stop_Time
+        data_input_extended.Number_Periods = Simulation_Stop_Time/(Decimal('6.28318530718')*(Decimal.sqrt(self.Capacitor_Total_Capacitance*self.Inductor_Total_Inductance)))
+        data_input_extended.calculate_simulation_extent()
+        
+        return data_input_extended
+    
+    def get_scaled(self, V_source):
+        """Creates a copy of the input data with a different source voltage. 
+        The interface is linear in the source voltage, so the initial voltages and currents are scaled with it, 
+        see :py:func:`Wavefront_Generation.Scale_Interface`.
+
+        :param V_source: the new magnitude of the voltage excitation in volts
+        :type V_source: str or Decimal
+        :return: input data with the new source voltage
+        :rtype: Data_Input_Storage
+        """
+        Voltage_Souce_Magnitude = Decimal(V_source)
+        scale_factor = Voltage_Souce_Magnitude/self.Voltage_Souce_Magnitude
+        
+        data_input_scaled = copy.copy(self)
+        
+        data_input_scaled.input_values = self.input_values.copy()
+        data_input_scaled.input_values['V_source'] = str(Voltage_Souce_Magnitude)
+        data_input_scaled.SPICE_input_values = self.SPICE_input_values.copy()
+        data_input_scaled.SPICE_input_values['V_source'] = str(Voltage_Souce_Magnitude)
+        
+        data_input_scaled.Voltage_Souce_Magnitude = Voltage_Souce_Magnitude
+        data_input_scaled.Initial_Inductor_Current = self.Initial_Inductor_Current * scale_factor
+        data_input_scaled.Initial_Inductor_Voltage = self.Initial_Inductor_Voltage * scale_factor
+        data_input_scaled.Initial_Capacitor_Current = self.Initial_Capacitor_Current * scale_factor
+        data_input_scaled.Initial_Capacitor_Voltage = self.Initial_Capacitor_Voltage * scale_factor
+        
+        return data_input_scaled
+    
+    def get_similarity_key(self):
+        """Creates a canonical key of the simulation in dimensionless form. 
+        Interfaces with the same key are similar, their simulations only differ by a scaling of time, voltage and current, 
+        see :py:meth:`get_similarity_factors`.
+        
+        The fanout magnitudes are determined by the impedance ratios of the interface, 
+        and the fanout structure by the time delays in GCD units and the simulation stop time rounded up to GCD units. 
+        Lengths only determine the velocity of wavefronts and are not part of the key.
+
+        :return: the similarity key
+        :rtype: tuple
+        """
+        if(self.Is_Buck):
+            Load_Impedance_Ratio = self.Load_Impedance/self.Inductor_Impedance
+        else:
+            Load_Impedance_Ratio = None
+        
+        return (
+            self.Is_Buck,
+            self.Capacitor_Impedance/self.Inductor_Impedance,
+            Load_Impedance_Ratio,
+            self.Inductor_LCM_Factor,
+            self.Capacitor_LCM_Factor,
+            math.ceil(self.Simulation_Stop_Time/self.GCD),
+            self.is_Higher_Merging
+        )
+    
+    def get_similarity_factors(self, Data_Input_Similar):
+        """Gets the factors that transform the simulation of this interface to that of a similar interface.
+        Times scale with the GCD of the time delays, voltages with the source voltage and currents with the source voltage over the inductor impedance.
+
+        :param Data_Input_Similar: input data of a similar interface
+        :type Data_Input_Similar: Data_Input_Storage
+        :raises ValueError: if the interfaces are not similar, see :py:meth:`get_similarity_key`
+        :return: the scale factors for 'time', 'voltage' and 'current'
+        :rtype: dict
+        """
+        if(self.get_similarity_key() != Data_Input_Similar.get_similarity_key()):
+            raise ValueError(f"Interfaces are not similar, similarity keys {self.get_similarity_key()} and {Data_Input_Similar.get_similarity_key()} differ.")
+        
+        return {
+            'time' : Data_Input_Similar.GCD/self.GCD,
+            'voltage' : Data_Input_Similar.Voltage_Souce_Magnitude/self.Voltage_Souce_Magnitude,
+            'current' : (Data_Input_Similar.Voltage_Souce_Magnitude/Data_Input_Similar.Inductor_Impedance)/(self.Voltage_Souce_Magnitude/self.Inductor_Impedance)
+        }
+    
     def Circuit_Solver_Inductor_Voltage(self,VL: Decimal,IL: Decimal,VC: Decimal,IC: Decimal):
         """Generates the voltage response of the inductor to wavefront distrubances. Solves by means of the wavefront equivalent circuit.
 
@@ -612,6 +725,59 @@ class Wavefront:
         print(f"{'Voltage Magnitude :':<35}{self.magnitude_voltage}")
         print(f"{'Current Magnitude :':<35}{self.magnitude_current}")
     
+    @classmethod
+    def from_magnitudes(cls, Data_Input : Data_Input_Storage, time_start : Decimal, is_sending : bool, magnitude_voltage : Decimal, magnitude_current : Decimal):
+        """Creates a wavefront directly from its magnitudes, without a parent wavefront.
+        Used to materialize wavefronts from numeric storage arrays, see :py:class:`Wavefront_Array`. 
+        Called on :py:class:`Wavefront_Inductive` or :py:class:`Wavefront_Capacitive`, the is_Inductor attribute of the class selects the transmission line.
+
+        :param Data_Input: the input paramaters of the interface being investigated.
+        :type Data_Input: Data_Input_Storage
+        :param time_start: the time the wavefront leaves the interface (sending) or the termination (returning)
+        :type time_start: Decimal
+        :param is_sending: if the wavefront travels away from the interface
+        :type is_sending: bool
+        :param magnitude_voltage: voltage magnitude of the wavefront
+        :type magnitude_voltage: Decimal
+        :param magnitude_current: current magnitude of the wavefront
+        :type magnitude_current: Decimal
+        :return: the wavefront
+        :rtype: Wavefront_Inductive or Wavefront_Capacitive
+        """
+        wavefront = cls.__new__(cls)
+        wavefront.Data_Input = Data_Input
+        
+        if cls.is_Inductor:
+            length, line_time, velocity = Data_Input.Inductor_Length, Data_Input.Inductor_Time, Data_Input.Inductor_Velocity
+            wavefront.Self_Reflection_Event_Solver = Data_Input.Self_Reflection_Event_Solver_Inductor
+            wavefront.Exitation_Event_Solver = Data_Input.Exitation_Event_Solver_Inductor
+            wavefront.Transmission_Event_Solver = Data_Input.Transmission_Event_Solver_Inductor
+            wavefront.Termination_Event_Solver = Data_Input.Termination_Event_Solver_Inductor
+        else:
+            length, line_time, velocity = Data_Input.Capacitor_Length, Data_Input.Capacitor_Time, Data_Input.Capacitor_Velocity
+            wavefront.Self_Reflection_Event_Solver = Data_Input.Self_Reflection_Event_Solver_Capacitor
+            wavefront.Exitation_Event_Solver = Data_Input.Exitation_Event_Solver_Capacitor
+            wavefront.Transmission_Event_Solver = Data_Input.Transmission_Event_Solver_Capacitor
+            wavefront.Termination_Event_Solver = Data_Input.Termination_Event_Solver_Capacitor
+        
+        if is_sending:
+            wavefront.position_start = 0
+            wavefront.position_end = length
+        else:
+            wavefront.position_start = length
+            wavefront.position_end = 0
+        
+        wavefront.time_start = time_start
+        wavefront.time_end = time_start + line_time
+        
+        wavefront.velocity = velocity
+        wavefront.length = length
+        
+        wavefront.magnitude_voltage = magnitude_voltage
+        wavefront.magnitude_current = magnitude_current
+        
+        return wavefront
+    
     def Position_at_time(self,time):
         """Generates the position of wavefront at time-equirey. Returns False if no intercept.
 
@@ -729,6 +895,7 @@ class Wavefront_Capacitive( Wavefront_Kintetic ):
     """
     A wavefront travelling in the capacitor. Follows the "wavefronts create wavefronts" paradigm. 
     """
+    is_Inductor = False
 
     def __init__(self, Data_Input : Data_Input_Storage, Wavefront_Parent : Wavefront, is_self_reflection : bool):
         """
@@ -793,6 +960,8 @@ class Wavefront_Inductive( Wavefront_Kintetic ):
     """
     A wavefront travelling in the inductor. Follows the "wavefronts create wavefronts" paradigm. 
     """
+    is_Inductor = True
+    
     def __init__(self, Data_Input : Data_Input_Storage, Wavefront_Parent : Wavefront, is_self_reflection : bool):
         """
         Generates a inductive wavefront based off the information of the parent wavefront. 
@@ -853,6 +1022,497 @@ class Wavefront_Inductive( Wavefront_Kintetic ):
         else :
             return Wavefront_Inductive(self.Data_Input,self,True)
 
+def append_to_buffer(buffer : np.ndarray, array : np.ndarray, values : np.ndarray):
+    """Appends values along the first axis of an array that is stored at the start of a larger buffer. 
+    The values are written into the free space of the buffer, a new buffer of at least double the size is only allocated when it is full, 
+    so repeated appends cost O(number of values appended) amortized. 
+    A new buffer is also allocated if the array is not a view of the start of the buffer, or the buffer is read-only (e.g. memory-mapped).
+
+    :param buffer: the buffer the array is stored in, None if the array has no buffer
+    :type buffer: np.ndarray
+    :param array: the array to append to
+    :type array: np.ndarray
+    :param values: the values to append, of the shape of the array along the other axes
+    :type values: np.ndarray
+    :return: (buffer, array) the buffer and the appended array, a view of the start of the buffer
+    :rtype: Tuple (np.ndarray, np.ndarray)
+    """
+    length = len(array) + len(values)
+    
+    is_stored = buffer is not None and (array is buffer or array.base is buffer) and buffer.flags.writeable
+    if not is_stored or len(buffer) < length:
+        new_buffer = np.empty((max(length, 2*len(array)),) + array.shape[1:], dtype = array.dtype)
+        new_buffer[0:len(array)] = array
+        buffer = new_buffer
+    
+    buffer[len(array):length] = values
+    return buffer, buffer[0:length]
+
+class Triangular_Array(np.lib.mixins.NDArrayOperatorsMixin):
+    """Packed storage for fanout arrays, only the grid nodes of simulated layers are stored.
+    
+    A fanout of N layers is logically an (N+1)x(N+1) array of format Array[L,C], 
+    but only the triangle of nodes with L + C < N is ever filled. 
+    These nodes are stored diagonal-major in a flat buffer, layer by layer with L increasing in a layer,
+    the node [L,C] is at position (L+C)(L+C+1)/2 + L. This is roughly half the memory of the dense array, 
+    and a layer is a contiguous slice of the buffer (see :py:meth:`get_layer`).
+    
+    Reading a node that is not stored returns the fill value, slices are gathered into dense np.ndarrays.
+    The array can be passed to any numpy function, and is converted to its dense form when done so.
+
+    :param number_of_layers: the number of fanout layers stored, N
+    :type number_of_layers: int
+    :param fill_value: the value of nodes that are not stored, defaults to 0
+    :type fill_value: Any, optional
+    :param dtype: dtype of the flat buffer, defaults to the dtype of the fill value
+    :type dtype: np.dtype, optional
+    
+    .. code-block::
+
+        from Wavefront_Generation import Full_Cycle
+
+        interface = Full_Cycle(L_time = '7', C_time = '3.4', show_about = False)
+        time = interface.data_output_commutative.Time
+        
+        # index as a dense fanout
+        print(time[2,3])
+        # the nodes of the 4th layer, ordered with increasing L
+        print(time.get_layer(4))
+        # dense copy of the fanout 
+        time_dense = time.to_dense()
+    """
+    def __init__(self, number_of_layers : int, fill_value = 0, dtype = None):
+        self.number_of_layers = number_of_layers
+        self.fill_value = fill_value
+        self.data = np.full(number_of_layers*(number_of_layers+1)//2, fill_value, dtype = dtype)
+        self.buffer = self.data
+    
+    @classmethod
+    def from_buffer(cls, data : np.ndarray, number_of_layers : int, fill_value = 0):
+        """Creates a Triangular_Array that stores an existing flat buffer without copying it, such as a memory-mapped array.
+
+        :param data: the flat diagonal-major buffer of number_of_layers x (number_of_layers + 1)/2 nodes
+        :type data: np.ndarray
+        :param number_of_layers: the number of fanout layers stored
+        :type number_of_layers: int
+        :param fill_value: the value of nodes that are not stored, defaults to 0
+        :type fill_value: Any, optional
+        :return: the fanout of the buffer
+        :rtype: Triangular_Array
+        """
+        if len(data) != number_of_layers*(number_of_layers+1)//2:
+            raise ValueError(f"A buffer of {len(data)} nodes can not store {number_of_layers} layers, {number_of_layers*(number_of_layers+1)//2} nodes are required.")
+        
+        fanout = cls(0, fill_value, data.dtype)
+        fanout.number_of_layers = number_of_layers
+        fanout.data = data
+        fanout.buffer = data
+        return fanout
+    
+    def add_layers(self, number_of_layers : int):
+        """Grows the fanout in place to store more layers, the new nodes are set to the fill value. 
+        As layers are stored one after the other, the flat buffer is appended to and the stored nodes keep their positions. 
+        The buffer is over-allocated (see :py:func:`append_to_buffer`), so growing a fanout layer by layer is O(number of new nodes) amortized.
+
+        :param number_of_layers: the number of layers to store, not less than the number currently stored
+        :type number_of_layers: int
+        """
+        number_of_new_nodes = number_of_layers*(number_of_layers+1)//2 - len(self.data)
+        self.buffer, self.data = append_to_buffer(getattr(self, 'buffer', None), self.data, np.full(number_of_new_nodes, self.fill_value, dtype = self.dtype))
+        self.number_of_layers = number_of_layers
+    
+    @property
+    def shape(self):
+        return (self.number_of_layers+1, self.number_of_layers+1)
+    
+    @property
+    def ndim(self):
+        return 2
+    
+    @property
+    def dtype(self):
+        return self.data.dtype
+    
+    @staticmethod
+    def get_flat_index(L_index, C_index):
+        """the position of grid nodes [L,C] in the flat buffer.
+        """
+        layer_index = L_index + C_index
+        return layer_index*(layer_index+1)//2 + L_index
+    
+    def get_grid_indexes(self):
+        """the L and C co-ordinates of each entry in the flat buffer.
+
+        :return: (L_index, C_index)
+        :rtype: Tuple (np.ndarray[int], np.ndarray[int])
+        """
+        layer_index = np.repeat(np.arange(self.number_of_layers), np.arange(1,self.number_of_layers+1))
+        L_index = np.arange(len(self.data)) - layer_index*(layer_index+1)//2
+        
+        return L_index, layer_index - L_index
+    
+    def get_layer(self, layer_number : int):
+        """a view of the nodes of a layer, ordered with increasing L.
+
+        :param layer_number: the layer, L + C
+        :type layer_number: int
+        :return: the layer as a view into the flat buffer, can be assigned to.
+        :rtype: np.ndarray
+        """
+        start_index = layer_number*(layer_number+1)//2
+        return self.data[start_index:start_index+layer_number+1]
+    
+    def get_key_indexes(self, key):
+        """converts a numpy style [L,C] key into broadcasted grids of L and C co-ordinates.
+        """
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        
+        L_key, C_key = key
+        L_index = np.arange(self.shape[0])[L_key]
+        C_index = np.arange(self.shape[1])[C_key]
+        
+        # two advanced indexes broadcast together, slices form an outer product
+        if not isinstance(L_key, slice) and not isinstance(C_key, slice):
+            return np.broadcast_arrays(L_index, C_index)
+        
+        L_shape, C_shape = np.shape(L_index), np.shape(C_index)
+        L_index = np.reshape(L_index, L_shape + (1,)*len(C_shape))
+        C_index = np.reshape(C_index, (1,)*len(L_shape) + C_shape)
+        return np.broadcast_arrays(L_index, C_index)
+    
+    def get_node_flat_index(self, L_index : int, C_index : int):
+        """the position of a single grid node in the flat buffer, None if the node is not stored.
+        Negative indexes count from the end of the logical shape.
+        """
+        if L_index < 0:
+            L_index += self.shape[0]
+        if C_index < 0:
+            C_index += self.shape[1]
+        if not (0 <= L_index < self.shape[0] and 0 <= C_index < self.shape[1]):
+            raise IndexError(f"index [{L_index},{C_index}] is out of bounds for a fanout of shape {self.shape}")
+        
+        if L_index + C_index < self.number_of_layers:
+            return self.get_flat_index(L_index, C_index)
+        return None
+    
+    def __getitem__(self, key):
+        # fast path for single nodes
+        if isinstance(key, tuple) and len(key) == 2 and isinstance(key[0], (int,np.integer)) and isinstance(key[1], (int,np.integer)):
+            flat_index = self.get_node_flat_index(key[0], key[1])
+            if flat_index is None:
+                return self.fill_value
+            return self.data[flat_index]
+        
+        L_index, C_index = self.get_key_indexes(key)
+        is_stored = (L_index + C_index) < self.number_of_layers
+        
+        if L_index.ndim == 0:
+            if is_stored:
+                return self.data[self.get_flat_index(int(L_index), int(C_index))]
+            return self.fill_value
+        
+        values = np.full(L_index.shape, self.fill_value, dtype = self.dtype)
+        values[is_stored] = self.data[self.get_flat_index(L_index[is_stored], C_index[is_stored])]
+        return values
+    
+    def __setitem__(self, key, value):
+        # fast path for single nodes
+        if isinstance(key, tuple) and len(key) == 2 and isinstance(key[0], (int,np.integer)) and isinstance(key[1], (int,np.integer)):
+            flat_index = self.get_node_flat_index(key[0], key[1])
+            if flat_index is None:
+                raise IndexError(f"Only nodes of the first {self.number_of_layers} layers are stored, nodes with L + C >= {self.number_of_layers} can not be assigned.")
+            self.data[flat_index] = value
+            return
+        
+        L_index, C_index = self.get_key_indexes(key)
+        
+        if np.any((L_index + C_index) >= self.number_of_layers):
+            raise IndexError(f"Only nodes of the first {self.number_of_layers} layers are stored, nodes with L + C >= {self.number_of_layers} can not be assigned.")
+        
+        self.data[self.get_flat_index(L_index, C_index)] = value
+    
+    def to_dense(self):
+        """converts to the dense (N+1)x(N+1) fanout format.
+
+        :return: dense fanout
+        :rtype: np.ndarray
+        """
+        dense_array = np.full(self.shape, self.fill_value, dtype = self.dtype)
+        L_index, C_index = self.get_grid_indexes()
+        dense_array[L_index, C_index] = self.data
+        
+        return dense_array
+    
+    def astype(self, dtype):
+        """dense copy of the fanout cast to dtype, equivalent to np.ndarray.astype on the dense fanout.
+        """
+        return self.to_dense().astype(dtype)
+    
+    def __array__(self, dtype = None, copy = None):
+        if dtype is None:
+            return self.to_dense()
+        return self.astype(dtype)
+    
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # operations are done on the dense fanout
+        inputs = [x.to_dense() if isinstance(x, Triangular_Array) else x for x in inputs]
+        return getattr(ufunc, method)(*inputs, **kwargs)
+    
+    def __len__(self):
+        return self.shape[0]
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+class Wavefront_Array:
+    """A struct-of-arrays replacement for the np.ndarray[Wavefront] fanouts stored in :py:class:`Data_Output_Storage`.
+    Only the voltage and current magnitudes are stored, as contiguous arrays of float64 or Decimal values.
+    The remaining wavefront parameters (start time, transmission line and direction) follow from the [L,C] grid node of an entry,
+    the start time of the wavefront sent from node [L,C] is L x (2 x Inductor_Time) + C x (2 x Capacitor_Time).
+
+    Indexing the array with a single grid node materializes a :py:class:`Wavefront_Inductive` or :py:class:`Wavefront_Capacitive` object,
+    so code written for arrays of wavefront objects keeps working. Any other index returns a new Wavefront_Array.
+
+    :param Data_Input: the input paramaters of the interface the wavefronts belong to
+    :type Data_Input: Data_Input_Storage
+    :param is_Inductor: if the wavefronts travel in the inductor, else the capacitor
+    :type is_Inductor: bool
+    :param is_Sending: if the wavefronts are sent from the interface, else they are returning to it
+    :type is_Sending: bool
+    :param magnitude_voltage: voltage magnitudes of the wavefronts
+    :type magnitude_voltage: np.ndarray[float] or np.ndarray[Decimal]
+    :param magnitude_current: current magnitudes of the wavefronts
+    :type magnitude_current: np.ndarray[float] or np.ndarray[Decimal]
+    :param L_index: the L co-ordinate of each entry, defaults to the row index of a 2D fanout
+    :type L_index: np.ndarray[int], optional
+    :param C_index: the C co-ordinate of each entry, defaults to the column index of a 2D fanout
+    :type C_index: np.ndarray[int], optional
+
+    .. code-block::
+
+        from Wavefront_Generation import Full_Cycle
+
+        interface = Full_Cycle(L_time = '7', C_time = '3.4', engine = 'numpy', show_about = False)
+
+        # magnitudes are stored as arrays
+        sending_inductor = interface.data_output_commutative.Wavefronts_Sending_Inductor
+        print(sending_inductor.magnitude_voltage[1,2])
+
+        # a wavefront object is made when a single node is requested
+        sending_inductor[1,2].about()
+    """
+    def __init__(self, Data_Input : Data_Input_Storage, is_Inductor : bool, is_Sending : bool, magnitude_voltage : np.ndarray, magnitude_current : np.ndarray, L_index : np.ndarray = None, C_index : np.ndarray = None):
+
+        self.Data_Input = Data_Input
+        self.is_Inductor = is_Inductor
+        self.is_Sending = is_Sending
+
+        self.magnitude_voltage = magnitude_voltage
+        self.magnitude_current = magnitude_current
+
+        # the grid co-ordiantes of a 2D fanout are implied by position, broadcasting does not allocate memory
+        if L_index is None:
+            L_index = np.broadcast_to(np.arange(magnitude_voltage.shape[0]).reshape(-1,1), magnitude_voltage.shape)
+        if C_index is None:
+            C_index = np.broadcast_to(np.arange(magnitude_voltage.shape[1]).reshape(1,-1), magnitude_voltage.shape)
+
+        self.L_index = L_index
+        self.C_index = C_index
+
+    @classmethod
+    def from_wavefronts(cls, Data_Input : Data_Input_Storage, wavefronts, is_Inductor : bool, is_Sending : bool):
+        """Creates a Wavefront_Array with Decimal magnitudes from a fanout of wavefront objects, 
+        such as the fanouts produced by :py:func:`Wavefront_Generation.Generate_Wavefronts_Commutatively`.
+
+        :param Data_Input: the input paramaters of the interface the wavefronts belong to
+        :type Data_Input: Data_Input_Storage
+        :param wavefronts: fanout of wavefront objects, stored in a Triangular_Array or dense np.ndarray
+        :type wavefronts: Triangular_Array or np.ndarray[Wavefront]
+        :param is_Inductor: if the wavefronts travel in the inductor, else the capacitor
+        :type is_Inductor: bool
+        :param is_Sending: if the wavefronts are sent from the interface, else they are returning to it
+        :type is_Sending: bool
+        :return: the magnitudes of the wavefronts
+        :rtype: Wavefront_Array
+        """
+        if isinstance(wavefronts, Triangular_Array):
+            magnitude_voltage = Triangular_Array.from_buffer(get_voltage_array(wavefronts.data), wavefronts.number_of_layers, Decimal('0'))
+            magnitude_current = Triangular_Array.from_buffer(get_current_array(wavefronts.data), wavefronts.number_of_layers, Decimal('0'))
+        else:
+            # dense fanouts, such as cropped fanouts that have not been multiplicatively merged
+            magnitude_voltage = get_voltage_array(np.asarray(wavefronts))
+            magnitude_current = get_current_array(np.asarray(wavefronts))
+        
+        return cls(Data_Input, is_Inductor, is_Sending, magnitude_voltage, magnitude_current)
+
+    @property
+    def shape(self):
+        return self.magnitude_voltage.shape
+
+    @property
+    def ndim(self):
+        return self.magnitude_voltage.ndim
+
+    @property
+    def dtype(self):
+        return self.magnitude_voltage.dtype
+
+    @property
+    def time_start(self):
+        """the start times of the wavefronts as a float64 array.
+        """
+        time = self.L_index * float(self.Data_Input.Inductor_Time*2) + self.C_index * float(self.Data_Input.Capacitor_Time*2)
+        if not self.is_Sending:
+            time = time + float(self.get_line_time())
+        return time
+
+    @property
+    def time_end(self):
+        """the end times of the wavefronts as a float64 array.
+        """
+        return self.time_start + float(self.get_line_time())
+
+    def get_line_time(self):
+        """the one way transit time of the transmission line the wavefronts travel in.
+        """
+        if self.is_Inductor:
+            return self.Data_Input.Inductor_Time
+        else:
+            return self.Data_Input.Capacitor_Time
+
+    def get_wavefront(self, L : int, C : int, magnitude_voltage, magnitude_current):
+        """Materializes the wavefront of grid node [L,C] with the provided magnitudes.
+        Float magnitudes are converted to Decimal to be compatible with the Decimal based wavefront objects.
+
+        :return: the materialized wavefront
+        :rtype: Wavefront_Inductive or Wavefront_Capacitive
+        """
+        if not isinstance(magnitude_voltage, Decimal):
+            magnitude_voltage = Decimal(repr(float(magnitude_voltage)))
+            magnitude_current = Decimal(repr(float(magnitude_current)))
+
+        time_start = int(L)*self.Data_Input.Inductor_Time*2 + int(C)*self.Data_Input.Capacitor_Time*2
+        if not self.is_Sending:
+            time_start += self.get_line_time()
+
+        if self.is_Inductor:
+            return Wavefront_Inductive.from_magnitudes(self.Data_Input, time_start, self.is_Sending, magnitude_voltage, magnitude_current)
+        else:
+            return Wavefront_Capacitive.from_magnitudes(self.Data_Input, time_start, self.is_Sending, magnitude_voltage, magnitude_current)
+
+    def map_magnitudes(self, array_function):
+        """Applies a function to both magnitude arrays, returning a new 2D Wavefront_Array.
+        Used for fanout transformations that preserve the meaning of grid co-ordinates, like multiplicative merging.
+
+        :param array_function: function taking and returning a 2D magnitude array
+        :type array_function: Callable
+        :return: the transformed wavefronts
+        :rtype: Wavefront_Array
+        """
+        return Wavefront_Array(self.Data_Input, self.is_Inductor, self.is_Sending, array_function(self.magnitude_voltage), array_function(self.magnitude_current))
+
+    def __getitem__(self, key):
+        magnitude_voltage = self.magnitude_voltage[key]
+        magnitude_current = self.magnitude_current[key]
+        L_index = self.L_index[key]
+        C_index = self.C_index[key]
+
+        if np.ndim(magnitude_voltage) == 0:
+            return self.get_wavefront(L_index, C_index, magnitude_voltage, magnitude_current)
+
+        return Wavefront_Array(self.Data_Input, self.is_Inductor, self.is_Sending, magnitude_voltage, magnitude_current, L_index, C_index)
+
+    def __len__(self):
+        return len(self.magnitude_voltage)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+@dataclass
+class Data_Layer_Storage:
+    """Stores the data of a single layer of a commutative fanout, as produced by :py:func:`Wavefront_Generation.Generate_Wavefront_Layers`.
+    A layer holds the grid nodes with L + C = layer_number, ordered with increasing L. 
+    All arrays are one-dimensional with an entry for each node of the layer, 
+    the magnitude arrays have the same meaning as the fanout arrays of :py:class:`Data_Output_Storage`.
+
+    :param layer_number: the layer of the fanout, L + C
+    :type layer_number: int
+    :param L_index: the L co-ordinate of the nodes
+    :type L_index: np.ndarray[int]
+    :param C_index: the C co-ordinate of the nodes
+    :type C_index: np.ndarray[int]
+    :param Time_Units: the return times of the nodes as integer multiples of the GCD of the time delays
+    :type Time_Units: np.ndarray[int]
+    :param Time: the return times of the nodes
+    :type Time: np.ndarray[float] or np.ndarray[Decimal]
+    :param Voltage_Interconnect_Inductor: interconnect voltage change of the inductor at the nodes
+    :type Voltage_Interconnect_Inductor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Current_Interconnect_Inductor: interconnect current change of the inductor at the nodes
+    :type Current_Interconnect_Inductor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Voltage_Interconnect_Capacitor: interconnect voltage change of the capacitor at the nodes
+    :type Voltage_Interconnect_Capacitor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Current_Interconnect_Capacitor: interconnect current change of the capacitor at the nodes
+    :type Current_Interconnect_Capacitor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Voltage_Sending_Inductor: voltage of the wavefronts sent into the inductor
+    :type Voltage_Sending_Inductor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Current_Sending_Inductor: current of the wavefronts sent into the inductor
+    :type Current_Sending_Inductor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Voltage_Sending_Capacitor: voltage of the wavefronts sent into the capacitor
+    :type Voltage_Sending_Capacitor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Current_Sending_Capacitor: current of the wavefronts sent into the capacitor
+    :type Current_Sending_Capacitor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Voltage_Returning_Inductor: voltage of the wavefronts returning from the inductor
+    :type Voltage_Returning_Inductor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Current_Returning_Inductor: current of the wavefronts returning from the inductor
+    :type Current_Returning_Inductor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Voltage_Returning_Capacitor: voltage of the wavefronts returning from the capacitor
+    :type Voltage_Returning_Capacitor: np.ndarray[float] or np.ndarray[Decimal]
+    :param Current_Returning_Capacitor: current of the wavefronts returning from the capacitor
+    :type Current_Returning_Capacitor: np.ndarray[float] or np.ndarray[Decimal]
+    """
+    layer_number : int
+    
+    L_index : np.ndarray
+    C_index : np.ndarray
+    
+    Time_Units : np.ndarray
+    Time : np.ndarray
+    
+    Voltage_Interconnect_Inductor : np.ndarray
+    Current_Interconnect_Inductor : np.ndarray
+    Voltage_Interconnect_Capacitor : np.ndarray
+    Current_Interconnect_Capacitor : np.ndarray
+    
+    Voltage_Sending_Inductor : np.ndarray
+    Current_Sending_Inductor : np.ndarray
+    Voltage_Sending_Capacitor : np.ndarray
+    Current_Sending_Capacitor : np.ndarray
+    
+    Voltage_Returning_Inductor : np.ndarray
+    Current_Returning_Inductor : np.ndarray
+    Voltage_Returning_Capacitor : np.ndarray
+    Current_Returning_Capacitor : np.ndarray
+
+@dataclass
+class Data_Frontier_Storage:
+    """The state a simulated interface is continued from when it is extended to a later stop time, see :py:func:`Wavefront_Generation.Extend_Interface`. 
+    Kept on the :py:class:`Data_Interface_Storage` object, so an extension only generates, merges and orders what occurs after the previous stop time.
+
+    :param layer: the last layer of the commutative fanout, including its returning wavefronts which are not stored in the fanout
+    :type layer: Data_Layer_Storage
+    :param merged_fanouts: the multiplicatively merged fanouts before they are cropped, keyed by the field names of :py:class:`Data_Layer_Storage`. 
+        The rows of the fanouts are views of larger buffers (kept in 'buffers'), so new rows are appended in place. 
+        Nodes that occur after the stop time and lie outside the cropped merged data may not be up to date, they are merged again when an extension uses them. 
+        None if multiplicative merging does not occur, the merged fanouts are then the commutative fanouts.
+    :type merged_fanouts: Dict[str, np.ndarray]
+    """
+    layer : Data_Layer_Storage
+    merged_fanouts : dict = None
+    buffers : dict = field(default_factory=dict, repr=False)
+
 @dataclass
 class Data_Output_Storage:
     """Stores data of various types of fanout diagrams after simulation. 
@@ -862,6 +1522,8 @@ class Data_Output_Storage:
         There are a total of 9 arrays stored, one for the arrival time of each grid node, 
         four for the current and voltage at the interconncet for the capacitor and inductor, 
         and another four for the sending and returning wavefronts of the capacitor and inductor. 
+        Commutative fanouts only fill the triangle of simulated layers and are stored packed in a :py:class:`Triangular_Array`, 
+        which is indexed in the same Array[L,C] format.
         
         :param Time: 2D numpy array of the return times of grid nodes
         :type Time: np.ndarray[Decimal]
@@ -918,6 +1580,32 @@ class Data_Output_Storage:
     
     has_merged : bool 
     
+    @classmethod
+    def from_loaders(cls, loaders : dict, **values):
+        """Creates a storage object whose fields are read when they are first used, as done by :py:meth:`Data_Interface_Storage.load`. 
+        A field is read by calling its loader once, the result is then stored as a normal attribute.
+
+        :param loaders: functions without arguments that read each lazy field, keyed by field name
+        :type loaders: Dict[str, Callable]
+        :param values: the values of the other attributes of the object
+        :return: the storage object
+        :rtype: Data_Output_Storage (same as cls)
+        """
+        storage = cls.__new__(cls)
+        storage.__dict__.update(values)
+        storage.lazy_fields = loaders
+        return storage
+    
+    def __getattr__(self, name):
+        # only called for attributes that are not set, such as the lazy fields of a loaded object (see from_loaders)
+        lazy_fields = self.__dict__.get('lazy_fields')
+        if lazy_fields is None or name not in lazy_fields:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        
+        value = lazy_fields[name]()
+        setattr(self, name, value)
+        return value
+    
     def get_interconnect_array(self,which_string):
         """A method for getting interconnect arrays with a sting enquirey.
 
@@ -994,16 +1682,285 @@ class Data_Output_Storage:
         else:
             raise ValueError("Incorrect plotting choice,\'"+which_string+"\' is not an option. Options are : "+ str(allowed_strings))
 
-@dataclass
+#: The typed columns of the chronological events stored in :py:attr:`Data_Output_Storage_Ordered.Events`
+ordered_event_dtype = np.dtype([
+    ('Time', np.float64),
+    ('Voltage_Interconnect_Inductor', np.float64),
+    ('Current_Interconnect_Inductor', np.float64),
+    ('Voltage_Interconnect_Capacitor', np.float64),
+    ('Current_Interconnect_Capacitor', np.float64),
+    ('L', np.int32),
+    ('C', np.int32)
+])
+
+#: The typed columns of the absolute interconnect values stored in :py:attr:`Data_Output_Storage_Ordered.Cumulative`
+interconnect_value_dtype = np.dtype([
+    ('Voltage_Interconnect_Inductor', np.float64),
+    ('Current_Interconnect_Inductor', np.float64),
+    ('Voltage_Interconnect_Capacitor', np.float64),
+    ('Current_Interconnect_Capacitor', np.float64)
+])
+
+@dataclass(init=False)
 class Data_Output_Storage_Ordered(Data_Output_Storage):
     """A dataclass that stores ordered inteface output data in form of single dimenstional arrays. 
     All the core arrays that are present in the Data_Output_Storage class are present here but in a one-dimensional chronological form.
+    The wavefronts are stored as one-dimensional :py:class:`Wavefront_Array` objects, wavefront objects are only created when they are indexed.
     
-    :param Indexes: An additonal array, indicating the grid co-ordiantes on the merged fanout structure in the order events occured. 
-        Is a single dimesional list of (L,C) coordiante lists. The inner lists take form of [L,C].
-    :type Indexes: List[Lists]
+    The events are stored in a typed structured array, Events, with the columns of :py:data:`ordered_event_dtype`. 
+    These columns can be used directly in vectorized numpy operations. 
+    The Time, interconnect and Indexes fields are derived from Events when accessed. 
+    If the simulation has Decimal values (the 'decimal' and 'exact' engines) the exact interconnect changes are stored in Exact, 
+    the interconnect fields are then Decimal arrays and the times are calculated exactly from the grid co-ordinates when Time is first accessed, 
+    and kept with the events.
+    
+    :param Events: structured array of the float64 times and interconnect changes and int32 grid co-ordinates of the events
+    :type Events: np.ndarray[ordered_event_dtype]
+    :param Wavefronts_Sending_Inductor: the wavefronts sent into the inductor at each event
+    :type Wavefronts_Sending_Inductor: Wavefront_Array
+    :param Wavefronts_Sending_Capacitor: the wavefronts sent into the capacitor at each event
+    :type Wavefronts_Sending_Capacitor: Wavefront_Array
+    :param Wavefronts_Returning_Inductor: the wavefronts returning from the inductor at each event
+    :type Wavefronts_Returning_Inductor: Wavefront_Array
+    :param Wavefronts_Returning_Capacitor: the wavefronts returning from the capacitor at each event
+    :type Wavefronts_Returning_Capacitor: Wavefront_Array
+    :param has_merged: indicates if the data stored has been multiplicatively merged or not.
+    :type has_merged: bool
+    :param Exact: the Decimal interconnect changes of the events keyed by the names of :py:data:`interconnect_value_dtype`, 
+        None if the simulation has float values (default:None)
+    :type Exact: Dict[str, np.ndarray[Decimal]]
+    :param Cumulative: structured array of the absolute interconnect values after each event, the prefix sums of the interconnect changes in Events.
+        Built from Events if not provided (default:None)
+    :type Cumulative: np.ndarray[interconnect_value_dtype]
+    
+    .. code-block:: python
+        :caption: vectorized use of the typed event columns
+        
+        events = interface_data.data_output_ordered.Events
+        
+        # absolute interconnect voltage of the inductor after each event
+        voltage_inductor = np.cumsum(events['Voltage_Interconnect_Inductor'])
+        
+        # the same values are cached, and can be found at any time
+        voltage_inductor = interface_data.data_output_ordered.Cumulative['Voltage_Interconnect_Inductor']
+        voltage_inductor_at_time = interface_data.data_output_ordered.value_at('12.5')['Voltage_Interconnect_Inductor']
     """
-    Indexes : np.ndarray
+    Events : np.ndarray = field(repr=False)
+    # no defaults, so the fields of loaded objects can be lazy (see Data_Output_Storage.from_loaders)
+    Exact : dict = field(repr=False, compare=False)
+    Cumulative : np.ndarray = field(repr=False, compare=False)
+    spatial_indexes : dict = field(default=None, repr=False, compare=False)
+    buffers : dict = field(default=None, repr=False, compare=False)
+    exact_time : np.ndarray = field(default=None, repr=False, compare=False)
+    
+    def __init__(self, Events : np.ndarray, Wavefronts_Sending_Inductor : Wavefront_Array, Wavefronts_Sending_Capacitor : Wavefront_Array, 
+                 Wavefronts_Returning_Inductor : Wavefront_Array, Wavefronts_Returning_Capacitor : Wavefront_Array, has_merged : bool, 
+                 Exact : dict = None, Cumulative : np.ndarray = None):
+        
+        self.Events = Events
+        
+        self.Wavefronts_Sending_Inductor = Wavefronts_Sending_Inductor
+        self.Wavefronts_Sending_Capacitor = Wavefronts_Sending_Capacitor
+        self.Wavefronts_Returning_Inductor = Wavefronts_Returning_Inductor
+        self.Wavefronts_Returning_Capacitor = Wavefronts_Returning_Capacitor
+        
+        self.has_merged = has_merged
+        self.Exact = Exact
+        self.buffers = dict()
+        self.exact_time = None
+        
+        if Cumulative is None:
+            self.update_cumulative()
+        else:
+            self.Cumulative = Cumulative
+            self.spatial_indexes = dict()
+    
+    @property
+    def Time(self):
+        """the times of the events, a Decimal array if the exact values are stored, else the float64 'Time' column of Events.
+        """
+        if self.Exact is None:
+            return self.Events['Time']
+        
+        if self.exact_time is None:
+            self.exact_time = self.get_exact_time(self.Events)
+        return self.exact_time
+    
+    def get_exact_time(self, Events : np.ndarray):
+        """Calculates the Decimal times of events from their grid co-ordinates, the node [L,C] occurs at L x (2 x Inductor_Time) + C x (2 x Capacitor_Time).
+        """
+        Data_Input = self.Wavefronts_Sending_Inductor.Data_Input
+        return Events['L'].astype(object) * (Data_Input.Inductor_Time*2) + Events['C'].astype(object) * (Data_Input.Capacitor_Time*2)
+    
+    def get_interconnect_changes(self, name : str):
+        """the changes of an interconnect value at each event, exact Decimal values if stored, else the float64 column of Events.
+        """
+        if self.Exact is None:
+            return self.Events[name]
+        return self.Exact[name]
+    
+    @property
+    def Voltage_Interconnect_Inductor(self):
+        return self.get_interconnect_changes('Voltage_Interconnect_Inductor')
+    
+    @property
+    def Current_Interconnect_Inductor(self):
+        return self.get_interconnect_changes('Current_Interconnect_Inductor')
+    
+    @property
+    def Voltage_Interconnect_Capacitor(self):
+        return self.get_interconnect_changes('Voltage_Interconnect_Capacitor')
+    
+    @property
+    def Current_Interconnect_Capacitor(self):
+        return self.get_interconnect_changes('Current_Interconnect_Capacitor')
+    
+    @property
+    def Indexes(self):
+        """the grid co-ordinates of the events on the merged fanout in the order they occured, an array of [L,C] rows.
+        """
+        return np.stack((self.Events['L'], self.Events['C']), axis=1)
+    
+    def update_cumulative(self):
+        """Rebuilds the cached prefix sums in Cumulative from the Events array, and clears the cached spatial indexes.
+        """
+        Cumulative = np.empty(len(self.Events), dtype=interconnect_value_dtype)
+        for name in interconnect_value_dtype.names:
+            Cumulative[name] = np.cumsum(self.Events[name])
+        
+        self.Cumulative = Cumulative
+        self.spatial_indexes = dict()
+    
+    def append_events(self, number_kept : int, data_output_ordered : 'Data_Output_Storage_Ordered'):
+        """Replaces the events after the first number_kept events with the events of other ordered data in place, used to extend a simulation (see :py:func:`Wavefront_Generation.Extend_Interface`). 
+        The arrays are stored in over-allocated buffers (see :py:func:`append_to_buffer`), so appending is O(number of events appended) amortized. 
+        The prefix sums in Cumulative are continued from the kept events, and the cached spatial indexes are cleared.
+
+        :param number_kept: the number of events to keep
+        :type number_kept: int
+        :param data_output_ordered: the events to append, ordered data of the same engine
+        :type data_output_ordered: Data_Output_Storage_Ordered
+        """
+        def append(name, array, values):
+            self.buffers[name], array = append_to_buffer(self.buffers.get(name), array[0:number_kept], values)
+            return array
+        
+        Cumulative = np.empty(len(data_output_ordered.Events), dtype=interconnect_value_dtype)
+        for name in interconnect_value_dtype.names:
+            # the sums continue sequentially from the last kept event, as done by np.cumsum over all events
+            last_value = self.Cumulative[name][number_kept-1] if number_kept > 0 else 0.0
+            Cumulative[name] = np.cumsum(np.concatenate(([last_value], data_output_ordered.Events[name])))[1:]
+        
+        self.Events = append('Events', self.Events, data_output_ordered.Events)
+        self.Cumulative = append('Cumulative', self.Cumulative, Cumulative)
+        
+        if self.Exact is not None:
+            self.Exact = {name : append('Exact.' + name, values, data_output_ordered.Exact[name]) for name, values in self.Exact.items()}
+        
+        if self.exact_time is not None:
+            self.exact_time = append('exact_time', self.exact_time, self.get_exact_time(data_output_ordered.Events))
+        
+        for name in ['Wavefronts_Sending_Inductor', 'Wavefronts_Sending_Capacitor', 'Wavefronts_Returning_Inductor', 'Wavefronts_Returning_Capacitor']:
+            wavefronts, new_wavefronts = getattr(self, name), getattr(data_output_ordered, name)
+            setattr(self, name, Wavefront_Array(
+                new_wavefronts.Data_Input, wavefronts.is_Inductor, wavefronts.is_Sending,
+                append(name + '.voltage', wavefronts.magnitude_voltage, new_wavefronts.magnitude_voltage),
+                append(name + '.current', wavefronts.magnitude_current, new_wavefronts.magnitude_current),
+                append(name + '.L_index', wavefronts.L_index, new_wavefronts.L_index),
+                append(name + '.C_index', wavefronts.C_index, new_wavefronts.C_index)
+            ))
+        
+        self.spatial_indexes = dict()
+    
+    def get_spatial_index(self, is_Inductor : bool):
+        """Gets the sorted-endpoint index of the wavefronts of a transmission line, used by :py:func:`Wavefront_Generation.get_spatial_voltage_current_at_time`.
+        The index is built once and cached.
+        
+        The wavefronts are ordered chronologically, so their start and end times are sorted lists, 
+        and the wavefronts that are in flight at a time are found with a binary search of these lists. 
+        Prefix sums of the wavefront magnitudes give the DC value of the line without a loop over the past wavefronts. 
+        The times follow from the grid co-ordinates of the wavefronts, float magnitudes are converted to Decimal as done when indexing a :py:class:`Wavefront_Array`.
+
+        :param is_Inductor: if the index is of the inductor or capacitor wavefronts
+        :type is_Inductor: bool
+        :return: dictionary of Decimal lists, the 'Sending_Start', 'Returning_Start' and 'Returning_End' times of the wavefronts, 
+            and the 'Sending_Voltage', 'Sending_Current', 'Returning_Voltage' and 'Returning_Current' prefix sums of the magnitudes, starting at zero.
+        :rtype: Dict
+        """
+        if is_Inductor not in self.spatial_indexes:
+            if is_Inductor:
+                sending_wavefronts = self.Wavefronts_Sending_Inductor
+                returning_wavefronts = self.Wavefronts_Returning_Inductor
+            else:
+                sending_wavefronts = self.Wavefronts_Sending_Capacitor
+                returning_wavefronts = self.Wavefronts_Returning_Capacitor
+            
+            # exact times and magnitudes are found from the arrays, without creating wavefront objects
+            Data_Input = sending_wavefronts.Data_Input
+            line_time = sending_wavefronts.get_line_time()
+            node_times = [int(L)*Data_Input.Inductor_Time*2 + int(C)*Data_Input.Capacitor_Time*2 for L, C in zip(sending_wavefronts.L_index, sending_wavefronts.C_index)]
+            
+            def get_decimal_magnitudes(magnitudes):
+                if np.asarray(magnitudes).dtype == object:
+                    return list(magnitudes)
+                return [Decimal(repr(float(magnitude))) for magnitude in magnitudes]
+            
+            def prefix_sum(values):
+                return list(itertools.accumulate(values, initial = Decimal('0')))
+            
+            self.spatial_indexes[is_Inductor] = {
+                'Sending_Start' : node_times,
+                'Returning_Start' : [node_time + line_time for node_time in node_times],
+                'Returning_End' : [(node_time + line_time) + line_time for node_time in node_times],
+                'Sending_Voltage' : prefix_sum(get_decimal_magnitudes(sending_wavefronts.magnitude_voltage)),
+                'Sending_Current' : prefix_sum(get_decimal_magnitudes(sending_wavefronts.magnitude_current)),
+                'Returning_Voltage' : prefix_sum(get_decimal_magnitudes(returning_wavefronts.magnitude_voltage)),
+                'Returning_Current' : prefix_sum(get_decimal_magnitudes(returning_wavefronts.magnitude_current))
+            }
+        
+        return self.spatial_indexes[is_Inductor]
+    
+    def values_at(self, times):
+        """The absolute interconnect values at the provided times, found by a binary search of the event times and the cached prefix sums in Cumulative. 
+        Events that occur at a time are included in the values at that time, values before the first event are zero.
+
+        :param times: the times of the values
+        :type times: np.ndarray[float] or List[Decimal]
+        :return: the four interconnect values at each time
+        :rtype: np.ndarray[interconnect_value_dtype]
+        """
+        times = np.asarray(times, dtype=np.float64)
+        event_index = np.searchsorted(self.Events['Time'], times, side='right') - 1
+        
+        values = np.zeros(times.shape, dtype=interconnect_value_dtype)
+        is_after_first_event = event_index >= 0
+        values[is_after_first_event] = self.Cumulative[event_index[is_after_first_event]]
+        return values
+    
+    def value_at(self, time):
+        """The absolute interconnect values at a single time, see :py:meth:`values_at`.
+
+        :param time: the time of the values
+        :type time: str, Decimal or float
+        :return: the four interconnect values, indexed by the names of :py:data:`interconnect_value_dtype`
+        :rtype: np.void
+        """
+        return self.values_at(float(time))[()]
+    
+    def get_interconnect_cumulative(self, which_string):
+        """A method for getting the cached absolute interconnect values after each event with a string enquirey.
+
+        :param which_string: possible options: ["voltage inductor", "current inductor", "voltage capacitor", "current capacitor"]
+        :type which_string: str
+        :raises ValueError: errors if incorrect string is given. 
+        :return: the absolute values after each event
+        :rtype: np.ndarray[float]
+        """
+        allowed_strings = ["voltage inductor", "current inductor", "voltage capacitor", "current capacitor"]
+        if(which_string.lower() not in allowed_strings):
+            raise ValueError("Incorrect plotting choice,\'"+which_string+"\' is not an option. Options are : "+ str(allowed_strings))
+        
+        return self.Cumulative[interconnect_value_dtype.names[allowed_strings.index(which_string.lower())]]
 
     def get_sending_wavefronts_magnitudes(self,which_string):
         """A method for extracting voltage or current from *sending* wavefronts.
@@ -1055,6 +2012,107 @@ class Data_Output_Storage_Ordered(Data_Output_Storage):
         else:
             raise ValueError("Incorrect plotting choice,\'"+which_string+"\' is not an option. Options are : "+ str(allowed_strings))
 
+#: The version of the directory format written by :py:meth:`Data_Interface_Storage.save`
+interface_storage_format_version = 3
+
+def save_storage_field(directory : str, name : str, value):
+    """Saves a field of an output storage object as typed, uncompressed .npy files, see :py:meth:`Data_Interface_Storage.save`. 
+    Wavefront_Arrays and Triangular_Arrays are saved as their underlying arrays. 
+    Decimal arrays are saved as a structured array of typed columns, the float64 'value' of each entry and its 'exact' string representation, 
+    so the values can be used without conversion and the Decimal values are kept exactly.
+
+    :param directory: the directory the files are saved in
+    :type directory: str
+    :param name: the name of the field, used as the prefix of its files
+    :type name: str
+    :param value: the field to save
+    :type value: Wavefront_Array, Triangular_Array, np.ndarray or list
+    :return: description of the saved field, used by :py:func:`load_storage_field`
+    :rtype: dict
+    """
+    if value is None:
+        return None
+    
+    elif isinstance(value, Wavefront_Array):
+        return {
+            'kind' : 'wavefronts',
+            'is_Inductor' : bool(value.is_Inductor),
+            'is_Sending' : bool(value.is_Sending),
+            'voltage' : save_storage_field(directory, name + '.voltage', value.magnitude_voltage),
+            'current' : save_storage_field(directory, name + '.current', value.magnitude_current),
+            # the co-ordinates of 2D fanouts are implied
+            'L_index' : None if value.ndim == 2 else save_storage_field(directory, name + '.L_index', value.L_index),
+            'C_index' : None if value.ndim == 2 else save_storage_field(directory, name + '.C_index', value.C_index)
+        }
+    
+    elif isinstance(value, Triangular_Array):
+        return {
+            'kind' : 'triangular',
+            'number_of_layers' : int(value.number_of_layers),
+            'fill_value' : str(value.fill_value),
+            'data' : save_storage_field(directory, name + '.data', value.data)
+        }
+    
+    array = np.asarray(value)
+    if array.dtype == object:
+        kind = 'decimal'
+        exact = np.array([str(entry) for entry in array.ravel()], dtype = 'S').reshape(array.shape)
+        
+        column = np.empty(array.shape, dtype = [('value', np.float64), ('exact', exact.dtype)])
+        column['value'] = np.asarray(array, dtype = np.float64)
+        column['exact'] = exact
+        array = column
+    else:
+        kind = 'array'
+    
+    file_name = name + '.npy'
+    np.save(os.path.join(directory, file_name), array, allow_pickle = False)
+    return {'kind' : kind, 'file' : file_name}
+
+def load_storage_field(directory : str, description : dict, Data_Input : Data_Input_Storage):
+    """Loads a field saved by :py:func:`save_storage_field`. 
+    All arrays are memory-mapped, Decimal arrays are converted from the memory-mapped 'exact' column when loaded.
+
+    :param directory: the directory the files are saved in
+    :type directory: str
+    :param description: description of the saved field
+    :type description: dict
+    :param Data_Input: input data of the interface the field belongs to
+    :type Data_Input: Data_Input_Storage
+    :raises ValueError: if the kind of the field is unknown
+    :return: the loaded field
+    :rtype: Wavefront_Array, Triangular_Array or np.ndarray
+    """
+    if description is None:
+        return None
+    
+    elif description['kind'] == 'wavefronts':
+        return Wavefront_Array(
+            Data_Input, description['is_Inductor'], description['is_Sending'],
+            load_storage_field(directory, description['voltage'], Data_Input),
+            load_storage_field(directory, description['current'], Data_Input),
+            load_storage_field(directory, description['L_index'], Data_Input),
+            load_storage_field(directory, description['C_index'], Data_Input)
+        )
+    
+    elif description['kind'] == 'triangular':
+        data = load_storage_field(directory, description['data'], Data_Input)
+        if data.dtype == object:
+            fill_value = Decimal(description['fill_value'])
+        else:
+            fill_value = data.dtype.type(description['fill_value'])
+        return Triangular_Array.from_buffer(data, description['number_of_layers'], fill_value)
+    
+    elif description['kind'] == 'array':
+        return np.load(os.path.join(directory, description['file']), mmap_mode = 'r')
+    
+    elif description['kind'] == 'decimal':
+        column = np.load(os.path.join(directory, description['file']), mmap_mode = 'r')
+        return np.array([Decimal(entry.decode()) for entry in column['exact'].ravel()] , dtype = object).reshape(column.shape)
+    
+    else:
+        raise ValueError(f"Field kind '{description['kind']}' is not an option, options are: ['wavefronts', 'triangular', 'array', 'decimal']")
+
 @dataclass
 class Data_Interface_Storage:
     """A Dataclass that holds all simulation data for a praticular interface. Contains four data storage components that are also the initialization parameters.
@@ -1062,12 +2120,15 @@ class Data_Interface_Storage:
     
     :param data_input: input data and calcualted parameters of the interface
     :type data_input: Data_Input_Storage
-    :param data_output_commutative: Data_Output_Storage object for commutative fanouts
+    :param data_output_commutative: Data_Output_Storage object for commutative fanouts, None if the merged fanouts were generated directly
     :type data_output_commutative: Data_Output_Storage
     :param data_output_multiplicative: Data_Output_Storage object for multiplicatively merged fanouts
     :type data_output_multiplicative: Data_Output_Storage
     :param data_output_ordered: Chronologically ordered merged data in a linear format 
     :type data_output_ordered: Data_Output_Storage_Ordered
+    :param frontier: the state the simulation is extended from (see :py:meth:`extend`), 
+        None if it is not kept, it is then rebuilt from the commutative fanouts when extending (default:None)
+    :type frontier: Data_Frontier_Storage
     
     .. code-block::
         :caption: make a `Data_Interface_Storage` object and plot it's refelction diagrm
@@ -1095,3 +2156,125 @@ class Data_Interface_Storage:
     data_output_commutative : Data_Output_Storage
     data_output_multiplicative : Data_Output_Storage
     data_output_ordered : Data_Output_Storage_Ordered
+    frontier : Data_Frontier_Storage = field(default=None, repr=False, compare=False)
+    
+    def save(self, directory : str):
+        """Saves the interface to a directory in a columnar format that can be opened with :py:meth:`load`. 
+        The parameters of the input data are stored in 'metadata.json', and every fanout and ordered field is stored as a typed, uncompressed .npy array. 
+        Fanouts of wavefront objects are saved as their magnitudes.
+        
+        Only the input parameters are saved, customised event solvers of the input data are not.
+
+        :param directory: the directory to save the interface in, created if it does not exist
+        :type directory: str
+        
+        .. code-block::
+            :caption: save an interface, and open it in a later session
+        
+            from Wavefront_Generation import Full_Cycle
+            from Wavefront_Storage import Data_Interface_Storage
+
+            interface_data = Full_Cycle(L_time = '3.6',C_time = '3.2', engine = 'numpy')
+            interface_data.save('interface_data')
+            
+            # fields are memory-mapped, and only read when used
+            interface_data = Data_Interface_Storage.load('interface_data')
+        """
+        os.makedirs(directory, exist_ok = True)
+        
+        metadata = {
+            'format_version' : interface_storage_format_version,
+            'input_values' : self.data_input.input_values,
+            'SPICE_input_values' : self.data_input.SPICE_input_values,
+            'outputs' : dict()
+        }
+        
+        output_field_names = [output_field.name for output_field in fields(Data_Output_Storage) if output_field.name != 'has_merged']
+        
+        for output_name in ['data_output_commutative', 'data_output_multiplicative']:
+            data_output = getattr(self, output_name)
+            if data_output is None:
+                metadata['outputs'][output_name] = None
+                continue
+            
+            if not isinstance(data_output.Wavefronts_Sending_Inductor, Wavefront_Array):
+                data_output = copy.copy(data_output)
+                for name, is_Inductor, is_Sending in [('Wavefronts_Sending_Inductor', True, True), ('Wavefronts_Sending_Capacitor', False, True), 
+                                                      ('Wavefronts_Returning_Inductor', True, False), ('Wavefronts_Returning_Capacitor', False, False)]:
+                    setattr(data_output, name, Wavefront_Array.from_wavefronts(self.data_input, getattr(data_output, name), is_Inductor, is_Sending))
+            
+            metadata['outputs'][output_name] = {
+                'has_merged' : bool(data_output.has_merged),
+                'fields' : {name : save_storage_field(directory, output_name + '.' + name, getattr(data_output, name)) for name in output_field_names}
+            }
+        
+        # ordered data is saved as its stored representation, the other fields are derived from it
+        data_output_ordered = self.data_output_ordered
+        ordered_field_names = ['Events', 'Cumulative'] + [name for name in output_field_names if name.startswith('Wavefronts_')]
+        ordered_fields = {name : save_storage_field(directory, 'data_output_ordered.' + name, getattr(data_output_ordered, name)) for name in ordered_field_names}
+        
+        if data_output_ordered.Exact is None:
+            exact_fields = None
+        else:
+            exact_fields = {name : save_storage_field(directory, 'data_output_ordered.Exact.' + name, values) for name, values in data_output_ordered.Exact.items()}
+        
+        metadata['outputs']['data_output_ordered'] = {'has_merged' : bool(data_output_ordered.has_merged), 'fields' : ordered_fields, 'exact' : exact_fields}
+        
+        with open(os.path.join(directory, 'metadata.json'), 'w') as metadata_file:
+            json.dump(metadata, metadata_file, indent = 4)
+    
+    @staticmethod
+    def load(directory : str):
+        """Opens an interface saved with :py:meth:`save`. 
+        Fields are loaded when they are first used (see :py:meth:`Data_Output_Storage.from_loaders`) and are memory-mapped, 
+        so opening an interface reads no arrays and only the pages of a field that are used are read from disk. 
+        The Decimal values of a field (of the 'decimal' and 'exact' engines) are converted from its exact string column when the field is first used.
+
+        :param directory: the directory the interface is saved in
+        :type directory: str
+        :raises ValueError: if the directory was saved with a different format version
+        :return: the saved interface
+        :rtype: Data_Interface_Storage
+        """
+        with open(os.path.join(directory, 'metadata.json'), 'r') as metadata_file:
+            metadata = json.load(metadata_file)
+        
+        if metadata['format_version'] != interface_storage_format_version:
+            raise ValueError(f"Saved format version {metadata['format_version']} is not supported, the supported version is {interface_storage_format_version}.")
+        
+        data_input = Data_Input_Storage(**dict(metadata['input_values'], show_about = False))
+        data_input.input_values = metadata['input_values']
+        data_input.SPICE_input_values = metadata['SPICE_input_values']
+        
+        def get_loader(description):
+            return lambda : load_storage_field(directory, description, data_input)
+        
+        def get_exact_loader(descriptions):
+            return lambda : {name : load_storage_field(directory, description, data_input) for name, description in descriptions.items()}
+        
+        data_outputs = dict()
+        for output_name in ['data_output_commutative', 'data_output_multiplicative']:
+            output_metadata = metadata['outputs'][output_name]
+            if output_metadata is None:
+                data_outputs[output_name] = None
+                continue
+            
+            data_outputs[output_name] = Data_Output_Storage.from_loaders(
+                {name : get_loader(description) for name, description in output_metadata['fields'].items()},
+                has_merged = output_metadata['has_merged']
+            )
+        
+        ordered_metadata = metadata['outputs']['data_output_ordered']
+        ordered_loaders = {name : get_loader(description) for name, description in ordered_metadata['fields'].items()}
+        
+        if ordered_metadata['exact'] is None:
+            ordered_loaders['Exact'] = lambda : None
+        else:
+            ordered_loaders['Exact'] = get_exact_loader(ordered_metadata['exact'])
+        
+        data_output_ordered = Data_Output_Storage_Ordered.from_loaders(
+            ordered_loaders,
+            has_merged = ordered_metadata['has_merged'], buffers = dict(), spatial_indexes = dict(), exact_time = None
+        )
+        
+        return Data_Interface_Storage(data_input, data_outputs['data_output_commutative'], data_outputs['data_output_multiplicative'], data_output_ordered)
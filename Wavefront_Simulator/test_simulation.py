@@ -0,0 +1,629 @@
+"""Tests of the simulation, storage and analysis modules. Run with pytest from the Wavefront_Simulator directory.
+"""
+import os
+import time
+import numpy as np
+import pytest
+from collections import OrderedDict
+from decimal import Decimal
+
+import Wavefront_Generation
+from Wavefront_Generation import Full_Cycle_Persistent, get_persistent_cache_key, store_persistent_cache, evict_persistent_cache, sample_line_field, resample_interconnect, get_spatial_voltage_current_at_time, iter_events, Higher_Order_Merging, Order_Data_Output_Merged, get_ordered_indexes, get_nodes_between_times, multiplicative_merging, multiplicative_merging_strided, multiplicative_merging_fused, convert_to_wavefront_arrays, get_fanout_magnitude_arrays, get_time_array, get_time_fanout, get_time_merged, Full_Cycle, Full_Cycle_Cached, Rescale_Interface, Scale_Interface, Extend_Interface, Generate_Wavefront_Layers, Generate_Wavefront_Layers_Numpy, Generate_Wavefront_Layers_Exact
+from Wavefront_Storage import Data_Input_Storage, Data_Interface_Storage, Wavefront_Array, Wavefront_Kintetic, Triangular_Array, interconnect_value_dtype
+from Wavefront_Misc import get_voltage_array, get_current_array, closest_event_to_time, closest_events_to_times
+
+#: Interface parameters with and without multiplicative merging
+merging_input_values = {
+    True : dict(L_time = '7', C_time = '3.4', show_about = False),
+    False : dict(L_time = '7', C_time = '30', Simulation_stop_time = '20', show_about = False)
+}
+
+def get_magnitudes(wavefronts):
+    """the voltage and current magnitudes of wavefronts in any storage format, as float64 arrays"""
+    if isinstance(wavefronts, Wavefront_Array):
+        return np.asarray(wavefronts.magnitude_voltage, dtype = np.float64), np.asarray(wavefronts.magnitude_current, dtype = np.float64)
+
+    wavefronts = np.asarray(wavefronts.to_dense() if isinstance(wavefronts, Triangular_Array) else wavefronts)
+    return np.asarray(get_voltage_array(wavefronts), dtype = np.float64), np.asarray(get_current_array(wavefronts), dtype = np.float64)
+
+def assert_ordered_equal(ordered, ordered_reference, exact = True, rtol = 1e-7):
+    """asserts two ordered data objects hold the same events, bit for bit or to a relative tolerance"""
+    compare = np.testing.assert_array_equal if exact else lambda values, values_reference : np.testing.assert_allclose(values, values_reference, rtol = rtol)
+
+    np.testing.assert_array_equal(np.asarray(ordered.Indexes), np.asarray(ordered_reference.Indexes))
+    for name in ['Time', 'Voltage_Interconnect_Inductor', 'Current_Interconnect_Inductor', 'Voltage_Interconnect_Capacitor', 'Current_Interconnect_Capacitor']:
+        compare(np.asarray(getattr(ordered, name), dtype = np.float64), np.asarray(getattr(ordered_reference, name), dtype = np.float64))
+
+    for name in ['Wavefronts_Sending_Inductor', 'Wavefronts_Sending_Capacitor', 'Wavefronts_Returning_Inductor', 'Wavefronts_Returning_Capacitor']:
+        for magnitudes, magnitudes_reference in zip(get_magnitudes(getattr(ordered, name)), get_magnitudes(getattr(ordered_reference, name))):
+            compare(magnitudes, magnitudes_reference)
+
+@pytest.mark.parametrize('is_Higher_Merging', [True, False])
+@pytest.mark.parametrize('engine', ['decimal', 'exact', 'numpy'])
+def test_save_load_round_trip(tmp_path, engine, is_Higher_Merging):
+    interface = Full_Cycle(engine = engine, **merging_input_values[is_Higher_Merging])
+    assert interface.data_input.is_Higher_Merging == is_Higher_Merging
+
+    interface.save(str(tmp_path))
+    interface_loaded = Data_Interface_Storage.load(str(tmp_path))
+
+    assert interface_loaded.data_input.input_values == interface.data_input.input_values
+    assert_ordered_equal(interface_loaded.data_output_ordered, interface.data_output_ordered)
+
+    for output_name in ['data_output_commutative', 'data_output_multiplicative']:
+        data_output = getattr(interface, output_name)
+        data_output_loaded = getattr(interface_loaded, output_name)
+
+        np.testing.assert_array_equal(np.asarray(data_output_loaded.Voltage_Interconnect_Inductor, dtype = np.float64), np.asarray(data_output.Voltage_Interconnect_Inductor, dtype = np.float64))
+        for magnitudes, magnitudes_reference in zip(get_magnitudes(data_output_loaded.Wavefronts_Returning_Capacitor), get_magnitudes(data_output.Wavefronts_Returning_Capacitor)):
+            np.testing.assert_array_equal(magnitudes, magnitudes_reference)
+
+@pytest.mark.parametrize('is_Higher_Merging', [True, False])
+def test_numpy_engine_matches_decimal_reference(is_Higher_Merging):
+    interface_reference = Full_Cycle(engine = 'decimal', **merging_input_values[is_Higher_Merging])
+    interface = Full_Cycle(engine = 'numpy', **merging_input_values[is_Higher_Merging])
+
+    assert_ordered_equal(interface.data_output_ordered, interface_reference.data_output_ordered, exact = False)
+
+@pytest.mark.parametrize('is_Higher_Merging', [True, False])
+def test_exact_engine_is_identical_to_decimal_reference(is_Higher_Merging):
+    interface_reference = Full_Cycle(engine = 'decimal', **merging_input_values[is_Higher_Merging])
+    interface = Full_Cycle(engine = 'exact', **merging_input_values[is_Higher_Merging])
+
+    assert_ordered_equal(interface.data_output_ordered, interface_reference.data_output_ordered, exact = True)
+    assert list(interface.data_output_ordered.Time) == list(interface_reference.data_output_ordered.Time)
+    for name in ['Voltage_Interconnect_Inductor', 'Current_Interconnect_Capacitor']:
+        assert list(getattr(interface.data_output_ordered, name)) == list(getattr(interface_reference.data_output_ordered, name))
+
+def test_layer_transfer_operator_matches_event_solvers():
+    data_input = Data_Input_Storage(L_time = '3.6', C_time = '3.2', L_impedance = '300', Load_impedance = '40', Simulation_stop_time = '40', show_about = False)
+
+    # the numpy layers are advanced by the transfer operator, the exact layers by the event solvers
+    for layer, layer_reference in zip(Generate_Wavefront_Layers_Numpy(data_input), Generate_Wavefront_Layers_Exact(data_input)):
+        assert layer.layer_number == layer_reference.layer_number
+        np.testing.assert_array_equal(layer.Time_Units, layer_reference.Time_Units)
+        for name in ['Voltage_Interconnect_Inductor', 'Current_Interconnect_Capacitor', 'Voltage_Sending_Capacitor', 'Current_Returning_Inductor']:
+            np.testing.assert_allclose(getattr(layer, name), np.asarray(getattr(layer_reference, name), dtype = np.float64), rtol = 1e-9, atol = 1e-12)
+
+def test_triangular_array_indexing():
+    fanout = Triangular_Array(4, -1)
+    L_index, C_index = fanout.get_grid_indexes()
+    fanout.data[:] = 10*L_index + C_index
+
+    dense = fanout.to_dense()
+    assert dense.shape == (5, 5)
+    for L in range(5):
+        for C in range(5):
+            assert fanout[L, C] == dense[L, C] == (10*L + C if L + C < 4 else -1)
+
+    np.testing.assert_array_equal(fanout[1:3, :], dense[1:3, :])
+    np.testing.assert_array_equal(fanout[[0, 2], [1, 1]], dense[[0, 2], [1, 1]])
+    np.testing.assert_array_equal(fanout.get_layer(3), [3, 12, 21, 30])
+    np.testing.assert_array_equal(fanout + 1, dense + 1)
+
+    fanout[2, 1] = 7
+    assert fanout.get_layer(3)[2] == 7
+    with pytest.raises(IndexError):
+        fanout[2, 2] = 7
+    with pytest.raises(ValueError):
+        Triangular_Array.from_buffer(np.zeros(5), 4)
+
+@pytest.mark.parametrize('engine', ['exact', 'numpy'])
+def test_streamed_layers_match_stored_fanout(engine):
+    data_input = Data_Input_Storage(**merging_input_values[True])
+    data_output_commutative = Full_Cycle(data_input, engine).data_output_commutative
+
+    layer_numbers = []
+    for layer in Generate_Wavefront_Layers(data_input, engine):
+        layer_numbers.append(layer.layer_number)
+        np.testing.assert_array_equal(layer.Time, data_output_commutative.Time.get_layer(layer.layer_number))
+        np.testing.assert_array_equal(layer.Voltage_Interconnect_Inductor, data_output_commutative.Voltage_Interconnect_Inductor.get_layer(layer.layer_number))
+        np.testing.assert_array_equal(layer.Current_Sending_Capacitor, data_output_commutative.Wavefronts_Sending_Capacitor.magnitude_current.get_layer(layer.layer_number))
+
+    assert layer_numbers == list(range(data_input.Number_of_Layers))
+    with pytest.raises(ValueError):
+        Generate_Wavefront_Layers(data_input, 'decimal')
+
+#: Stop times an interface is extended through, before and after multiplicative merging starts
+extension_stop_times = [
+    (dict(L_time = '7', C_time = '3.4', show_about = False), ['40', '90', '300', '320']),
+    (dict(L_time = '3.6', C_time = '3.2', show_about = False), ['100', '101', '130', '200'])
+]
+
+@pytest.mark.parametrize('input_values, stop_times', extension_stop_times)
+@pytest.mark.parametrize('engine', ['decimal', 'exact', 'numpy'])
+def test_extend_matches_longer_simulation(engine, input_values, stop_times):
+    interface = Full_Cycle(engine = engine, **dict(input_values, Simulation_stop_time = stop_times[0]))
+    
+    for stop_time in stop_times[1:]:
+        interface_reference = Full_Cycle(engine = engine, **dict(input_values, Simulation_stop_time = stop_time))
+        assert Extend_Interface(interface, stop_time) is interface
+        
+        assert interface.data_input.Simulation_Stop_Time == interface_reference.data_input.Simulation_Stop_Time
+        assert_ordered_equal(interface.data_output_ordered, interface_reference.data_output_ordered)
+        np.testing.assert_array_equal(interface.data_output_ordered.Cumulative, interface_reference.data_output_ordered.Cumulative)
+        
+        for name in ['Time', 'Voltage_Interconnect_Inductor', 'Current_Interconnect_Capacitor']:
+            np.testing.assert_array_equal(np.asarray(getattr(interface.data_output_multiplicative, name), dtype = np.float64), 
+                                          np.asarray(getattr(interface_reference.data_output_multiplicative, name), dtype = np.float64))
+            np.testing.assert_array_equal(np.asarray(getattr(interface.data_output_commutative, name), dtype = np.float64), 
+                                          np.asarray(getattr(interface_reference.data_output_commutative, name), dtype = np.float64))
+        for magnitudes, magnitudes_reference in zip(get_magnitudes(interface.data_output_multiplicative.Wavefronts_Returning_Capacitor), 
+                                                    get_magnitudes(interface_reference.data_output_multiplicative.Wavefronts_Returning_Capacitor)):
+            np.testing.assert_array_equal(magnitudes, magnitudes_reference)
+    
+    # interfaces without a frontier rebuild it
+    interface_reference = Full_Cycle(engine = engine, **dict(input_values, Simulation_stop_time = '400'))
+    interface.frontier = None
+    Extend_Interface(interface, '400')
+    assert_ordered_equal(interface.data_output_ordered, interface_reference.data_output_ordered)
+    
+    with pytest.raises(ValueError):
+        Extend_Interface(interface, '400')
+    with pytest.raises(ValueError):
+        Extend_Interface(Full_Cycle(engine = 'numpy', is_Direct_Merging = True, **input_values), '2000')
+
+def fail_simulation(*args, **kwargs):
+    raise AssertionError('the interface was simulated instead of served from a cache')
+
+@pytest.mark.parametrize('is_Direct_Merging', [False, True])
+def test_full_cycle_cached_signature(monkeypatch, is_Direct_Merging):
+    monkeypatch.setattr(Wavefront_Generation, 'similarity_cache', OrderedDict())
+    monkeypatch.setattr(Wavefront_Generation, 'persistent_cache_directory', None)
+    input_values = merging_input_values[True]
+    
+    interface = Full_Cycle_Cached(engine = 'numpy', is_Direct_Merging = is_Direct_Merging, **input_values)
+    assert (interface.data_output_commutative is None) == is_Direct_Merging
+    assert list(Wavefront_Generation.similarity_cache.keys())[0][0:2] == ('numpy', is_Direct_Merging)
+    
+    # supplied input data is simulated, and not cached
+    data_input = Data_Input_Storage(**input_values)
+    interface_supplied = Full_Cycle_Cached(data_input, 'numpy', is_Direct_Merging)
+    assert interface_supplied.data_input is data_input
+    assert len(Wavefront_Generation.similarity_cache) == 1
+    assert_ordered_equal(interface_supplied.data_output_ordered, Full_Cycle(data_input, 'numpy', is_Direct_Merging).data_output_ordered)
+    
+    # the source voltage is served from memory
+    monkeypatch.setattr(Wavefront_Generation, 'Full_Cycle', fail_simulation)
+    interface_scaled = Full_Cycle_Cached(engine = 'numpy', is_Direct_Merging = is_Direct_Merging, **dict(input_values, V_source = '20'))
+    monkeypatch.undo()
+    
+    interface_reference = Full_Cycle(engine = 'numpy', is_Direct_Merging = is_Direct_Merging, **dict(input_values, V_source = '20'))
+    assert_ordered_equal(interface_scaled.data_output_ordered, interface_reference.data_output_ordered, exact = False)
+    
+    with pytest.raises(TypeError):
+        Full_Cycle_Cached('numpy')
+
+def assert_rescaled_equal(ordered, ordered_reference):
+    """asserts a rescaled ordered data object holds the events of a direct simulation up to the extra rounding of rescaling"""
+    assert_ordered_equal(ordered, ordered_reference, exact = False, rtol = 1e-12)
+    
+    if (ordered_reference.Exact is not None):
+        for name, values_reference in ordered_reference.Exact.items():
+            for value, value_reference in zip(ordered.Exact[name], values_reference):
+                assert abs(value - value_reference) <= abs(value_reference)*Decimal('1e-24')
+
+#: Interface parameters of a similar pair of interfaces
+similar_input_values = (
+    dict(L_time = '3.6', C_time = '3.2', L_impedance = '300', Simulation_stop_time = '50', show_about = False),
+    dict(L_time = '7.2', C_time = '6.4', L_impedance = '600', C_impedance = '2', V_source = '5', Simulation_stop_time = '100', show_about = False)
+)
+
+@pytest.mark.parametrize('engine', ['decimal', 'numpy'])
+def test_rescale_matches_direct_simulation(engine):
+    input_values, input_values_similar = similar_input_values
+    interface = Full_Cycle(engine = engine, **input_values)
+
+    # rescaled values are rounded once more, they are approximate even with Decimal values
+    interface_rescaled = Rescale_Interface(interface, Data_Input_Storage(**input_values_similar))
+    assert_rescaled_equal(interface_rescaled.data_output_ordered, Full_Cycle(engine = engine, **input_values_similar).data_output_ordered)
+
+    interface_scaled = Scale_Interface(interface, '20')
+    assert_rescaled_equal(interface_scaled.data_output_ordered, Full_Cycle(engine = engine, **dict(input_values, V_source = '20')).data_output_ordered)
+
+    with pytest.raises(ValueError):
+        Rescale_Interface(interface, Data_Input_Storage(**dict(input_values, C_time = '3.3')))
+
+@pytest.mark.parametrize('engine', ['decimal', 'numpy'])
+def test_full_cycle_cached(tmp_path, monkeypatch, engine):
+    monkeypatch.setattr(Wavefront_Generation, 'similarity_cache', OrderedDict())
+    monkeypatch.setattr(Wavefront_Generation, 'persistent_cache_directory', str(tmp_path))
+    input_values, input_values_similar = similar_input_values
+
+    interface = Full_Cycle_Cached(engine = engine, **input_values)
+    assert_rescaled_equal(interface.data_output_ordered, Full_Cycle(engine = engine, **input_values).data_output_ordered)
+
+    # similar interfaces are served from memory, then from disk
+    monkeypatch.setattr(Wavefront_Generation, 'Full_Cycle', fail_simulation)
+    interface_similar = Full_Cycle_Cached(engine = engine, **input_values_similar)
+    assert len(Wavefront_Generation.similarity_cache) == 1
+
+    Wavefront_Generation.similarity_cache.clear()
+    interface_similar_loaded = Full_Cycle_Cached(engine = engine, **input_values_similar)
+    assert_ordered_equal(interface_similar_loaded.data_output_ordered, interface_similar.data_output_ordered)
+
+    monkeypatch.undo()
+    assert_rescaled_equal(interface_similar.data_output_ordered, Full_Cycle(engine = engine, **input_values_similar).data_output_ordered)
+
+def test_time_grid_matches_wavefront_times():
+    data_input = Data_Input_Storage(L_time = '3.6', C_time = '3.2', Simulation_stop_time = '40', show_about = False)
+    data_output_commutative = Full_Cycle(data_input).data_output_commutative
+
+    # the sending wavefronts of a node are launched at the time of the node
+    Time = get_time_fanout(data_input)
+    L_index, C_index = Time.get_grid_indexes()
+    for L, C in zip(L_index, C_index):
+        assert Time[L, C] == data_output_commutative.Time[L, C] == data_output_commutative.Wavefronts_Sending_Inductor[L, C].time_start
+
+    Time_Units = get_time_fanout(data_input, 'units')
+    assert Time_Units.data.dtype == np.int64
+    assert list(Time.data) == [units*data_input.GCD for units in Time_Units.data]
+    np.testing.assert_allclose(get_time_fanout(data_input, 'float').data, np.asarray(Time.data, dtype = np.float64), rtol = 1e-15)
+
+    Time_Merged = get_time_merged(data_input, (5, 3), 'units')
+    assert Time_Merged.shape == (5, 3)
+    np.testing.assert_array_equal(Time_Merged, Time_Units.to_dense()[0:5, 0:3])
+    with pytest.raises(ValueError):
+        get_time_array(data_input, L_index, C_index, 'seconds')
+
+@pytest.mark.parametrize('is_Higher_Merging', [True, False])
+@pytest.mark.parametrize('engine', ['exact', 'numpy'])
+def test_direct_merging_matches_decimal_reference(engine, is_Higher_Merging):
+    interface_reference = Full_Cycle(engine = 'decimal', **merging_input_values[is_Higher_Merging])
+    interface = Full_Cycle(engine = engine, is_Direct_Merging = True, **merging_input_values[is_Higher_Merging])
+
+    # merged values are summed in a different order, so they agree up to rounding
+    assert interface.data_output_commutative is None
+    assert interface.data_output_multiplicative.Voltage_Interconnect_Inductor.shape[1] <= interface.data_input.Capacitor_LCM_Factor
+    assert_ordered_equal(interface.data_output_ordered, interface_reference.data_output_ordered, exact = False)
+
+@pytest.mark.parametrize('engine', ['decimal', 'numpy'])
+def test_strided_merging_matches_merging_cycles(engine):
+    interface = Full_Cycle(engine = engine, **merging_input_values[True])
+    data_input = interface.data_input
+    fanout = interface.data_output_commutative.Current_Interconnect_Capacitor.to_dense()
+    fanout_reference = fanout.copy()
+
+    merged = multiplicative_merging_strided(fanout, data_input.Inductor_LCM_Factor, data_input.Capacitor_LCM_Factor, data_input.Number_of_Layers)
+    merged_reference = multiplicative_merging(fanout, data_input.Inductor_LCM_Factor, data_input.Capacitor_LCM_Factor, data_input.Number_of_Layers)
+
+    assert merged.dtype == fanout.dtype
+    np.testing.assert_array_equal(merged, merged_reference)
+    np.testing.assert_array_equal(fanout, fanout_reference)
+
+#: Fields of Data_Output_Storage objects
+data_output_fields = ['Time', 'Voltage_Interconnect_Inductor', 'Current_Interconnect_Inductor', 'Voltage_Interconnect_Capacitor', 'Current_Interconnect_Capacitor', 
+                      'Wavefronts_Sending_Inductor', 'Wavefronts_Sending_Capacitor', 'Wavefronts_Returning_Inductor', 'Wavefronts_Returning_Capacitor']
+
+@pytest.mark.parametrize('is_Higher_Merging', [True, False])
+@pytest.mark.parametrize('engine', ['decimal', 'numpy'])
+def test_higher_order_merging_does_not_alter_input(engine, is_Higher_Merging):
+    interface = Full_Cycle(engine = engine, **merging_input_values[is_Higher_Merging])
+    data_output_commutative = interface.data_output_commutative
+    fields = dict([(name, getattr(data_output_commutative, name)) for name in data_output_fields])
+    values = dict([(name, fields[name].data.copy()) for name in data_output_fields[1:5]])
+    magnitudes = dict([(name, [magnitude.copy() for magnitude in get_magnitudes(fields[name])]) for name in data_output_fields[5:]])
+
+    data_output_merged = Higher_Order_Merging(interface.data_input, data_output_commutative)
+
+    for name in data_output_fields:
+        assert getattr(data_output_commutative, name) is fields[name]
+        # fields are shared when no multiplicative merging occurs
+        assert (getattr(data_output_merged, name) is fields[name]) == (not is_Higher_Merging)
+    for name in data_output_fields[1:5]:
+        np.testing.assert_array_equal(fields[name].data, values[name])
+    for name in data_output_fields[5:]:
+        for magnitude, magnitude_reference in zip(get_magnitudes(fields[name]), magnitudes[name]):
+            np.testing.assert_array_equal(magnitude, magnitude_reference)
+
+@pytest.mark.parametrize('engine', ['decimal', 'numpy'])
+def test_fused_merging_matches_merging_per_field(engine):
+    interface = Full_Cycle(engine = engine, **merging_input_values[True])
+    data_input = interface.data_input
+    data_output_commutative = interface.data_output_commutative
+    if (engine == 'decimal'):
+        data_output_commutative = convert_to_wavefront_arrays(data_input, data_output_commutative)
+    fanouts = get_fanout_magnitude_arrays(data_output_commutative)[1:]
+
+    merged_fused = multiplicative_merging_fused(data_input, fanouts)
+    assert merged_fused.shape[0] == len(fanouts)
+
+    for merged, fanout in zip(merged_fused, fanouts):
+        merged_reference = multiplicative_merging_strided(fanout.to_dense(), data_input.Inductor_LCM_Factor, data_input.Capacitor_LCM_Factor, data_input.Number_of_Layers)
+        np.testing.assert_array_equal(merged, merged_reference[0:merged.shape[0]])
+
+def test_wavefront_array_materializes_wavefronts():
+    interface = Full_Cycle(**merging_input_values[True])
+    data_output_commutative = interface.data_output_commutative
+    data_output_arrays = convert_to_wavefront_arrays(interface.data_input, data_output_commutative)
+    L_index, C_index = data_output_commutative.Time.get_grid_indexes()
+
+    for name in data_output_fields[5:]:
+        wavefronts = getattr(data_output_commutative, name)
+        wavefront_array = getattr(data_output_arrays, name)
+        for L, C in zip(L_index, C_index):
+            wavefront, wavefront_reference = wavefront_array[L, C], wavefronts[L, C]
+            if not isinstance(wavefront_reference, Wavefront_Kintetic):
+                # returning wavefronts of the last layer are placeholders
+                continue
+            assert type(wavefront) is type(wavefront_reference)
+            for attribute in ['time_start', 'time_end', 'position_start', 'position_end', 'magnitude_voltage', 'magnitude_current']:
+                assert getattr(wavefront, attribute) == getattr(wavefront_reference, attribute)
+
+        # other indexes return Wavefront_Arrays, with the times of their nodes
+        wavefront_array_dense = Wavefront_Array(interface.data_input, wavefront_array.is_Inductor, wavefront_array.is_Sending, 
+                                                wavefront_array.magnitude_voltage.to_dense(), wavefront_array.magnitude_current.to_dense())
+        wavefront_row = wavefront_array_dense[2, :]
+        assert isinstance(wavefront_row, Wavefront_Array) and wavefront_row.shape == (wavefront_array.shape[1],)
+        np.testing.assert_allclose(wavefront_row.time_start[0:3], [float(wavefronts[2, C].time_start) for C in range(3)])
+
+@pytest.mark.parametrize('is_Higher_Merging', [True, False])
+def test_heap_ordering_matches_sort_ordering(is_Higher_Merging):
+    interface = Full_Cycle(engine = 'numpy', **merging_input_values[is_Higher_Merging])
+    data_input = interface.data_input
+    data_output_merged = Higher_Order_Merging(data_input, interface.data_output_commutative)
+    shape = data_output_merged.Voltage_Interconnect_Inductor.shape
+
+    for start_time_units in [0, 1, data_input.Capacitor_LCM_Factor*data_input.Inductor_LCM_Factor + 1]:
+        L_index, C_index = get_ordered_indexes(data_input, shape, start_time_units, 'heap')
+        L_index_reference, C_index_reference = get_ordered_indexes(data_input, shape, start_time_units, 'sort')
+        np.testing.assert_array_equal(L_index, L_index_reference)
+        np.testing.assert_array_equal(C_index, C_index_reference)
+
+    data_output_ordered = Order_Data_Output_Merged(data_input, data_output_merged, 'heap')
+    assert_ordered_equal(data_output_ordered, interface.data_output_ordered)
+    with pytest.raises(ValueError):
+        Order_Data_Output_Merged(data_input, data_output_merged, 'argmin')
+
+def test_closed_form_ordering_matches_dense_time_sort():
+    data_input = Data_Input_Storage(L_time = '3.6', C_time = '3.2', Simulation_stop_time = '60', show_about = False)
+    shape = (data_input.Number_of_Layers+1, data_input.Capacitor_LCM_Factor)
+    Time_Units = get_time_merged(data_input, shape, 'units')
+
+    L_index, C_index = get_nodes_between_times(data_input, shape, 40, 90)
+    L_index_reference, C_index_reference = np.nonzero(((Time_Units >= 40) & (Time_Units <= 90)).T)[::-1]
+    np.testing.assert_array_equal(L_index, L_index_reference)
+    np.testing.assert_array_equal(C_index, C_index_reference)
+
+    # the dense reference is ordered by time, then by L, up to the first node at or after the stop time
+    stop_time_units = int(data_input.Simulation_Stop_Time/data_input.GCD)
+    L_grid, C_grid = np.nonzero(np.ones(shape, dtype = bool))
+    order = np.lexsort((L_grid, Time_Units[L_grid, C_grid]))
+    number_events = np.count_nonzero(Time_Units < stop_time_units) + 1
+
+    L_index, C_index = get_ordered_indexes(data_input, shape)
+    np.testing.assert_array_equal(L_index, L_grid[order][0:number_events])
+    np.testing.assert_array_equal(C_index, C_grid[order][0:number_events])
+
+def test_ordered_exact_time_is_cached():
+    interface = Full_Cycle(**dict(merging_input_values[True], Simulation_stop_time = '100'))
+    data_output_ordered = interface.data_output_ordered
+
+    Time = data_output_ordered.Time
+    assert data_output_ordered.Time is Time
+    assert list(Time) == list(get_time_array(interface.data_input, data_output_ordered.Events['L'], data_output_ordered.Events['C'], 'decimal'))
+    np.testing.assert_array_equal(np.asarray(Time, dtype = np.float64), data_output_ordered.Events['Time'])
+
+    # the cached times are extended with the events
+    Extend_Interface(interface, '200')
+    interface_reference = Full_Cycle(**dict(merging_input_values[True], Simulation_stop_time = '200'))
+    assert list(data_output_ordered.Time) == list(interface_reference.data_output_ordered.Time)
+
+@pytest.mark.parametrize('engine', ['decimal', 'numpy'])
+def test_iter_events_matches_ordered_events(engine):
+    interface = Full_Cycle(engine = engine, **merging_input_values[True])
+    ordered = interface.data_output_ordered
+
+    times = np.asarray(ordered.Time, dtype = np.float64)
+
+    # the ordered events also include the first event after the stop time
+    events = list(iter_events(interface))
+    number_events = np.count_nonzero(times <= float(interface.data_input.Simulation_Stop_Time))
+    np.testing.assert_array_equal([event[5] for event in events], np.asarray(ordered.Indexes)[:number_events])
+    np.testing.assert_array_equal(np.asarray([event[0] for event in events], dtype = np.float64), times[:number_events])
+    np.testing.assert_array_equal(np.asarray([event[1] for event in events], dtype = np.float64), np.asarray(ordered.Voltage_Interconnect_Inductor, dtype = np.float64)[:number_events])
+
+    start_time, stop_time = 20, 40
+    events_window = list(iter_events(interface, str(start_time), str(stop_time)))
+    np.testing.assert_array_equal([event[5] for event in events_window], np.asarray(ordered.Indexes)[(times >= start_time) & (times <= stop_time)])
+
+@pytest.mark.parametrize('engine', ['decimal', 'numpy'])
+def test_values_at_matches_cumulative_sums(engine):
+    ordered = Full_Cycle(engine = engine, **merging_input_values[True]).data_output_ordered
+    times = ordered.Events['Time']
+
+    for name in interconnect_value_dtype.names:
+        np.testing.assert_array_equal(ordered.Cumulative[name], np.cumsum(ordered.Events[name]))
+
+    # events that occur at a time are included in the values at that time
+    values = ordered.values_at(np.concatenate(([-1], times, (times[:-1] + times[1:])/2)))
+    np.testing.assert_array_equal(values[0].tolist(), (0, 0, 0, 0))
+    np.testing.assert_array_equal(values[1:len(times)+1], ordered.Cumulative)
+    np.testing.assert_array_equal(values[len(times)+1:], ordered.Cumulative[:-1])
+
+    event_time = ordered.Time[10]
+    np.testing.assert_allclose(ordered.value_at(event_time)['Voltage_Interconnect_Inductor'], np.sum(np.asarray(ordered.Voltage_Interconnect_Inductor[:11], dtype = np.float64)))
+
+def closest_event_to_time_scan(data_ordered_time, time_enquirey, can_be_after_enquirey):
+    """the closest event to a time found by a linear scan of the events"""
+    if (time_enquirey <= data_ordered_time[0]):
+        return 0
+    for i, time in enumerate(data_ordered_time):
+        if (time >= time_enquirey):
+            return i if can_be_after_enquirey else i-1
+    return len(data_ordered_time) - 1
+
+@pytest.mark.parametrize('can_be_after_enquirey', [True, False])
+def test_closest_event_to_time_matches_linear_scan(can_be_after_enquirey):
+    ordered = Full_Cycle(**merging_input_values[True]).data_output_ordered
+    Time = list(ordered.Time)
+    time_enquireys = [Decimal('-1'), Time[0], Time[7], Time[7] + Decimal('0.05'), Time[-1], Time[-1] + 1]
+
+    for time_enquirey in time_enquireys:
+        index = closest_event_to_time_scan(Time, time_enquirey, can_be_after_enquirey)
+        assert closest_event_to_time(Time, time_enquirey, can_be_after_enquirey) == (index, Time[index])
+        assert closest_event_to_time(ordered.Events['Time'], time_enquirey, can_be_after_enquirey)[0] == index
+
+    indexes, times = closest_events_to_times(ordered.Events['Time'], np.asarray(time_enquireys, dtype = np.float64), can_be_after_enquirey)
+    np.testing.assert_array_equal(indexes, [closest_event_to_time_scan(Time, time_enquirey, can_be_after_enquirey) for time_enquirey in time_enquireys])
+    np.testing.assert_array_equal(times, ordered.Events['Time'][indexes])
+
+def get_line_field_superposition(interface, time, position, is_Inductor):
+    """the voltage and current of a line at a position, the sum of all wavefronts that have passed it"""
+    ordered = interface.data_output_ordered
+    if (is_Inductor):
+        length, line_time = float(interface.data_input.Inductor_Length), float(interface.data_input.Inductor_Time)
+        sending_wavefronts, returning_wavefronts = ordered.Wavefronts_Sending_Inductor, ordered.Wavefronts_Returning_Inductor
+    else:
+        length, line_time = float(interface.data_input.Capacitor_Length), float(interface.data_input.Capacitor_Time)
+        sending_wavefronts, returning_wavefronts = ordered.Wavefronts_Sending_Capacitor, ordered.Wavefronts_Returning_Capacitor
+
+    is_sending_passed = sending_wavefronts.time_start + position/length*line_time <= time
+    is_returning_passed = returning_wavefronts.time_start + (length - position)/length*line_time <= time
+    line_field = []
+    for sending_magnitudes, returning_magnitudes in [(sending_wavefronts.magnitude_voltage, returning_wavefronts.magnitude_voltage), 
+                                                     (sending_wavefronts.magnitude_current, returning_wavefronts.magnitude_current)]:
+        line_field.append(np.sum(np.asarray(sending_magnitudes, dtype = np.float64)[is_sending_passed]) + np.sum(np.asarray(returning_magnitudes, dtype = np.float64)[is_returning_passed]))
+    return line_field
+
+@pytest.mark.parametrize('is_Inductor', [True, False])
+@pytest.mark.parametrize('engine', ['decimal', 'numpy'])
+def test_spatial_values_match_wavefront_superposition(engine, is_Inductor):
+    interface = Full_Cycle(engine = engine, **merging_input_values[True])
+    time_enquiry = '31.3'
+
+    positions, voltage_left, voltage_right, current_left, current_right = get_spatial_voltage_current_at_time(time_enquiry, interface, is_Inductor)
+    positions = np.asarray(positions, dtype = np.float64)
+    np.testing.assert_array_equal(voltage_right[:-1], voltage_left[1:])
+
+    # the line is constant between separated intercepts
+    for position_index in np.nonzero(np.diff(positions) > 1e-9)[0]:
+        position = (positions[position_index] + positions[position_index+1])/2
+        voltage, current = get_line_field_superposition(interface, float(time_enquiry), position, is_Inductor)
+        np.testing.assert_allclose(float(voltage_right[position_index]), voltage, atol = 1e-12)
+        np.testing.assert_allclose(float(current_right[position_index]), current, atol = 1e-12)
+
+@pytest.mark.parametrize('is_Inductor', [True, False])
+def test_sample_line_field_matches_spatial_values(is_Inductor):
+    interface = Full_Cycle(engine = 'numpy', **merging_input_values[True])
+    time_enquiry = '31.3'
+
+    positions, voltage_left, voltage_right, current_left, current_right = get_spatial_voltage_current_at_time(time_enquiry, interface, is_Inductor)
+    positions = np.asarray(positions, dtype = np.float64)
+
+    # the line is constant between intercepts, intercepts that differ by Decimal rounding are not separated
+    is_separated = np.diff(positions) > 1e-9
+    positions_between = ((positions[:-1] + positions[1:])/2)[is_separated]
+    voltage, current = sample_line_field(interface, [float(time_enquiry)], positions_between, is_Inductor)
+
+    np.testing.assert_allclose(voltage[0], np.asarray(voltage_right[:-1], dtype = np.float64)[is_separated], atol = 1e-12)
+    np.testing.assert_allclose(current[0], np.asarray(current_right[:-1], dtype = np.float64)[is_separated], atol = 1e-12)
+
+    # every sample of the (time x position) grid is the superposition of the wavefronts that have passed it
+    times, positions_grid = np.array([0.5, 12.3, 47.9]), np.array([0.1, 0.45, 0.9])
+    voltage, current = sample_line_field(interface, times, positions_grid, is_Inductor)
+    assert voltage.shape == current.shape == (len(times), len(positions_grid))
+    for time_index, time in enumerate(times):
+        for position_index, position in enumerate(positions_grid):
+            np.testing.assert_allclose([voltage[time_index, position_index], current[time_index, position_index]], 
+                                       get_line_field_superposition(interface, time, position, is_Inductor), atol = 1e-12)
+
+def test_resample_interconnect_matches_step_waveform():
+    interface = Full_Cycle(engine = 'numpy', **merging_input_values[True])
+    ordered = interface.data_output_ordered
+    times = np.linspace(-1, float(interface.data_input.Simulation_Stop_Time) + 10, 1000)
+
+    samples = resample_interconnect(interface, times)
+    assert list(samples.keys()) == list(interconnect_value_dtype.names)
+
+    # each sample holds the changes of the events up to its time
+    for name in interconnect_value_dtype.names:
+        samples_reference = [np.sum(ordered.Events[name][ordered.Events['Time'] <= time]) for time in times]
+        np.testing.assert_allclose(samples[name], samples_reference, rtol = 1e-12, atol = 1e-12)
+
+@pytest.mark.parametrize('engine', ['decimal', 'numpy'])
+def test_load_reads_typed_columns_lazily(tmp_path, engine):
+    interface = Full_Cycle(engine = engine, **merging_input_values[True])
+    interface.save(str(tmp_path))
+    interface_loaded = Data_Interface_Storage.load(str(tmp_path))
+
+    # fields are only read when they are first used
+    data_output_commutative = interface_loaded.data_output_commutative
+    data_output_ordered = interface_loaded.data_output_ordered
+    assert 'Voltage_Interconnect_Inductor' not in vars(data_output_commutative) and 'Exact' not in vars(data_output_ordered)
+
+    fanout = data_output_commutative.Voltage_Interconnect_Inductor
+    assert data_output_commutative.Voltage_Interconnect_Inductor is fanout
+    assert list(fanout.data) == list(interface.data_output_commutative.Voltage_Interconnect_Inductor.data)
+    assert isinstance(data_output_ordered.Events, np.memmap)
+
+    # Decimal fields are stored as float64 values with their exact representation
+    column = np.load(os.path.join(str(tmp_path), 'data_output_commutative.Voltage_Interconnect_Inductor.data.npy'), mmap_mode = 'r')
+    if (engine == 'decimal'):
+        assert column.dtype.names == ('value', 'exact') and column.dtype['value'] == np.float64
+        np.testing.assert_array_equal(column['value'], np.asarray(fanout.data, dtype = np.float64))
+        assert list(data_output_ordered.Exact['Voltage_Interconnect_Inductor']) == list(interface.data_output_ordered.Exact['Voltage_Interconnect_Inductor'])
+    else:
+        assert column.dtype == np.float64 and data_output_ordered.Exact is None
+
+def test_full_cycle_persistent(tmp_path, monkeypatch):
+    monkeypatch.setattr(Wavefront_Generation, 'persistent_cache_directory', str(tmp_path))
+    input_values = merging_input_values[True]
+
+    interface = Full_Cycle_Persistent(engine = 'exact', **input_values)
+    assert len(os.listdir(tmp_path)) == 1
+
+    # stored simulations are loaded
+    monkeypatch.setattr(Wavefront_Generation, 'Full_Cycle', fail_simulation)
+    assert_ordered_equal(Full_Cycle_Persistent(engine = 'exact', **dict(input_values, L_time = '7.0')).data_output_ordered, interface.data_output_ordered)
+    monkeypatch.undo()
+    monkeypatch.setattr(Wavefront_Generation, 'persistent_cache_directory', str(tmp_path))
+
+    # the least recently used simulations are evicted, the stored simulation is kept
+    monkeypatch.setattr(Wavefront_Generation, 'persistent_cache_size', 0)
+    Full_Cycle_Persistent(engine = 'exact', **merging_input_values[False])
+    assert os.listdir(tmp_path) == [get_persistent_cache_key('exact', False, **merging_input_values[False])]
+
+def test_full_cycle_persistent_simulates_supplied_input_data(tmp_path, monkeypatch):
+    monkeypatch.setattr(Wavefront_Generation, 'persistent_cache_directory', str(tmp_path))
+    input_values = merging_input_values[True]
+    interface_stored = Full_Cycle_Persistent(engine = 'exact', **input_values)
+
+    # a customised event solver is not part of the input values
+    data_input = Data_Input_Storage(**input_values)
+    def open_circuit_termination(Arriving_Voltage, Arriving_Current):
+        return Arriving_Voltage, -Arriving_Current
+    setattr(data_input, 'Termination_Event_Solver_Inductor', open_circuit_termination)
+
+    interface = Full_Cycle_Persistent(data_input, 'exact')
+    assert interface.data_input is data_input
+    assert os.listdir(tmp_path) == [get_persistent_cache_key('exact', False, **input_values)]
+    assert_ordered_equal(interface.data_output_ordered, Full_Cycle(data_input, 'exact').data_output_ordered)
+    assert not np.array_equal(interface.data_output_ordered.Events['Voltage_Interconnect_Inductor'], interface_stored.data_output_ordered.Events['Voltage_Interconnect_Inductor'])
+
+    with pytest.raises(TypeError):
+        Full_Cycle_Persistent(input_values, 'exact')
+
+def test_persistent_cache_temporary_directories(tmp_path, monkeypatch):
+    monkeypatch.setattr(Wavefront_Generation, 'persistent_cache_directory', str(tmp_path))
+    interface = Full_Cycle(**merging_input_values[False])
+
+    def fail_save(self, directory):
+        with open(os.path.join(directory, 'partial.npy'), 'wb') as partial_file:
+            partial_file.write(b'partial')
+        raise KeyboardInterrupt
+
+    # unfinished writes are removed, also when interrupted
+    monkeypatch.setattr(Data_Interface_Storage, 'save', fail_save)
+    with pytest.raises(KeyboardInterrupt):
+        store_persistent_cache('interrupted', interface)
+    assert os.listdir(tmp_path) == []
+
+    # abandoned writes of other processes are removed once expired
+    for name in ['.abandoned', '.in_progress']:
+        os.mkdir(os.path.join(tmp_path, name))
+    expired_time = time.time() - 2*Wavefront_Generation.persistent_cache_temporary_lifetime
+    os.utime(os.path.join(tmp_path, '.abandoned'), (expired_time, expired_time))
+
+    evict_persistent_cache()
+    assert os.listdir(tmp_path) == ['.in_progress']